@@ -1,30 +1,12 @@
-from appium import webdriver
-from appium.options.android import UiAutomator2Options
-from appium.webdriver.common.appiumby import AppiumBy
 import time
 import allure
 import pytest
 from allure_commons.types import AttachmentType
-from selenium.common.exceptions import NoSuchElementException
+from inshorts_pom.probes import click_if_present, find_present, wait_for_element
+from inshorts_pom.screen_snapshot import ScreenSnapshot
+from inshorts_pom.screens import HomeScreen, Launcher, NavBar, SearchScreen, StoryScreen, tab
 
-@pytest.fixture(scope="session")
-def driver():
-    caps = {
-        "platformName": "Android",
-        "appium:automationName": "UiAutomator2",
-        "appium:deviceName": "Android Emulator",
-        "appium:platformVersion": "16",
-        "appium:udid": "emulator-5554",
-        "appium:appPackage": "com.nis.app",
-        "appium:appActivity": "com.nis.app.ui.activities.HomeActivity",
-        "appium:noReset": True,
-        "appium:newCommandTimeout": 300
-    }
-    options = UiAutomator2Options().load_capabilities(caps)
-    driver = webdriver.Remote("http://127.0.0.1:4723", options=options)
-    driver.implicitly_wait(10)
-    yield driver
-    driver.quit()
+# driver: reused Appium session from the shared pool (see conftest.py)
 
 def attach_screenshot(driver, name):
     try:
@@ -40,70 +22,66 @@ def test_inshorts_flow(driver):
     try:
         with allure.step("Launch app and click Predicted app: inshorts"):
             attach_screenshot(driver, "predicted_app_screen")
-            predicted_app_element = driver.find_element(AppiumBy.ACCESSIBILITY_ID, "Predicted app: inshorts")
+            predicted_app_element = driver.find_element(*Launcher.PREDICTED_APP)
             predicted_app_element.click()
-            time.sleep(3)
+            home_root = wait_for_element(driver, *HomeScreen.ACTION_BAR_ROOT, "home page")
             attach_screenshot(driver, "after_predicted_app_click")
         
         with allure.step("Verify home page loaded"):
-            home_root = driver.find_element(AppiumBy.ID, "com.nis.app:id/action_bar_root")
             assert home_root.is_displayed()
             allure.attach(f"Home page loaded. Root element visible: {home_root.is_displayed()}", "home_verification", AttachmentType.TEXT)
         
         with allure.step("Verify news content and click news title"):
-            news_title = driver.find_element(AppiumBy.ID, "com.nis.app:id/news_title")
-            news_text = driver.find_element(AppiumBy.ID, "com.nis.app:id/news_text")
-            allure.attach(f"News Title: {news_title.text}", "news_title", AttachmentType.TEXT)
-            allure.attach(f"News Text: {news_text.text}", "news_text", AttachmentType.TEXT)
-            news_title.click()
+            home = ScreenSnapshot.capture(driver)
+            allure.attach(f"News Title: {home.text(HomeScreen.NEWS_TITLE)}", "news_title", AttachmentType.TEXT)
+            allure.attach(f"News Text: {home.text(HomeScreen.NEWS_TEXT)}", "news_text", AttachmentType.TEXT)
+            home.tap(driver, HomeScreen.NEWS_TITLE)
             time.sleep(2)
             attach_screenshot(driver, "after_news_click")
         
         with allure.step("Verify story number or handle absence"):
-            try:
-                story_number = driver.find_element(AppiumBy.ID, "story_number_1")
+            story_number = find_present(driver, *StoryScreen.STORY_NUMBER)
+            if story_number is not None:
                 allure.attach(f"Story number: {story_number.text}", "story_number", AttachmentType.TEXT)
-            except NoSuchElementException:
+            else:
                 allure.attach("story_number_1 not visible", "story_number_missing", AttachmentType.TEXT)
         
         with allure.step("Navigate back from story view"):
-            try:
-                toolbar_back = driver.find_element(AppiumBy.ID, "com.nis.app:id/toolbar_back")
-                toolbar_back.click()
+            if click_if_present(driver, *StoryScreen.TOOLBAR_BACK):
                 time.sleep(2)
                 allure.attach("Clicked toolbar back successfully", "back_navigation", AttachmentType.TEXT)
-            except NoSuchElementException:
+            else:
                 allure.attach("Toolbar back not found, continuing...", "back_skip", AttachmentType.TEXT)
         
         with allure.step("Test all bottom navigation tabs"):
-            tabs = ["Finance", "Timelines", "Videos", "Insights", "Good News"]
+            tabs = HomeScreen.TAB_NAMES
             for tab_text in tabs:
                 safe_click_tab_with_allure(driver, tab_text)
                 if safe_click_tab_with_allure(driver, tab_text):
                     attach_screenshot(driver, f"{tab_text}_tab")
         
         with allure.step("Test search functionality"):
-            search_icon = driver.find_elements(AppiumBy.ID, "com.nis.app:id/navigation_bar_item_icon_view")[0]
+            search_icon = driver.find_elements(*NavBar.ITEM_ICON)[0]
             search_icon.click()
-            time.sleep(2)
-            search_suggestion = driver.find_element(AppiumBy.ID, "com.nis.app:id/txt_search_suggestion")
-            assert search_suggestion.text == "Search for news"
+            wait_for_element(driver, *SearchScreen.SUGGESTION, "search page")
+            search = ScreenSnapshot.capture(driver)
+            assert search.text(SearchScreen.SUGGESTION) == "Search for news"
             allure.attach("Search suggestion verified: Search for news", "search_verification", AttachmentType.TEXT)
         
         with allure.step("Test Notifications section"):
-            notif_title = driver.find_element(AppiumBy.ID, "com.nis.app:id/notif_title")
-            view_all_notifications = driver.find_element(AppiumBy.ID, "com.nis.app:id/notif_view_all")
-            allure.attach(f"Notif Title: {notif_title.text}", "notifications_title", AttachmentType.TEXT)
-            allure.attach(f"View All: {view_all_notifications.text}", "view_all_notifications", AttachmentType.TEXT)
-            view_all_notifications.click()
+            labels = search.texts(SearchScreen.NOTIF_TITLE, SearchScreen.NOTIF_VIEW_ALL)
+            allure.attach(f"Notif Title: {labels[SearchScreen.NOTIF_TITLE]}", "notifications_title", AttachmentType.TEXT)
+            allure.attach(f"View All: {labels[SearchScreen.NOTIF_VIEW_ALL]}", "view_all_notifications", AttachmentType.TEXT)
+            search.tap(driver, SearchScreen.NOTIF_VIEW_ALL)
             click_back_button_with_allure(driver)
         
         with allure.step("Test Insights section"):
-            insights_title = driver.find_element(AppiumBy.ID, "com.nis.app:id/insights_title")
-            view_all_insights = driver.find_element(AppiumBy.ID, "com.nis.app:id/insights_view_all")
-            allure.attach(f"Insights Title: {insights_title.text}", "insights_title", AttachmentType.TEXT)
-            allure.attach(f"View All Insights: {view_all_insights.text}", "view_all_insights", AttachmentType.TEXT)
-            view_all_insights.click()
+            wait_for_element(driver, *SearchScreen.INSIGHTS_TITLE, "search page")
+            search = ScreenSnapshot.capture(driver)
+            labels = search.texts(SearchScreen.INSIGHTS_TITLE, SearchScreen.INSIGHTS_VIEW_ALL)
+            allure.attach(f"Insights Title: {labels[SearchScreen.INSIGHTS_TITLE]}", "insights_title", AttachmentType.TEXT)
+            allure.attach(f"View All Insights: {labels[SearchScreen.INSIGHTS_VIEW_ALL]}", "view_all_insights", AttachmentType.TEXT)
+            search.tap(driver, SearchScreen.INSIGHTS_VIEW_ALL)
             click_back_button_with_allure(driver)
         
         with allure.step("Perform long press gesture test"):
@@ -118,22 +96,15 @@ def test_inshorts_flow(driver):
         raise
 
 def safe_click_tab_with_allure(driver, tab_text):
-    try:
-        tab = driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().text("{tab_text}")')
-        tab.click()
+    if click_if_present(driver, *tab(tab_text)):
         time.sleep(1)
         return True
-    except:
-        allure.attach(f"{tab_text} tab not found", f"{tab_text}_tab_error", AttachmentType.TEXT)
-        return False
+    allure.attach(f"{tab_text} tab not found", f"{tab_text}_tab_error", AttachmentType.TEXT)
+    return False
 
 def click_back_button_with_allure(driver):
-    try:
-        back_button = driver.find_element(AppiumBy.ACCESSIBILITY_ID, "Back")
-        back_button.click()
+    if click_if_present(driver, *NavBar.BACK):
         time.sleep(2)
-    except:
-        pass
 
 def long_press_at_coordinates_with_allure(driver, x=100, y=100, duration_ms=1000):
     try:
@@ -0,0 +1,51 @@
+# conftest.py
+import os
+import pytest
+
+
+@pytest.fixture(scope="session")
+def appium_device():
+    """The device this process (one pytest-xdist worker, or the whole run) has leased."""
+    from inshorts_pom.devices import DeviceAllocator
+    allocator = DeviceAllocator()
+    device = allocator.acquire(os.environ.get("PYTEST_XDIST_WORKER"))
+    yield device
+    allocator.release(device)
+
+
+@pytest.fixture(scope="session")
+def appium_pool(appium_device):
+    from inshorts_pom.session_pool import AppiumSessionPool
+    pool = AppiumSessionPool([appium_device.udid])
+    yield pool
+    pool.report()
+    pool.close()
+
+
+@pytest.fixture
+def driver(appium_pool):
+    """A reused Appium session with the app reset between tests."""
+    with appium_pool.lease() as session:
+        yield session
+
+
+def pytest_sessionfinish(session):
+    # On a pytest-xdist worker: hand this process's probe totals to the controller
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        from inshorts_pom.probes import PROBE_STATS
+        workeroutput["probe_stats"] = PROBE_STATS.to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    stats = getattr(node, "workeroutput", {}).get("probe_stats")
+    if stats:
+        from inshorts_pom.probes import PROBE_STATS
+        PROBE_STATS.merge(stats)
+
+
+def pytest_terminal_summary(terminalreporter):
+    from inshorts_pom.probes import PROBE_STATS
+    if PROBE_STATS.probes:
+        terminalreporter.write_line(PROBE_STATS.summary())
@@ -0,0 +1,81 @@
+"""Compare the lean Mailsac browser against full Chrome: page-ready time and memory.
+
+Run from hp_smart_pom:  python -m benchmarks.browser_bench [--url https://mailsac.com] [--loads 10]
+Without --url the local fake Mailsac is used. RSS is summed over chromedriver and every Chrome
+process under it (Linux /proc).
+"""
+import argparse
+import os
+import statistics
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from page_objects.mailsac_page import MailsacPage
+from utils.browser import create_chrome_driver
+from utils.fake_mailsac import FakeMailsac
+
+
+def _children(pid):
+    children = []
+    task_dir = f"/proc/{pid}/task"
+    for tid in os.listdir(task_dir) if os.path.isdir(task_dir) else ():
+        try:
+            with open(f"{task_dir}/{tid}/children") as f:
+                children.extend(int(c) for c in f.read().split())
+        except OSError:
+            pass
+    return children
+
+
+def tree_rss_mb(pid):
+    """Resident memory of pid and all of its descendants, in MB."""
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                total += next((int(line.split()[1]) for line in f if line.startswith("VmRSS:")), 0)
+        except OSError:
+            continue
+        stack.extend(_children(current))
+    return total / 1024
+
+
+def measure(lean, url, loads):
+    start = time.perf_counter()
+    driver = create_chrome_driver(headless=True, extra_args=[], lean=lean)
+    startup = time.perf_counter() - start
+    try:
+        ready = []
+        for _ in range(loads):
+            driver.get("about:blank")
+            start = time.perf_counter()
+            driver.get(url)
+            WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.XPATH, MailsacPage.MAILBOX_PLACEHOLDER_XPATH)))
+            ready.append(time.perf_counter() - start)
+        rss = tree_rss_mb(driver.service.process.pid)
+    finally:
+        driver.quit()
+    return startup, statistics.median(ready), max(ready), rss
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", help="page to load (default: a local fake Mailsac)")
+    parser.add_argument("--loads", type=int, default=10)
+    args = parser.parse_args()
+    fake = None if args.url else FakeMailsac().start()
+    url = args.url or fake.url
+    try:
+        for name, lean in (("full Chrome", False), ("lean browser", True)):
+            startup, median, worst, rss = measure(lean, url, args.loads)
+            print(f"{name:>13}: startup {startup:.2f}s, page ready median {median * 1000:.0f} ms "
+                  f"(max {worst * 1000:.0f} ms), RSS {rss:.0f} MB")
+    finally:
+        if fake is not None:
+            fake.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark IdentityGenerator throughput and check for collisions.
+
+Run from hp_smart_pom:  python -m benchmarks.identity_bench [--count 2000000] [--threads 4] [--workers 2]
+--workers simulates separate processes (distinct worker ids, same millisecond) in this process.
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.identity import IdentityGenerator
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=2_000_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--batch", type=int, default=4096)
+    args = parser.parse_args()
+
+    generators = [IdentityGenerator(worker_id=w, ledger_path=None) for w in range(args.workers)]
+    per_thread = args.count // args.threads
+
+    def produce(index):
+        generator = generators[index % len(generators)]
+        out = []
+        while len(out) < per_thread:
+            out.extend(generator.batch(min(args.batch, per_thread - len(out))))
+        return out
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        results = list(executor.map(produce, range(args.threads)))
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(r) for r in results)
+    unique = len({m for r in results for m in r})
+    print(f"generated: {total} in {elapsed:.2f}s ({total / elapsed / 1e6:.2f}M identities/s)")
+    print(f"collisions: {total - unique}")
+    print(f"sample: {results[0][0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Import-time benchmark (python -X importtime) with per-module budgets.
+
+Run from hp_smart_pom:  python -m benchmarks.import_bench [--repeat 5] [--top 10]
+
+Each entry point is imported in a fresh interpreter, as a worker process would. The suite
+enforces the same budgets (tests/import_budget_test.py).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies that only the code paths driving a browser, the desktop or HTTP may load
+HEAVY_MODULES = ("selenium", "pywinauto", "comtypes", "pyperclip", "urllib3", "sqlite3")
+
+# module -> (cumulative import budget in ms, heavy modules it is allowed to load)
+IMPORT_BUDGETS = {
+    "main_test": (45, ()),
+    "parallel_runner": (75, ()),
+    "utils.flow": (30, ()),
+    "utils.identity": (15, ()),
+    "page_objects.mailsac_api": (150, ("urllib3",)),
+}
+
+
+def import_times(module, python=sys.executable):
+    """{name: (self_us, cumulative_us)} for every module a fresh `import module` loads."""
+    proc = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def best_import_ms(module, repeat=3):
+    """Fastest of repeat cold imports, in ms; the minimum filters out scheduler noise."""
+    return min(import_times(module)[module][1] for _ in range(repeat)) / 1000
+
+
+def loaded_heavy_modules(module, python=sys.executable):
+    code = f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run([python, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    loaded = json.loads(proc.stdout.splitlines()[-1])
+    return sorted({name.split(".")[0] for name in loaded} & set(HEAVY_MODULES))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="show the slowest modules by self time")
+    args = parser.parse_args()
+    over = 0
+    for module, (budget, allowed) in IMPORT_BUDGETS.items():
+        ms = best_import_ms(module, args.repeat)
+        heavy = [m for m in loaded_heavy_modules(module) if m not in allowed]
+        ok = ms <= budget and not heavy
+        over += not ok
+        print(f"{module:<28}{ms:8.1f} ms  (budget {budget} ms){'' if ok else '  OVER'}"
+              + (f"  loads {', '.join(heavy)}" if heavy else ""))
+        if args.top:
+            slowest = sorted(import_times(module).items(), key=lambda item: -item[1][0])[:args.top]
+            for name, (self_us, _) in slowest:
+                print(f"    {self_us / 1000:7.2f} ms  {name}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
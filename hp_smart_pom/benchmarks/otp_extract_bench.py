@@ -0,0 +1,44 @@
+"""Benchmark OTP extraction speed and accuracy on the test corpus.
+
+Run from hp_smart_pom:  python -m benchmarks.otp_extract_bench [--repeat 2000]
+"""
+import argparse
+import json
+import os
+import re
+import time
+from utils.otp_extractor import extract_otp
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "..", "tests", "data", "otp_corpus.json")
+NAIVE_RE = re.compile(r"\b(\d{4,8})\b")
+
+
+def naive(raw, sender=None):
+    match = NAIVE_RE.search(raw)
+    return match.group(1) if match else None
+
+
+def run(extract, corpus, repeat):
+    correct = sum(extract(case["raw"], case["sender"]) == case["expected"] for case in corpus)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for case in corpus:
+            extract(case["raw"], case["sender"])
+    per_message = (time.perf_counter() - start) / (repeat * len(corpus))
+    return correct, per_message
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--corpus", default=CORPUS_PATH)
+    args = parser.parse_args()
+    with open(args.corpus, encoding="utf-8") as f:
+        corpus = json.load(f)
+    for name, extract in (("first-number regex", naive), ("otp_extractor", extract_otp)):
+        correct, per_message = run(extract, corpus, args.repeat)
+        print(f"{name:>20}: {correct}/{len(corpus)} correct, {per_message * 1e6:.1f} us/message")
+
+
+if __name__ == "__main__":
+    main()
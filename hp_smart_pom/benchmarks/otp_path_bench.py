@@ -0,0 +1,58 @@
+"""Benchmark OTP retrieval throughput against the local fake Mailsac (no network).
+
+Run from hp_smart_pom:  python -m benchmarks.otp_path_bench [--mailboxes 200] [--workers 16] [--delivery 0.2]
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from page_objects.mailsac_api import MailsacApi, MailsacHttpBackend
+from utils.fake_mailsac import FakeMailsac
+from utils.otp_broker import OtpBroker
+from utils.poller import Poller
+import config
+
+
+def per_flow(mailsac, mailboxes, workers, delivery):
+    """One MailsacApi per flow, each polling its own inbox."""
+    backend = MailsacHttpBackend(base_url=mailsac.api_url, pool_size=workers)
+    expected = {m: mailsac.deliver_otp(m, delay=delivery) for m in mailboxes}
+
+    def fetch(mailbox):
+        api = MailsacApi(backend=backend)
+        api.poller = Poller(initial_interval=0.05, max_interval=0.5, max_wait=config.OTP_MAX_WAIT)
+        return api.fetch_otp(mailbox)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        got = dict(zip(mailboxes, executor.map(fetch, mailboxes)))
+    backend.close()
+    return sum(got[m] == expected[m] for m in mailboxes)
+
+
+def brokered(mailsac, mailboxes, workers, delivery):
+    """All flows share one OtpBroker polling inboxes in batches."""
+    backend = MailsacHttpBackend(base_url=mailsac.api_url, pool_size=workers)
+    with OtpBroker(backend=backend, min_interval=0.05) as broker:
+        futures = {m: broker.watch(f"{m}@{mailsac.domain}") for m in mailboxes}
+        expected = {m: mailsac.deliver_otp(m, delay=delivery) for m in mailboxes}
+        return sum(futures[m].result() == expected[m] for m in mailboxes)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mailboxes", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--delivery", type=float, default=0.2, help="seconds before each mail is visible")
+    args = parser.parse_args()
+    for name, strategy in (("per-flow MailsacApi", per_flow), ("shared OtpBroker", brokered)):
+        with FakeMailsac(seed=0) as mailsac:
+            mailboxes = [f"{name.split()[0]}{i:05d}" for i in range(args.mailboxes)]
+            start = time.perf_counter()
+            correct = strategy(mailsac, mailboxes, args.workers, args.delivery)
+            elapsed = time.perf_counter() - start
+            requests = sum(mailsac.requests.values())
+        print(f"{name:>20}: {correct}/{args.mailboxes} OTPs in {elapsed:.2f}s "
+              f"({args.mailboxes / elapsed:.0f}/s, {requests} HTTP requests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Per-stage latency benchmark for the signup flow, with history and baseline regression checks.
+
+Run from hp_smart_pom:
+  python -m benchmarks.signup_bench --runs 20            # stub desktop + local fake Mailsac (any OS)
+  python -m benchmarks.signup_bench --runs 5 --real      # real HP Smart and Mailsac (Windows)
+  python -m benchmarks.signup_bench --save-baseline      # make this run the new baseline
+
+Every invocation appends its per-stage distributions to the history file (JSON Lines, in
+config.OUTPUT_DIR by default) and exits non-zero if a stage's median regressed past the
+threshold against the baseline.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from flows.signup import SIGNUP
+from page_objects.mailsac_api import MailsacApi, MailsacHttpBackend
+from parallel_runner import percentile
+from utils.fake_mailsac import FakeMailsac
+from utils.logger import run_context
+from benchmarks.stubs import StubHpAccountPage, StubHpSmartApp, StubTimings
+import config
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# History is a run artefact (git-ignored output dir); the baseline is tracked next to this file
+DEFAULT_HISTORY = os.path.join(config.OUTPUT_DIR, "signup_history.jsonl")
+DEFAULT_BASELINE = os.path.join(HERE, "signup_baseline.json")
+TOTAL = "Total"
+
+
+def stage_durations(run):
+    """{stage: seconds} for the top-level steps of one run, plus the flow total."""
+    stages = {e.desc: e.duration for e in run.events if e.depth == 0 and e.duration is not None}
+    stages[TOTAL] = sum(stages.values())
+    return stages
+
+
+def distribution(values):
+    ordered = sorted(values)
+    return {
+        "n": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def summarize(samples):
+    """Per-stage distributions over a list of stage_durations() dicts."""
+    stages = {}
+    for sample in samples:
+        for stage, seconds in sample.items():
+            stages.setdefault(stage, []).append(seconds)
+    return {stage: distribution(values) for stage, values in stages.items()}
+
+
+def compare(current, baseline, threshold=0.25, min_delta=0.05):
+    """Stages whose median grew by more than threshold (relative) and min_delta seconds."""
+    regressions = []
+    for stage, base in baseline.items():
+        now = current.get(stage)
+        if now is None:
+            continue
+        delta = now["p50"] - base["p50"]
+        if delta > min_delta and now["p50"] > base["p50"] * (1 + threshold):
+            regressions.append({"stage": stage, "baseline_p50": base["p50"], "p50": now["p50"],
+                                "ratio": now["p50"] / base["p50"] if base["p50"] else float("inf")})
+    return regressions
+
+
+def run_stubbed(runs, time_scale, seed=None):
+    """Run the flow with stub desktop page objects and the OTP read over HTTP from a fake Mailsac."""
+    timings = StubTimings(time_scale=time_scale, seed=seed)
+    samples, failures = [], 0
+    with FakeMailsac(seed=seed) as mailsac:
+        provider = MailsacApi(backend=MailsacHttpBackend(base_url=mailsac.api_url))
+        for i in range(runs):
+            ctx = {
+                "hp_app": StubHpSmartApp(timings),
+                "hp_account": StubHpAccountPage(timings, mailsac),
+                "otp_provider": provider,
+                "popup_handler": lambda: None,
+            }
+            with run_context(f"bench-{i:04d}") as run:
+                ok = SIGNUP.run(ctx).ok
+            failures += not ok
+            samples.append(stage_durations(run))
+        provider.quit()
+    return samples, failures
+
+
+def run_real(runs):
+    samples, failures = [], 0
+    for i in range(runs):
+        with run_context(f"bench-{i:04d}") as run:
+            ok = SIGNUP.run().ok
+        failures += not ok
+        samples.append(stage_durations(run))
+    return samples, failures
+
+
+def print_table(stages, regressions):
+    flagged = {r["stage"] for r in regressions}
+    print(f"{'stage':<24}{'n':>4}{'p50':>9}{'p95':>9}{'mean':>9}{'max':>9}")
+    for stage, d in stages.items():
+        mark = "  REGRESSED" if stage in flagged else ""
+        print(f"{stage:<24}{d['n']:>4}{d['p50']:>9.3f}{d['p95']:>9.3f}{d['mean']:>9.3f}{d['max']:>9.3f}{mark}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage latency benchmark for the signup flow.")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--real", action="store_true", help="drive the real desktop and Mailsac (Windows)")
+    parser.add_argument("--time-scale", type=float, default=0.05, help="stub latency multiplier")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--history", default=DEFAULT_HISTORY)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative growth of a stage median")
+    parser.add_argument("--verbose", action="store_true", help="keep the per-step console log")
+    args = parser.parse_args()
+
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    with quiet:
+        samples, failures = run_real(args.runs) if args.real else run_stubbed(args.runs, args.time_scale, args.seed)
+    stages = summarize(samples)
+    mode = "real" if args.real else f"stub x{args.time_scale}"
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = compare(stages, baseline["stages"], args.threshold) if baseline and baseline["mode"] == mode else []
+
+    entry = {"timestamp": time.time(), "host": platform.node(), "mode": mode, "runs": args.runs,
+             "failures": failures, "stages": stages, "regressions": regressions}
+    os.makedirs(os.path.dirname(args.history) or ".", exist_ok=True)
+    with open(args.history, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"mode": mode, "runs": args.runs, "stages": stages}, f, indent=2)
+
+    print(f"{args.runs} runs ({mode}), {failures} failed")
+    print_table(stages, regressions)
+    if baseline and baseline["mode"] != mode:
+        print(f"Baseline was recorded in mode {baseline['mode']!r}; not compared.")
+    for r in regressions:
+        print(f"Regression: {r['stage']} p50 {r['baseline_p50']:.3f}s -> {r['p50']:.3f}s ({r['ratio']:.2f}x)")
+    return 1 if regressions or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
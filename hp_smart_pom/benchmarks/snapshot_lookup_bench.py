@@ -0,0 +1,68 @@
+"""Benchmark UiaSnapshot index build and lookups against a linear scan.
+
+Run from hp_smart_pom:  python -m benchmarks.snapshot_lookup_bench [recorded_tree.json]
+Without a recording a synthetic tree of --nodes elements with the signup form at the end is used.
+"""
+import argparse
+import random
+import time
+from utils.uia_snapshot import COLUMNS, UiaSnapshot
+
+SIGNUP_FORM = (dict(auto_id="firstName", control_type="Edit"), dict(auto_id="lastName", control_type="Edit"),
+               dict(auto_id="email", control_type="Edit"), dict(auto_id="password", control_type="Edit"),
+               dict(auto_id="sign-up-submit", control_type="Button"))
+
+
+def synthetic_tree(nodes):
+    rng = random.Random(0)
+    columns = {name: [] for name in COLUMNS}
+    for i in range(nodes):
+        columns["auto_id"].append(f"node-{i}" if rng.random() < 0.3 else "")
+        columns["title"].append(f"Label {rng.randrange(nodes // 4 or 1)}")
+        columns["control_type"].append(rng.choice(("Text", "Group", "Hyperlink", "Image", "Pane")))
+        columns["class_name"].append("")
+        columns["parent"].append(rng.randrange(i) if i else -1)
+    for locator in SIGNUP_FORM:
+        for name in COLUMNS:
+            columns[name].append(locator.get(name, "") if name != "parent" else 0)
+    return {"columns": columns}
+
+
+def linear_find(rows, locator):
+    return next(i for i, row in enumerate(rows) if all(row[k] == v for k, v in locator.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("recording", nargs="?")
+    parser.add_argument("--nodes", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    data = UiaSnapshot.load(args.recording).to_dict() if args.recording else synthetic_tree(args.nodes)
+    start = time.perf_counter()
+    snapshot = UiaSnapshot.from_dict(data)
+    build = time.perf_counter() - start
+    locators = [l for l in SIGNUP_FORM if snapshot.find_all(**l)] or [dict(control_type="Text")]
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for locator in locators:
+            snapshot.find(**locator)
+    indexed = (time.perf_counter() - start) / (args.repeat * len(locators))
+
+    rows = [snapshot.node(i) for i in range(len(snapshot))]
+    start = time.perf_counter()
+    for _ in range(max(1, args.repeat // 20)):
+        for locator in locators:
+            linear_find(rows, locator)
+    linear = (time.perf_counter() - start) / (max(1, args.repeat // 20) * len(locators))
+
+    print(f"nodes: {len(snapshot)}")
+    print(f"index build: {build * 1e3:.2f} ms")
+    print(f"indexed lookup: {indexed * 1e6:.2f} us")
+    print(f"linear scan lookup: {linear * 1e6:.2f} us ({linear / indexed:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Stand-ins for the Windows-only page objects, so the signup flow can be timed on Linux.
+
+Each action sleeps for a recorded stage latency (with jitter) instead of driving the desktop.
+Submitting the form has the fake Mailsac deliver the OTP mail, like the real HP backend would.
+"""
+import random
+import time
+
+# Seconds per stage on a real run; scale them down with time_scale for quick runs
+RECORDED_LATENCIES = {
+    "launch": 4.0,
+    "open_create_account": 2.5,
+    "fill_form": 6.0,
+    "otp_delivery": 8.0,
+    "enter_otp": 3.0,
+}
+
+
+class StubTimings:
+    def __init__(self, latencies=None, time_scale=1.0, jitter=0.2, seed=None):
+        self.latencies = dict(RECORDED_LATENCIES, **(latencies or {}))
+        self.time_scale = time_scale
+        self.jitter = jitter
+        self._random = random.Random(seed)
+
+    def seconds(self, stage):
+        base = self.latencies[stage] * self.time_scale
+        return max(0.0, base * (1 + self._random.uniform(-self.jitter, self.jitter)))
+
+    def sleep(self, stage):
+        time.sleep(self.seconds(stage))
+
+
+class StubHpSmartApp:
+    def __init__(self, timings):
+        self.timings = timings
+
+    def launch(self):
+        self.timings.sleep("launch")
+
+    def open_create_account(self):
+        self.timings.sleep("open_create_account")
+
+
+class StubHpAccountPage:
+    def __init__(self, timings, mailsac):
+        self.timings = timings
+        self.mailsac = mailsac
+        self.expected_otp = None
+        self.submitted_otp = None
+
+    def fill_form(self, first_name, last_name, email, password):
+        self.timings.sleep("fill_form")
+        self.expected_otp = self.mailsac.deliver_otp(email, delay=self.timings.seconds("otp_delivery"))
+
+    def enter_otp_and_submit(self, otp):
+        self.timings.sleep("enter_otp")
+        self.submitted_otp = otp
+        if otp != self.expected_otp:
+            raise RuntimeError(f"Wrong OTP {otp}, expected {self.expected_otp}")
@@ -1,14 +1,84 @@
 # config.py
+import os
+
 DEFAULT_TIMEOUT = 30
 SHORT_TIMEOUT = 5
+WAIT_POLL_INTERVAL = 0.1
 POLL_INTERVAL = 3
 OTP_MAX_WAIT = 60
+# Inbox polling backs off from POLL_INITIAL_INTERVAL up to POLL_INTERVAL
+POLL_INITIAL_INTERVAL = 0.5
+POLL_BACKOFF_FACTOR = 2
 
-MAILBOX_PREFIX_LEN = 4
 MAIL_DOMAIN = "mailsac.com"
+# Mailbox identities: <ms timestamp><worker id><counter>test, unique per run and worker
+IDENTITY_WORKER_ID = int(os.environ.get("IDENTITY_WORKER_ID", os.getpid()))
+IDENTITY_BATCH_SIZE = 1024
+IDENTITY_LEDGER_PATH = os.environ.get("IDENTITY_LEDGER_PATH")  # optional file of every mailbox issued
 FIRSTNAME_LEN = 6
 LASTNAME_LEN = 6
 DEFAULT_PASSWORD = "SecurePassword123"
+# How text fields are filled, tried in order until the field reads back the right value:
+# "set_value" (UIA ValuePattern), "paste" (clipboard) or "keys" (keystrokes)
+INPUT_STRATEGIES = ("set_value", "paste", "keys")
+INPUT_KEY_PAUSE = 0.01  # seconds between keystrokes for the "keys" strategy
+# Existing account used by the sign-in flows (privacy settings)
+SIGNIN_USERNAME = os.environ.get("HP_SIGNIN_USERNAME", "test1202@mailsac.com")
+SIGNIN_PASSWORD = os.environ.get("HP_SIGNIN_PASSWORD", "Ascendion@12345")
 
-CHROME_HEADLESS = False
+CHROME_HEADLESS = os.environ.get("CHROME_HEADLESS", "1") != "0"
 CHROME_BINARY_ARGS = []
+# Lean mode for the Mailsac browser: only the markup the OTP scrape needs is loaded
+CHROME_LEAN = os.environ.get("CHROME_LEAN", "1") != "0"
+CHROME_PAGE_LOAD_STRATEGY = "eager"  # return once the DOM is ready, without waiting for subresources
+CHROME_DISABLE_EXTENSIONS = True
+CHROME_DISABLE_GPU = True
+CHROME_BLOCK_IMAGES = True
+# Network.setBlockedURLs patterns ("*" wildcards): fonts, ads and analytics
+CHROME_BLOCKED_URLS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    "*doubleclick.net*", "*googlesyndication.com*", "*adservice.google.com*", "*carbonads*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*hotjar.com*", "*segment.io*", "*sentry.io*",
+]
+# Throwaway profiles go on tmpfs so Chrome's disk cache and history never touch the disk
+CHROME_PROFILE_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Warm WebDriver pool for the Mailsac browser
+DRIVER_POOL_SIZE = 2
+DRIVER_MAX_USES = 20
+# Browsers are leased only for the OTP step; with up to twice DRIVER_POOL_SIZE flows reading
+# OTPs at once, a waiting flow waits out at most one other flow's OTP read
+DRIVER_LEASE_TIMEOUT = OTP_MAX_WAIT + DEFAULT_TIMEOUT
+
+# Run artefacts (report, checkpoints) go here; the directory is git-ignored
+OUTPUT_DIR = os.environ.get("HP_OUTPUT_DIR", "reports")
+
+# Reporting: steps stream to REPORT_PATH as they are logged; only the last
+# REPORT_BUFFER_SIZE steps stay in memory
+REPORT_PATH = os.path.join(OUTPUT_DIR, "automation_report.html")
+REPORT_JSONL_PATH = None  # e.g. "automation_report.jsonl" to keep structured step events
+REPORT_CONSOLE = True
+REPORT_BUFFER_SIZE = 1000
+
+# OTP provider: "browser" scrapes mailsac.com in Chrome, "http" uses the REST API
+OTP_PROVIDER = os.environ.get("OTP_PROVIDER", "browser")
+MAILSAC_URL = os.environ.get("MAILSAC_URL", "https://mailsac.com")  # web UI used by the browser provider
+MAILSAC_API_URL = os.environ.get("MAILSAC_API_URL", "https://mailsac.com/api")
+MAILSAC_API_KEY = os.environ.get("MAILSAC_API_KEY", "")
+HTTP_TIMEOUT = 10
+HTTP_POOL_SIZE = 4
+
+# Flow checkpoints: completed stages are stored here so a failed run can resume (FLOW_RESUME=1)
+CHECKPOINT_PATH = os.environ.get("FLOW_CHECKPOINT_PATH", os.path.join(OUTPUT_DIR, "flow_checkpoints.sqlite3"))
+FLOW_RESUME = os.environ.get("FLOW_RESUME", "0") == "1"
+# Checkpoints of runs that were never resumed are dropped after this many hours
+CHECKPOINT_RETENTION_HOURS = float(os.environ.get("FLOW_CHECKPOINT_RETENTION_HOURS", "24"))
+
+# Parallel signup runner
+RUNNER_ACCOUNTS = 10
+RUNNER_WORKERS = 4
+RUNNER_REPORT_DIR = "parallel_reports"
+
+# Shared OTP broker: one poller thread serving every pending mailbox
+OTP_BROKER_BATCH_SIZE = 20
+OTP_BROKER_MIN_INTERVAL = 1.0
@@ -0,0 +1,17 @@
+# conftest.py
+import pytest
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    from utils.driver_pool import get_driver_pool
+    pool = get_driver_pool()
+    yield pool
+    pool.report()
+    pool.close()
+
+
+@pytest.fixture
+def chrome_driver(driver_pool):
+    with driver_pool.lease() as driver:
+        yield driver
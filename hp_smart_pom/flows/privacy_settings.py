@@ -0,0 +1,42 @@
+# flows/privacy_settings.py
+"""Sign in to HP Smart with an existing account and check the Privacy Settings page."""
+from page_objects.hp_smart_app import HpSmartApp
+from page_objects.hp_sign_in_page import HpSignInPage
+from utils.flow import Flow, FlowError
+from utils.logger import log_step
+import config
+
+PRIVACY_SETTINGS = Flow("privacy_settings")
+EXPECTED_TITLE = "Privacy Settings"
+
+
+@PRIVACY_SETTINGS.step("Launch HP Smart", desktop=True)
+def launch(ctx):
+    hp_app = HpSmartApp()
+    hp_app.launch(maximize=True)
+    return {"hp_app": hp_app, "sign_in": HpSignInPage()}
+
+
+@PRIVACY_SETTINGS.step("Open Sign in", needs=["launch"], desktop=True)
+def open_sign_in(ctx):
+    ctx["hp_app"].open_sign_in()
+
+
+@PRIVACY_SETTINGS.step("Sign in", needs=["open_sign_in"], desktop=True)
+def sign_in(ctx):
+    page = ctx["sign_in"]
+    page.sign_in(ctx.get("username", config.SIGNIN_USERNAME), ctx.get("password", config.SIGNIN_PASSWORD))
+    page.open_hp_smart()
+
+
+@PRIVACY_SETTINGS.step("Open Privacy Settings", needs=["sign_in"], desktop=True)
+def open_privacy_settings(ctx):
+    title = ctx["hp_app"].open_privacy_settings()
+    if title != EXPECTED_TITLE:
+        raise FlowError(f"Title verification failed. Expected: {EXPECTED_TITLE} Got: {title}")
+    log_step(f"Privacy Settings title verified: {title}")
+
+
+@PRIVACY_SETTINGS.step("Open HP Smart Terms of Use", needs=["open_privacy_settings"], desktop=True)
+def open_terms_of_use(ctx):
+    ctx["hp_app"].open_terms_of_use()
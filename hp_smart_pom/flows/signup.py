@@ -0,0 +1,116 @@
+# flows/signup.py
+"""HP account signup: create the account in HP Smart, read the OTP from Mailsac, verify it."""
+from utils.helpers import generate_random_mailbox, generate_random_name
+from utils.logger import log_step
+from utils.driver_pool import get_driver_pool
+from utils.flow import Flow, FlowError
+import config
+
+SIGNUP = Flow("signup")
+
+
+def create_otp_provider(provider=config.OTP_PROVIDER):
+    # Each provider pulls in its own stack (urllib3 or selenium), so only the chosen one is imported
+    if provider == "http":
+        from page_objects.mailsac_api import MailsacApi
+        return MailsacApi()
+    if provider == "browser":
+        from page_objects.mailsac_page import MailsacPage
+        return MailsacPage(pool=get_driver_pool())
+    raise ValueError(f"Unknown OTP_PROVIDER: {provider!r}")
+
+
+def otp_provider(ctx):
+    """The run's OTP provider, created on first use (also after resuming from a checkpoint)."""
+    if ctx.get("otp_provider") is None:
+        ctx["otp_provider"] = create_otp_provider()
+        ctx["owns_otp_provider"] = True
+    mailsac = ctx["otp_provider"]
+    if hasattr(mailsac, "watch") and "mailbox_full" in ctx:
+        # A shared OtpBroker: registered before the form is submitted so the inbox baseline is
+        # empty; watch() is idempotent
+        mailsac.watch(ctx["mailbox_full"])
+    return mailsac
+
+
+# The desktop page objects need pywinauto (Windows only), so they are imported on first use;
+# benchmarks and tests put stand-ins in ctx under the same names instead
+def hp_app(ctx):
+    if "hp_app" not in ctx:
+        from page_objects.hp_smart_app import HpSmartApp
+        ctx["hp_app"] = HpSmartApp()
+    return ctx["hp_app"]
+
+
+def hp_account(ctx):
+    if "hp_account" not in ctx:
+        from page_objects.hp_account_page import HpAccountPage
+        ctx["hp_account"] = HpAccountPage()
+    return ctx["hp_account"]
+
+
+@SIGNUP.step("Generate identity", checkpoint=["mailbox_full", "mailbox_local_part", "first_name", "last_name"])
+def identity(ctx):
+    mailbox_full = generate_random_mailbox()
+    log_step(f"Generated mailbox: {mailbox_full}")
+    first_name, last_name = generate_random_name()
+    log_step(f"Generated name: {first_name} {last_name}")
+    ctx.update(mailbox_full=mailbox_full, mailbox_local_part=mailbox_full.split("@")[0],
+               first_name=first_name, last_name=last_name)
+    otp_provider(ctx)
+
+
+@SIGNUP.step("Launch HP Smart", needs=["identity"], desktop=True)
+def launch(ctx):
+    hp_app(ctx).launch()
+
+
+@SIGNUP.step("Open Create Account", needs=["launch"], desktop=True)
+def open_create_account(ctx):
+    hp_app(ctx).open_create_account()
+
+
+# The account exists once the form is submitted; never redo it on resume
+@SIGNUP.step("Fill account form", needs=["open_create_account"], desktop=True, checkpoint=[])
+def fill_form(ctx):
+    hp_account(ctx).fill_form(ctx["first_name"], ctx["last_name"], ctx["mailbox_full"], config.DEFAULT_PASSWORD)
+
+
+# A resumed run re-reads the inbox, so the code already mailed is reused rather than re-requested
+@SIGNUP.step("Wait for OTP", needs=["fill_form"], checkpoint=["otp"])
+def wait_for_otp(ctx):
+    mailsac = otp_provider(ctx)
+    try:
+        mailsac.open_mailsac()
+        otp = mailsac.fetch_otp(ctx["mailbox_local_part"])
+    finally:
+        if hasattr(mailsac, "release"):
+            # A pooled browser goes back before the desktop stages queue on the desktop lock
+            mailsac.release()
+    if not otp:
+        raise FlowError("Failed to receive OTP")
+    log_step(f"OTP received: {otp}")
+    return {"otp": otp}
+
+
+@SIGNUP.step("Enter OTP and verify", needs=["wait_for_otp"], desktop=True)
+def enter_otp(ctx):
+    hp_account(ctx).enter_otp_and_submit(ctx["otp"])
+
+
+# Fallback after OTP submission, in case the "Open HP Smart" popup appears
+@SIGNUP.step("Open HP Smart popup", needs=["enter_otp"], desktop=True, optional=True)
+def open_hp_smart_popup(ctx):
+    handler = ctx.get("popup_handler")
+    if handler is None:
+        from utils import click_open_hp_smart as handler
+    handler()
+
+
+@SIGNUP.teardown
+def quit_otp_provider(ctx):
+    mailsac = ctx.get("otp_provider")
+    if mailsac is not None and ctx.get("owns_otp_provider"):
+        mailsac.quit()
+        if getattr(mailsac, "pool", None) is not None:
+            mailsac.pool.report()
@@ -1,8 +1,9 @@
 # page_objects/hp_account_page.py
 from pywinauto import Desktop
-import pyperclip
-import time
 from utils.logger import log_step
+from utils.waits import wait_for_element, wait_for_element_gone, wait_for_usable
+from utils.locator_cache import LocatorCache
+from utils.text_input import enter_text
 import config
 
 class HpAccountPage:
@@ -15,17 +16,27 @@ class HpAccountPage:
 
     OTP_INPUT = dict(auto_id="code", control_type="Edit")
     OTP_SUBMIT_BUTTON = dict(auto_id="submit-code", control_type="Button")
+    SIGNUP_FORM = (FIRSTNAME_FIELD, LASTNAME_FIELD, EMAIL_FIELD, PASSWORD_FIELD, SIGNUP_BUTTON)
+    OTP_FORM = (OTP_INPUT, OTP_SUBMIT_BUTTON)
 
     def __init__(self, timeout=config.DEFAULT_TIMEOUT):
         self.desktop = Desktop(backend="uia")
         self.timeout = timeout
         self.window = None
+        self.window_wrapper = None
+        self.handle = None
+        self.locators = LocatorCache()
 
     def focus(self):
         try:
-            self.window = self.desktop.window(title_re=self.HP_ACCOUNT_WINDOW_RE)
+            if self.handle is None:
+                self.window = self.desktop.window(title_re=self.HP_ACCOUNT_WINDOW_RE)
+            else:
+                # Other flows open their own "HP account" windows while this one waits for its OTP
+                self.window = self.desktop.window(handle=self.handle)
             self.window.wait('exists visible enabled ready', timeout=self.timeout)
             self.window.set_focus()
+            self.window_wrapper = self.window.wrapper_object()
             log_step("Focused HP Account browser window.")
         except Exception as e:
             log_step(f"Failed to focus HP Account window: {e}", "FAIL")
@@ -34,13 +45,16 @@ class HpAccountPage:
     def fill_form(self, first_name, last_name, email, password):
         try:
             self.focus()
-            self.window.child_window(**self.FIRSTNAME_FIELD).type_keys(first_name)
-            self.window.child_window(**self.LASTNAME_FIELD).type_keys(last_name)
-            self.window.child_window(**self.EMAIL_FIELD).type_keys(email)
-            self.window.child_window(**self.PASSWORD_FIELD).type_keys(password)
-            self.window.child_window(**self.SIGNUP_BUTTON).wait('visible enabled', timeout=5).click_input()
+            self.handle = self.window_wrapper.handle
+            self.locators.prime(self.window_wrapper, self.SIGNUP_FORM)
+            enter_text(self._find(self.FIRSTNAME_FIELD), first_name, "first name")
+            enter_text(self._find(self.LASTNAME_FIELD), last_name, "last name")
+            enter_text(self._find(self.EMAIL_FIELD), email, "email")
+            enter_text(self._find(self.PASSWORD_FIELD), password, "password")
+            wait_for_usable(self._find(self.SIGNUP_BUTTON), "Create button enabled").click_input()
+            self.locators.evict(self.window_wrapper)
             log_step("Filled account form and clicked Create button.")
-            time.sleep(3)
+            wait_for_element(self.window, self.OTP_INPUT, "OTP entry screen", timeout=self.timeout)
         except Exception as e:
             log_step(f"Failed to fill account form: {e}", "FAIL")
             raise
@@ -48,16 +62,17 @@ class HpAccountPage:
     def enter_otp_and_submit(self, otp):
         try:
             self.focus()
-            otp_box = self.window.child_window(**self.OTP_INPUT)
-            otp_box.wait('visible enabled', timeout=5)
-            pyperclip.copy(otp)
-            time.sleep(0.5)
-            otp_box.click_input()
-            otp_box.type_keys("^v")
-            log_step("OTP pasted successfully.")
-            self.window.child_window(**self.OTP_SUBMIT_BUTTON).wait('visible enabled', timeout=5).click_input()
+            self.locators.prime(self.window_wrapper, self.OTP_FORM)
+            otp_box = wait_for_usable(self._find(self.OTP_INPUT), "OTP field enabled")
+            enter_text(otp_box, otp, "OTP")
+            log_step("OTP entered successfully.")
+            wait_for_usable(self._find(self.OTP_SUBMIT_BUTTON), "Verify button enabled").click_input()
+            self.locators.evict(self.window_wrapper)
             log_step("Clicked Verify button.")
-            time.sleep(5)
+            wait_for_element_gone(self.window, self.OTP_INPUT, "OTP screen to close", timeout=self.timeout)
         except Exception as e:
             log_step(f"OTP entry failed: {e}", "FAIL")
             raise
+
+    def _find(self, locator):
+        return self.locators.find(self.window_wrapper, locator)
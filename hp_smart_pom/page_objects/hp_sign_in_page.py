@@ -0,0 +1,62 @@
+# page_objects/hp_sign_in_page.py
+from pywinauto import Application
+from pywinauto.findwindows import find_elements
+from utils.logger import log_step
+from utils.text_input import enter_text
+from utils.waits import wait_for, wait_for_element, wait_for_usable
+import config
+
+class HpSignInPage:
+    CHROME_WINDOW_RE = r".*Chrome.*"
+    USERNAME_FIELD = dict(title="username", control_type="Edit")
+    USE_PASSWORD_BTN = dict(title="Use password", control_type="Button")
+    PASSWORD_FIELD = dict(title="password", control_type="Edit")
+    SUBMIT_BTN = dict(title="submit-button", control_type="Button")
+    OPEN_HP_SMART_BTN = dict(title="Open HP Smart", control_type="Button")
+
+    def __init__(self, timeout=config.DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self.window = None
+
+    def focus(self):
+        """Focus the newest Chrome window; matching by handle avoids ambiguity when several are open."""
+        try:
+            self.window = wait_for(self._latest_chrome_window, "HP sign-in browser window", timeout=self.timeout)
+            self.window.set_focus()
+            log_step(f"Focused sign-in window: {self.window.window_text()}")
+        except Exception as e:
+            log_step(f"Failed to focus sign-in window: {e}", "FAIL")
+            raise
+
+    def _latest_chrome_window(self):
+        windows = find_elements(title_re=self.CHROME_WINDOW_RE, backend="uia", visible_only=False)
+        if not windows:
+            return None
+        latest = windows[-1]
+        app = Application(backend="uia").connect(process=latest.process_id)
+        window = app.window(handle=latest.handle)
+        return window if window.exists(timeout=0) else None
+
+    def sign_in(self, username, password):
+        try:
+            self.focus()
+            enter_text(self._usable(self.USERNAME_FIELD, "username field"), username, "username")
+            self._usable(self.USE_PASSWORD_BTN, "Use password button").click_input()
+            enter_text(self._usable(self.PASSWORD_FIELD, "password field"), password, "password")
+            self._usable(self.SUBMIT_BTN, "submit button").click_input()
+            log_step("Submitted HP sign-in form.")
+        except Exception as e:
+            log_step(f"Sign in failed: {e}", "FAIL")
+            raise
+
+    def open_hp_smart(self):
+        try:
+            self._usable(self.OPEN_HP_SMART_BTN, "Open HP Smart button").click_input()
+            log_step("Clicked Open HP Smart button.")
+        except Exception as e:
+            log_step(f"Failed to open HP Smart from browser: {e}", "FAIL")
+            raise
+
+    def _usable(self, locator, desc):
+        spec = wait_for_element(self.window, locator, desc, timeout=self.timeout)
+        return wait_for_usable(spec.wrapper_object(), f"{desc} enabled")
@@ -1,27 +1,38 @@
 # page_objects/hp_smart_app.py
 from pywinauto import Desktop, keyboard
-import time
 from utils.logger import log_step
+from utils.waits import wait_for, wait_for_usable, wait_for_window
+from utils.locator_cache import LocatorCache
 import config
 
 class HpSmartApp:
     APP_LAUNCH_COMMAND = "{VK_LWIN}HP Smart{ENTER}"
     HP_SMART_WINDOW_RE = r".*HP Smart.*"
+    HP_ACCOUNT_WINDOW_RE = r".*HP account.*"
     MANAGE_ACCOUNT_BTN = dict(title="Manage HP Account", auto_id="HpcSignedOutIcon", control_type="Button")
     CREATE_ACCOUNT_BTN = dict(auto_id="HpcSignOutFlyout_CreateBtn", control_type="Button")
+    SIGN_IN_BTN = dict(title="Sign in", control_type="Button")
+    APP_SETTINGS_ITEM = dict(title="App Settings", control_type="ListItem")
+    PRIVACY_SETTINGS_TEXT = dict(title="Privacy Settings", control_type="Text")
+    TERMS_OF_USE_LINK = dict(title="HP Smart Terms of Use", control_type="Hyperlink", class_name="Hyperlink")
 
     def __init__(self, timeout=config.DEFAULT_TIMEOUT):
         self.desktop = Desktop(backend="uia")
         self.timeout = timeout
         self.main_win = None
+        self.main_wrapper = None
+        self.locators = LocatorCache()
 
-    def launch(self):
+    def launch(self, maximize=False):
         try:
             keyboard.send_keys(self.APP_LAUNCH_COMMAND)
             log_step("Sent keys to launch HP Smart app.")
             self.main_win = self.desktop.window(title_re=self.HP_SMART_WINDOW_RE)
             self.main_win.wait('exists visible enabled ready', timeout=self.timeout)
             self.main_win.set_focus()
+            if maximize:
+                self.main_win.maximize()
+            self.main_wrapper = self.main_win.wrapper_object()
             log_step("Focused HP Smart main window.")
         except Exception as e:
             log_step(f"Failed to launch/focus HP Smart window: {e}", "FAIL")
@@ -29,11 +40,51 @@ class HpSmartApp:
 
     def open_create_account(self):
         try:
-            self.main_win.child_window(**self.MANAGE_ACCOUNT_BTN).wait('visible enabled ready', timeout=5).click_input()
+            wait_for_usable(self._find(self.MANAGE_ACCOUNT_BTN), "Manage HP Account button").click_input()
             log_step("Clicked Manage HP Account button.")
-            self.main_win.child_window(**self.CREATE_ACCOUNT_BTN).wait('visible enabled ready', timeout=5).click_input()
+            # The flyout only exists after the click above; misses raise and are retried
+            create_btn = wait_for(lambda: self._find(self.CREATE_ACCOUNT_BTN), "Create Account flyout", timeout=config.SHORT_TIMEOUT)
+            wait_for_usable(create_btn, "Create Account button").click_input()
             log_step("Clicked Create Account button.")
-            time.sleep(1)
+            wait_for_window(self.desktop, self.HP_ACCOUNT_WINDOW_RE, "HP account window", timeout=self.timeout)
         except Exception as e:
             log_step(f"Failed to open create account page: {e}", "FAIL")
             raise
+
+    def open_sign_in(self):
+        try:
+            wait_for_usable(self._find(self.MANAGE_ACCOUNT_BTN), "Manage HP Account button").click_input()
+            log_step("Clicked Manage HP Account button.")
+            sign_in_btn = wait_for(lambda: self._find(self.SIGN_IN_BTN), "Sign in flyout", timeout=config.SHORT_TIMEOUT)
+            wait_for_usable(sign_in_btn, "Sign in button").click_input()
+            log_step("Clicked Sign in button.")
+        except Exception as e:
+            log_step(f"Failed to open sign in: {e}", "FAIL")
+            raise
+
+    def open_privacy_settings(self):
+        """Open App Settings > Privacy Settings and return the page title."""
+        try:
+            # The main window is rebuilt after sign-in, so wait on it instead of a cached wrapper
+            settings = wait_for(lambda: self._find(self.APP_SETTINGS_ITEM), "App Settings", timeout=self.timeout)
+            wait_for_usable(settings, "App Settings enabled").click_input()
+            log_step("Clicked App Settings.")
+            privacy = wait_for(lambda: self._find(self.PRIVACY_SETTINGS_TEXT), "Privacy Settings entry", timeout=self.timeout)
+            privacy.click_input()
+            log_step("Clicked Privacy Settings.")
+            return self._find(self.PRIVACY_SETTINGS_TEXT).window_text()
+        except Exception as e:
+            log_step(f"Failed to open Privacy Settings: {e}", "FAIL")
+            raise
+
+    def open_terms_of_use(self):
+        try:
+            link = wait_for(lambda: self._find(self.TERMS_OF_USE_LINK), "Terms of Use link", timeout=self.timeout)
+            wait_for_usable(link, "Terms of Use link visible").click_input()
+            log_step("Clicked HP Smart Terms of Use link.")
+        except Exception as e:
+            log_step(f"Failed to open HP Smart Terms of Use: {e}", "FAIL")
+            raise
+
+    def _find(self, locator):
+        return self.locators.find(self.main_wrapper, locator)
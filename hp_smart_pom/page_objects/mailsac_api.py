@@ -0,0 +1,108 @@
+# page_objects/mailsac_api.py
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+import urllib3
+from utils.logger import log_step
+from utils.otp_extractor import extract_otp, message_sender, newest_message
+from utils.poller import Poller
+import config
+
+
+class InboxBackend:
+    """Inbox interface used by MailsacApi. Messages are dicts, newest first, each with an "_id"."""
+
+    def list_messages(self, address):
+        raise NotImplementedError
+
+    def get_message_text(self, address, message_id):
+        raise NotImplementedError
+
+    def list_messages_batch(self, addresses):
+        return {address: self.list_messages(address) for address in addresses}
+
+    def close(self):
+        pass
+
+
+class MailsacHttpBackend(InboxBackend):
+    """Talks to the Mailsac REST API (or anything serving the same routes) over a pooled connection."""
+
+    def __init__(self, base_url=config.MAILSAC_API_URL, api_key=config.MAILSAC_API_KEY,
+                 timeout=config.HTTP_TIMEOUT, pool_size=config.HTTP_POOL_SIZE):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        headers = {"Accept": "application/json"}
+        if api_key:
+            headers["Mailsac-Key"] = api_key
+        self.http = urllib3.PoolManager(
+            headers=headers,
+            maxsize=pool_size,
+            timeout=urllib3.Timeout(total=timeout),
+            retries=urllib3.Retry(total=2, backoff_factor=0.2),
+        )
+
+    def _get(self, path):
+        resp = self.http.request("GET", f"{self.base_url}{path}")
+        if resp.status >= 400:
+            raise RuntimeError(f"GET {path} returned HTTP {resp.status}")
+        return resp.data.decode("utf-8", errors="replace")
+
+    def list_messages(self, address):
+        return json.loads(self._get(f"/addresses/{quote(address)}/messages"))
+
+    def get_message_text(self, address, message_id):
+        return self._get(f"/text/{quote(address)}/{quote(message_id)}")
+
+    def list_messages_batch(self, addresses):
+        # Mailsac has no multi-inbox endpoint; fan the batch out over the connection pool
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            return dict(zip(addresses, executor.map(self.list_messages, addresses)))
+
+    def close(self):
+        self.http.clear()
+
+
+class MailsacApi:
+    """Drop-in replacement for MailsacPage that reads the inbox over HTTP instead of driving Chrome."""
+
+    def __init__(self, backend=None, timeout=config.DEFAULT_TIMEOUT, poll_interval=config.POLL_INTERVAL, max_wait=config.OTP_MAX_WAIT):
+        self.backend = backend or MailsacHttpBackend()
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.poller = Poller(max_interval=poll_interval, max_wait=max_wait)
+        self.last_poll = None
+
+    def open_mailsac(self):
+        log_step("Using Mailsac HTTP API for OTP retrieval.")
+
+    def fetch_otp(self, mailbox_local_part):
+        address = f"{mailbox_local_part}@{config.MAIL_DOMAIN}"
+        try:
+            messages = []
+
+            def inbox_size():
+                messages[:] = self.backend.list_messages(address)
+                return len(messages)
+
+            self.last_poll = self.poller.wait_for_change(inbox_size)
+            log_step(f"Inbox polled {self.last_poll.polls} times over {self.last_poll.waited:.1f}s.", "INFO")
+            if not self.last_poll.changed:
+                log_step(f"No email arrived for {address} within {self.max_wait}s.", "FAIL")
+                return None
+            message = newest_message(messages)
+            otp = extract_otp(self.backend.get_message_text(address, message["_id"]), message_sender(message))
+            if otp:
+                log_step(f"Extracted OTP: {otp}")
+                return otp
+            else:
+                log_step("OTP not found in email.", "FAIL")
+                return None
+        except Exception as e:
+            log_step(f"Error fetching OTP: {e}", "FAIL")
+            return None
+
+    def quit(self):
+        self.backend.close()
+        log_step("Closed Mailsac HTTP session.")
@@ -1,35 +1,35 @@
 # page_objects/mailsac_page.py
-import re
-import time
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from utils.logger import log_step
+from utils.otp_extractor import extract_otp
+from utils.poller import Poller
+from utils.browser import create_chrome_driver
 import config
 
 class MailsacPage:
-    MAILSAC_URL = "https://mailsac.com"
+    MAILSAC_URL = config.MAILSAC_URL
     MAILBOX_PLACEHOLDER_XPATH = "//input[@placeholder='mailbox']"
     CHECK_MAIL_BTN_XPATH = "//button[normalize-space()='Check the mail!']"
-    INBOX_ROW_XPATH = "//table[contains(@class,'inbox-table')]/tbody/tr[contains(@class,'clickable')][1]"
+    INBOX_ROWS_XPATH = "//table[contains(@class,'inbox-table')]/tbody/tr[contains(@class,'clickable')]"
+    INBOX_ROW_XPATH = INBOX_ROWS_XPATH + "[1]"
     EMAIL_BODY_CSS = "#emailBody"
-    OTP_REGEX = r"\b(\d{4,8})\b"
 
-    def __init__(self, headless=config.CHROME_HEADLESS, timeout=config.DEFAULT_TIMEOUT, poll_interval=config.POLL_INTERVAL, max_wait=config.OTP_MAX_WAIT):
-        opts = webdriver.ChromeOptions()
-        if headless:
-            opts = webdriver.ChromeOptions()
-        if headless:
-           opts.add_argument('--headless=new')
-        for arg in config.CHROME_BINARY_ARGS:
-          opts.add_argument(arg)
-        self.driver = webdriver.Chrome(options=opts)
+    def __init__(self, headless=config.CHROME_HEADLESS, timeout=config.DEFAULT_TIMEOUT, poll_interval=config.POLL_INTERVAL, max_wait=config.OTP_MAX_WAIT, pool=None):
+        # A pooled browser is leased in open_mailsac() and handed back by release(), so a flow
+        # holds it only while it reads the inbox
+        self.pool = pool
+        self.driver = None if pool is not None else create_chrome_driver(headless=headless)
         self.timeout = timeout
         self.poll_interval = poll_interval
         self.max_wait = max_wait
+        self.poller = Poller(max_interval=poll_interval, max_wait=max_wait)
+        self.last_poll = None
 
     def open_mailsac(self):
+        if self.driver is None:
+            self.driver = self.pool.acquire()
         self.driver.get(self.MAILSAC_URL)
         log_step("Opened Mailsac website.")
 
@@ -42,24 +42,20 @@ class MailsacPage:
             check_btn = wait.until(EC.element_to_be_clickable((By.XPATH, self.CHECK_MAIL_BTN_XPATH)))
             check_btn.click()
             log_step("Opened Mailsac inbox.")
-            start_time = time.time()
-
-            while time.time() - start_time < self.max_wait:
-                try:
-                    email_row = WebDriverWait(self.driver, self.poll_interval).until(
-                        EC.presence_of_element_located((By.XPATH, self.INBOX_ROW_XPATH))
-                    )
-                    email_row.click()
-                    log_step("Clicked on first email row.")
-                    break
-                except:
-                    self.driver.find_element(By.XPATH, self.CHECK_MAIL_BTN_XPATH).click()
-                    log_step("Refreshed Mailsac inbox.", "INFO")
+            self.last_poll = self.poller.wait_for_change(
+                lambda: len(self.driver.find_elements(By.XPATH, self.INBOX_ROWS_XPATH)),
+                refresh=lambda: self.driver.find_element(By.XPATH, self.CHECK_MAIL_BTN_XPATH).click(),
+            )
+            log_step(f"Inbox polled {self.last_poll.polls} times over {self.last_poll.waited:.1f}s.", "INFO")
+            if not self.last_poll.changed:
+                log_step("No email arrived before OTP_MAX_WAIT.", "FAIL")
+                return None
+            self.driver.find_element(By.XPATH, self.INBOX_ROW_XPATH).click()
+            log_step("Clicked on first email row.")
             body_elem = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.EMAIL_BODY_CSS)))
-            email_body = body_elem.text
-            match = re.search(self.OTP_REGEX, email_body)
-            if match:
-                otp = match.group(1)
+            # innerHTML keeps the table/paragraph structure that .text flattens away
+            otp = extract_otp(body_elem.get_attribute("innerHTML") or body_elem.text)
+            if otp:
                 log_step(f"Extracted OTP: {otp}")
                 return otp
             else:
@@ -69,7 +65,17 @@ class MailsacPage:
             log_step(f"Error fetching OTP: {e}", "FAIL")
             return None
 
+    def release(self):
+        """Return a pooled browser; the next open_mailsac() leases one again."""
+        if self.driver and self.pool is not None:
+            self.pool.release(self.driver)
+            self.driver = None
+            log_step("Returned Mailsac browser to pool.")
+
     def quit(self):
-        if self.driver:
+        if self.pool is not None:
+            self.release()
+        elif self.driver:
             self.driver.quit()
             log_step("Closed Mailsac browser.")
+        self.driver = None
@@ -0,0 +1,120 @@
+"""Run many signup flows concurrently and report throughput.
+
+Run from hp_smart_pom:  python parallel_runner.py --accounts 50 --workers 8
+"""
+import argparse
+import contextvars
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from main_test import run_signup
+from utils.driver_pool import get_driver_pool
+from utils.logger import log_step, merge_reports, run_context
+from utils.otp_broker import OtpBroker
+import config
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(1, math.ceil(len(sorted_values) * pct / 100)) - 1]
+
+
+def failure_reason(run, error=None):
+    """The top-level stage that failed, plus the exception type if the flow raised."""
+    stage = next((e.desc for e in run.events if e.status == "FAIL" and e.depth == 0), "unknown stage")
+    return f"{stage}: {type(error).__name__}" if error is not None else stage
+
+
+def run_one(index, desktop_lock, otp_provider, report_dir, make_ctx=None):
+    with run_context(f"signup-{index:04d}", report_path=os.path.join(report_dir, f"signup_{index:04d}.html")) as run:
+        start = time.monotonic()
+        error = None
+        try:
+            ctx = make_ctx() if make_ctx is not None else None
+            ok = run_signup(desktop_lock=desktop_lock, otp_provider=otp_provider, ctx=ctx)
+        except Exception as e:
+            ok, error = False, e
+        latency = time.monotonic() - start
+    return {"run": run, "ok": ok, "latency": latency, "reason": None if ok else failure_reason(run, error)}
+
+
+def summarize(results, wall_time):
+    latencies = sorted(r["latency"] for r in results)
+    succeeded = sum(r["ok"] for r in results)
+    failures = {}
+    for r in results:
+        if not r["ok"]:
+            failures[r["reason"]] = failures.get(r["reason"], 0) + 1
+    return {
+        "accounts": len(results),
+        "succeeded": succeeded,
+        "wall_time": wall_time,
+        "accounts_per_minute": succeeded / wall_time * 60 if wall_time else 0.0,
+        "latency_p50": percentile(latencies, 50),
+        "latency_p95": percentile(latencies, 95),
+        "latency_p99": percentile(latencies, 99),
+        "failures": failures,
+        "steps": merge_reports(r["run"] for r in results),
+    }
+
+
+def run_parallel(accounts=config.RUNNER_ACCOUNTS, workers=config.RUNNER_WORKERS,
+                 report_dir=config.RUNNER_REPORT_DIR, provider=config.OTP_PROVIDER, make_ctx=None):
+    """Run accounts signup flows on workers threads and write summary.json to report_dir.
+
+    provider is "http" (one shared OtpBroker), "browser" (a pooled MailsacPage per flow) or an
+    OTP provider object shared by every flow and owned by the caller. make_ctx, if given,
+    returns the starting context of each flow (e.g. stand-in page objects).
+    """
+    os.makedirs(report_dir, exist_ok=True)
+    # UIA input goes to whatever window has focus, so only one flow may drive the desktop at a time
+    desktop_lock = threading.Lock()
+    owns_broker = provider == "http"
+    if owns_broker:
+        broker = OtpBroker().start()
+    else:
+        broker = None if isinstance(provider, str) else provider
+    start = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="signup") as executor:
+            # Each flow gets its own copy of the caller's context, so steps a flow logs before (or
+            # outside) its run_context never fall through to the shared default run
+            futures = [executor.submit(contextvars.copy_context().run, run_one, i, desktop_lock, broker, report_dir,
+                                       make_ctx) for i in range(accounts)]
+            results = [f.result() for f in futures]
+    finally:
+        if owns_broker:
+            broker.stop()
+    summary = summarize(results, time.monotonic() - start)
+    log_step(
+        f"{summary['succeeded']}/{summary['accounts']} accounts in {summary['wall_time']:.1f}s "
+        f"({summary['accounts_per_minute']:.1f}/min), latency p50 {summary['latency_p50']:.1f}s "
+        f"p95 {summary['latency_p95']:.1f}s p99 {summary['latency_p99']:.1f}s",
+        "PASS" if summary["succeeded"] == summary["accounts"] else "FAIL",
+    )
+    for reason, count in sorted(summary["failures"].items(), key=lambda item: -item[1]):
+        log_step(f"{count} x {reason}", "INFO")
+    with open(os.path.join(report_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=config.RUNNER_ACCOUNTS)
+    parser.add_argument("--workers", type=int, default=config.RUNNER_WORKERS)
+    parser.add_argument("--report-dir", default=config.RUNNER_REPORT_DIR)
+    args = parser.parse_args()
+    try:
+        run_parallel(args.accounts, args.workers, args.report_dir)
+    finally:
+        get_driver_pool().close()
+
+
+if __name__ == "__main__":
+    main()
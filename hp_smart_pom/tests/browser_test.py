@@ -0,0 +1,15 @@
+from utils.browser import chrome_options
+
+
+def test_lean_options_trim_the_browser():
+    opts = chrome_options(headless=True, extra_args=[], lean=True, profile_dir="/dev/shm/profile")
+    for arg in ("--headless=new", "--disable-extensions", "--disable-gpu", "--user-data-dir=/dev/shm/profile"):
+        assert arg in opts.arguments
+    assert opts.page_load_strategy == "eager"
+    assert opts.experimental_options["prefs"]["profile.managed_default_content_settings.images"] == 2
+
+
+def test_full_options_match_the_old_setup():
+    opts = chrome_options(headless=False, extra_args=["--window-size=1280,800"], lean=False)
+    assert opts.arguments == ["--window-size=1280,800"]
+    assert opts.page_load_strategy == "normal"
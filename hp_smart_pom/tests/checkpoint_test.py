@@ -0,0 +1,79 @@
+import sqlite3
+import time
+from utils.checkpoint import CheckpointStore
+from utils.flow import Flow, FlowError, run_flow
+
+
+def make_flow(calls, broken):
+    flow = Flow("resumable")
+
+    @flow.step("Identity", checkpoint=["mailbox"])
+    def identity(ctx):
+        calls.append("identity")
+        return {"mailbox": f"box{len(calls)}", "page": object()}
+
+    @flow.step("Launch", needs=["identity"])
+    def launch(ctx):
+        calls.append("launch")
+
+    @flow.step("Submit form", needs=["launch"], checkpoint=[])
+    def submit(ctx):
+        calls.append("submit")
+
+    @flow.step("Wait for OTP", needs=["submit"], checkpoint=["otp"])
+    def otp(ctx):
+        calls.append("otp")
+        return {"otp": "123456"}
+
+    @flow.step("Enter OTP", needs=["otp"])
+    def enter(ctx):
+        calls.append("enter")
+        if broken:
+            raise FlowError("OTP screen closed")
+
+    return flow
+
+
+def test_resume_skips_completed_stages(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    calls = []
+    first = make_flow(calls, broken=True).run(store=store)
+    assert not first.ok and first.failed == ["enter"]
+    assert store.latest("resumable") == first.run_key
+    assert list(store.load("resumable", first.run_key)) == ["identity", "submit", "otp"]
+
+    calls.clear()
+    second = make_flow(calls, broken=False).run(store=CheckpointStore(store.path), run_key=first.run_key)
+    assert second.ok and calls == ["enter"]
+    assert second.ctx["mailbox"] == first.ctx["mailbox"] and second.ctx["otp"] == "123456"
+    assert store.load("resumable", first.run_key) == {} and store.latest("resumable") is None
+
+
+def test_partial_checkpoint_reruns_later_stages(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    store.save("resumable", "k1", "identity", {"mailbox": "kept"})
+    calls = []
+    result = make_flow(calls, broken=False).run(store=store, run_key="k1")
+    assert result.ok and result.ctx["mailbox"] == "kept"
+    assert calls == ["launch", "submit", "otp", "enter"]
+
+
+def test_prune_drops_only_abandoned_runs(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    store.save("resumable", "old", "identity", {"mailbox": "a"})
+    store.save("resumable", "old", "submit")
+    time.sleep(0.05)
+    store.save("resumable", "recent", "identity", {"mailbox": "b"})
+    assert store.prune(max_age=0.02) == 1
+    assert store.load("resumable", "old") == {} and store.latest("resumable") == "recent"
+
+
+def test_run_flow_prunes_and_clears_successful_runs(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    store.save("resumable", "abandoned", "identity", {"mailbox": "a"})
+    with sqlite3.connect(store.path) as conn:
+        conn.execute("UPDATE checkpoints SET saved_at = 0")
+    result = run_flow(make_flow([], broken=False), report_path=str(tmp_path / "report.html"), store=store, resume=False)
+    assert result.ok
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0] == 0
@@ -0,0 +1,106 @@
+import threading
+import pytest
+from utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.url = "about:blank"
+        self.dead = False
+        self.cookies_cleared = 0
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        if self.dead:
+            raise ConnectionError("browser gone")
+        return self.url
+
+    def get(self, url):
+        self.url = url
+
+    def execute_script(self, script):
+        pass
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFactory:
+    def __init__(self):
+        self.drivers = []
+
+    def __call__(self):
+        self.drivers.append(FakeDriver())
+        return self.drivers[-1]
+
+
+def test_released_driver_is_reused_and_counted_as_hit():
+    factory = FakeFactory()
+    pool = DriverPool(factory=factory, size=2, max_uses=10, lease_timeout=0.1)
+    with pool.lease() as first:
+        first.get("https://mailsac.com/inbox/a")
+    with pool.lease() as second:
+        assert second is first and second.url == "about:blank"
+    assert first.cookies_cleared == 2
+    stats = pool.stats()
+    assert (stats["leases"], stats["hits"], stats["created"]) == (2, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_warm_drivers_make_first_lease_a_hit():
+    factory = FakeFactory()
+    pool = DriverPool(factory=factory, size=2, max_uses=10, lease_timeout=0.1)
+    pool.warm()
+    with pool.lease():
+        pass
+    assert len(factory.drivers) == 2 and pool.hits == 1
+
+
+def test_driver_is_recycled_after_max_uses():
+    factory = FakeFactory()
+    pool = DriverPool(factory=factory, size=1, max_uses=2, lease_timeout=0.1)
+    for _ in range(2):
+        with pool.lease() as driver:
+            assert driver is factory.drivers[0]
+    assert factory.drivers[0].quit_called and pool.recycled == 1
+    with pool.lease() as driver:
+        assert driver is factory.drivers[1]
+    assert pool.created == 2
+
+
+def test_broken_lease_is_discarded():
+    factory = FakeFactory()
+    pool = DriverPool(factory=factory, size=1, max_uses=10, lease_timeout=0.1)
+    with pytest.raises(RuntimeError):
+        with pool.lease() as driver:
+            driver.dead = True
+            raise RuntimeError("page crashed")
+    assert driver.quit_called and pool.recycled == 1
+    with pool.lease() as replacement:
+        assert replacement is not driver
+    assert pool.hits == 0
+
+
+def test_failing_step_with_healthy_browser_keeps_driver():
+    factory = FakeFactory()
+    pool = DriverPool(factory=factory, size=1, max_uses=10, lease_timeout=0.1)
+    with pytest.raises(LookupError):
+        with pool.lease():
+            raise LookupError("no OTP yet")
+    with pool.lease() as driver:
+        assert driver is factory.drivers[0]
+    assert pool.recycled == 0
+
+
+def test_lease_times_out_when_pool_is_exhausted():
+    pool = DriverPool(factory=FakeFactory(), size=1, max_uses=10, lease_timeout=0.05)
+    held = pool.acquire()
+    with pytest.raises(TimeoutError, match="No WebDriver free"):
+        pool.acquire()
+    # Releasing from another thread frees the slot for a waiting lease
+    threading.Timer(0.02, pool.release, args=(held,)).start()
+    assert pool.acquire(timeout=1) is held
@@ -0,0 +1,84 @@
+import json
+import urllib.request
+import pytest
+from page_objects.mailsac_api import MailsacApi, MailsacHttpBackend
+from utils.fake_mailsac import FakeMailsac
+from utils.otp_broker import OtpBroker
+from utils.poller import Poller
+
+
+@pytest.fixture
+def mailsac():
+    with FakeMailsac(seed=1) as server:
+        yield server
+
+
+def make_api(mailsac, timeout=2, max_wait=2):
+    api = MailsacApi(backend=MailsacHttpBackend(base_url=mailsac.api_url, timeout=timeout), max_wait=max_wait)
+    api.poller = Poller(initial_interval=0.05, factor=2, max_interval=0.2, max_wait=max_wait)
+    return api
+
+
+def get(url):
+    with urllib.request.urlopen(url, timeout=5) as resp:
+        return resp.read().decode("utf-8")
+
+
+def test_api_fetches_otp_after_delivery_latency(mailsac):
+    otp = mailsac.deliver_otp("latency", delay=0.3)
+    api = make_api(mailsac)
+    assert api.fetch_otp("latency") == otp
+    assert api.last_poll.polls > 1
+
+
+def test_newest_message_wins(mailsac):
+    mailsac.deliver_otp("resend", otp="111111")
+    newer = mailsac.deliver_otp("resend", otp="222222")
+    assert make_api(mailsac).fetch_otp("resend") == newer
+
+
+@pytest.mark.parametrize("fault", ["empty_inbox", "malformed_body", "server_error"])
+def test_faults_yield_no_otp(mailsac, fault):
+    mailsac.deliver_otp("faulty")
+    mailsac.inject_fault(fault)
+    assert make_api(mailsac, max_wait=0.3).fetch_otp("faulty") is None
+
+
+def test_slow_response_times_out(mailsac):
+    mailsac.deliver_otp("slow")
+    mailsac.slow_response_delay = 0.3
+    mailsac.inject_fault("slow_response")
+    assert make_api(mailsac, timeout=0.1, max_wait=0.3).fetch_otp("slow") is None
+    mailsac.clear_faults()
+    assert make_api(mailsac).fetch_otp("slow") is not None
+
+
+def test_broker_resolves_through_fake(mailsac):
+    backend = MailsacHttpBackend(base_url=mailsac.api_url)
+    with OtpBroker(backend=backend, min_interval=0.05, max_wait=2) as broker:
+        futures = {f"user{i}@{mailsac.domain}": None for i in range(5)}
+        for address in futures:
+            futures[address] = broker.watch(address)
+        expected = {address: mailsac.deliver_otp(address, delay=0.1) for address in futures}
+        assert {address: f.result(timeout=5) for address, f in futures.items()} == expected
+
+
+def test_web_ui_matches_mailsac_page_locators(mailsac):
+    assert "placeholder='mailbox'" in get(mailsac.url)
+    otp = mailsac.deliver_otp("browser")
+    inbox = get(f"{mailsac.url}/inbox?mailbox=browser")
+    assert "inbox-table" in inbox and "Check the mail!" in inbox
+    assert inbox.count("class='clickable'") == 1
+    message_id = mailsac.messages("browser")[0]["_id"]
+    page = get(f"{mailsac.url}/inbox/browser@{mailsac.domain}/{message_id}")
+    assert "id='emailBody'" in page and otp in page
+
+
+def test_control_routes_deliver_and_inject(mailsac):
+    request = urllib.request.Request(
+        f"{mailsac.url}/_control/deliver", data=json.dumps({"mailbox": "remote", "otp": "654321"}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=5) as resp:
+        assert json.load(resp) == {"otp": "654321"}
+    assert make_api(mailsac).fetch_otp("remote") == "654321"
@@ -0,0 +1,77 @@
+import threading
+import pytest
+from utils.flow import Flow, FlowError
+
+
+class RecordingLock:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+
+    def acquire(self):
+        self.lock.acquire()
+        self.events.append("acquire")
+
+    def release(self):
+        self.events.append("release")
+        self.lock.release()
+
+
+def make_flow(calls, fail=()):
+    flow = Flow("toy")
+
+    def action(name, result=None):
+        def run(ctx):
+            calls.append(name)
+            if name in fail:
+                raise FlowError(f"{name} broke")
+            return result
+        run.__name__ = name
+        return run
+
+    flow.step("A", desktop=True)(action("a", {"from_a": 1}))
+    flow.step("B", needs=["a"], desktop=True)(action("b"))
+    flow.step("C", needs=["b"])(action("c"))
+    flow.step("D", needs=["c"], desktop=True, optional=True)(action("d"))
+    flow.step("E", needs=["a"])(action("e"))
+    flow.teardown(action("cleanup"))
+    return flow
+
+
+def test_steps_run_in_order_and_share_context():
+    calls = []
+    result = make_flow(calls).run()
+    assert result.ok and result.ctx["from_a"] == 1
+    assert calls == ["a", "b", "c", "d", "e", "cleanup"]
+
+
+def test_failure_skips_dependents_only():
+    calls = []
+    result = make_flow(calls, fail={"b"}).run()
+    assert not result.ok
+    assert result.failed == ["b"] and result.skipped == ["c", "d"]
+    assert calls == ["a", "b", "e", "cleanup"]
+
+
+def test_optional_failure_keeps_flow_ok():
+    assert make_flow([], fail={"d"}).run().ok
+
+
+def test_desktop_lock_held_across_consecutive_desktop_steps():
+    lock = RecordingLock()
+    make_flow([]).run(desktop_lock=lock)
+    # A+B share one hold, C releases it, D takes it again and E releases it
+    assert lock.events == ["acquire", "release", "acquire", "release"]
+    assert not lock.lock.locked()
+
+
+def test_lock_released_when_a_desktop_step_fails_last():
+    lock = RecordingLock()
+    make_flow([], fail={"a"}).run(desktop_lock=lock)
+    assert not lock.lock.locked()
+
+
+def test_needs_must_be_defined_first():
+    flow = Flow("bad")
+    with pytest.raises(ValueError):
+        flow.step("X", needs=["missing"])(lambda ctx: None)
@@ -0,0 +1,57 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from utils.helpers import generate_random_mailbox
+from utils.identity import IdentityGenerator, base36
+
+MAILBOX = re.compile(r"[0-9a-z]{13}[0-9a-f]+test@mailsac\.com")
+
+
+def test_threads_sharing_a_generator_never_collide():
+    generator = IdentityGenerator(worker_id=7, batch_size=16, ledger_path=None)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        mailboxes = list(executor.map(lambda _: generator.next_mailbox(), range(2000)))
+    assert len(set(mailboxes)) == 2000
+    assert all(MAILBOX.fullmatch(m) for m in mailboxes)
+
+
+def test_workers_created_in_the_same_millisecond_never_collide(monkeypatch):
+    monkeypatch.setattr("utils.identity.time.time", lambda: 1700000000.0)
+    generators = [IdentityGenerator(worker_id=w, batch_size=8, ledger_path=None) for w in (1, 2, 36, 37)]
+    mailboxes = [m for g in generators for m in g.batch(100)]
+    assert len(set(mailboxes)) == len(mailboxes)
+    assert len({g.prefix for g in generators}) == 4
+    # Same worker id and millisecond (e.g. two generators in one process): the shared counter separates them
+    twins = IdentityGenerator(worker_id=1, ledger_path=None), IdentityGenerator(worker_id=1, ledger_path=None)
+    assert not set(twins[0].batch(50)) & set(twins[1].batch(50))
+
+
+def test_ledger_records_addresses_and_skips_them_on_rerun(tmp_path, monkeypatch):
+    ledger = tmp_path / "identities.txt"
+    monkeypatch.setattr("utils.identity._next_counter", 0)
+    first = IdentityGenerator(worker_id=3, batch_size=4, ledger_path=str(ledger))
+    issued = [first.next_mailbox() for _ in range(6)]
+    first.close()
+    # Whole batches are recorded as they are drawn: two batches of 4 for 6 mailboxes
+    recorded = ledger.read_text(encoding="utf-8").split()
+    assert len(recorded) == 8 and recorded[:6] == issued
+    # A rerun with the same prefix and counter (e.g. after a restart) must not hand them out again
+    monkeypatch.setattr("utils.identity._next_counter", 0)
+    rerun = IdentityGenerator(worker_id=3, batch_size=4, ledger_path=str(ledger))
+    rerun.prefix = first.prefix
+    fresh = rerun.batch(16)
+    assert len(fresh) == 8 and not set(fresh) & set(recorded)
+    rerun.close()
+
+
+def test_base36_is_fixed_width():
+    assert base36(0, 3) == "000" and base36(35, 2) == "0z" and base36(36, 2) == "10"
+    with pytest.raises(ValueError):
+        base36(36 ** 2, 2)
+
+
+def test_generate_random_mailbox_keeps_prefix_len_argument():
+    assert generate_random_mailbox().endswith("test@mailsac.com")
+    with pytest.deprecated_call():
+        mailbox = generate_random_mailbox(4, "example.com")
+    assert mailbox.endswith("test@example.com")
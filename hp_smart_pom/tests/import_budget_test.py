@@ -0,0 +1,14 @@
+import pytest
+from benchmarks.import_bench import IMPORT_BUDGETS, best_import_ms, loaded_heavy_modules
+
+
+@pytest.mark.parametrize("module", IMPORT_BUDGETS)
+def test_heavy_dependencies_load_lazily(module):
+    _, allowed = IMPORT_BUDGETS[module]
+    assert [m for m in loaded_heavy_modules(module) if m not in allowed] == []
+
+
+@pytest.mark.parametrize("module", IMPORT_BUDGETS)
+def test_import_time_within_budget(module):
+    budget, _ = IMPORT_BUDGETS[module]
+    assert best_import_ms(module) <= budget
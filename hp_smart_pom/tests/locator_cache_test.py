@@ -0,0 +1,129 @@
+import pytest
+from utils.locator_cache import LocatorCache
+from utils.uia_snapshot import UiaSnapshot
+
+FIRST_NAME = dict(auto_id="firstName", control_type="Edit")
+SUBMIT = dict(auto_id="sign-up-submit", control_type="Button")
+
+
+class FakeInfo:
+    def __init__(self, element):
+        self.element = element
+
+    @property
+    def enabled(self):
+        if self.element.stale:
+            raise RuntimeError("element not available")
+        return True
+
+    def __getattr__(self, name):
+        return self.element.props[name]
+
+
+class FakeElement:
+    def __init__(self, auto_id, control_type, name=""):
+        self.props = {"automation_id": auto_id, "control_type": control_type, "name": name, "class_name": ""}
+        self.element_info = FakeInfo(self)
+        self.stale = False
+
+
+class FakeWindow:
+    def __init__(self, *elements, handle=1):
+        self.handle = handle
+        self.elements = list(elements)
+        self.walks = 0
+
+    def descendants(self):
+        self.walks += 1
+        return list(self.elements)
+
+
+class FakeSnapshot(UiaSnapshot):
+    """UiaSnapshot over fake elements; wrapper() returns them instead of pywinauto wrappers."""
+
+    @classmethod
+    def of(cls, window):
+        props = [e.props for e in window.elements]
+        columns = {"auto_id": [p["automation_id"] for p in props], "title": [p["name"] for p in props],
+                   "control_type": [p["control_type"] for p in props], "class_name": [""] * len(props),
+                   "parent": [-1] * len(props)}
+        return cls(columns, list(window.elements))
+
+    def wrapper(self, i):
+        return self.elements[i]
+
+
+@pytest.fixture
+def snapshots(monkeypatch):
+    captures = []
+
+    def capture(window):
+        captures.append(window)
+        return FakeSnapshot.of(window)
+
+    monkeypatch.setattr(UiaSnapshot, "capture", staticmethod(capture))
+    return captures
+
+
+@pytest.fixture
+def no_snapshots(monkeypatch):
+    def capture(window):
+        raise OSError("cached subtree request refused")
+
+    monkeypatch.setattr(UiaSnapshot, "capture", staticmethod(capture))
+
+
+def test_primed_locators_are_hits(snapshots):
+    window = FakeWindow(FakeElement("firstName", "Edit"), FakeElement("sign-up-submit", "Button"))
+    cache = LocatorCache()
+    cache.prime(window, [FIRST_NAME, SUBMIT])
+    assert cache.find(window, FIRST_NAME) is window.elements[0]
+    assert cache.find(window, SUBMIT) is window.elements[1]
+    assert (cache.hits, cache.misses, len(snapshots)) == (2, 0, 1)
+    assert window.walks == 0
+
+
+def test_stale_entry_is_evicted_and_resolved_again(snapshots):
+    old = FakeElement("firstName", "Edit")
+    window = FakeWindow(old, FakeElement("sign-up-submit", "Button"))
+    cache = LocatorCache()
+    cache.prime(window, [FIRST_NAME, SUBMIT])
+    # The page re-rendered: the cached wrapper is dead and a new element took its place
+    old.stale = True
+    window.elements[0] = FakeElement("firstName", "Edit")
+    assert cache.find(window, FIRST_NAME) is window.elements[0]
+    assert (cache.hits, cache.misses, len(snapshots)) == (0, 1, 2)
+    # The whole window was dropped, so the other locator is resolved again too
+    cache.find(window, SUBMIT)
+    assert cache.misses == 2
+
+
+def test_evict_is_per_window(snapshots):
+    signup = FakeWindow(FakeElement("firstName", "Edit"))
+    mailsac = FakeWindow(FakeElement("sign-up-submit", "Button"), handle=2)
+    cache = LocatorCache()
+    cache.find(signup, FIRST_NAME)
+    cache.find(mailsac, SUBMIT)
+    cache.evict(signup)
+    cache.find(mailsac, SUBMIT)
+    cache.find(signup, FIRST_NAME)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_walk_fallback_when_snapshot_is_refused(no_snapshots):
+    window = FakeWindow(FakeElement("", "Text", "Create account"), FakeElement("firstName", "Edit"),
+                        FakeElement("sign-up-submit", "Button"))
+    cache = LocatorCache()
+    found = cache.prime(window, [FIRST_NAME, SUBMIT])
+    assert list(found.values()) == window.elements[1:]
+    assert window.walks == 1
+    assert cache.find(window, SUBMIT) is window.elements[2] and cache.hits == 1
+
+
+def test_walk_fallback_on_miss_and_missing_element_raises(no_snapshots):
+    window = FakeWindow(FakeElement("firstName", "Edit"))
+    cache = LocatorCache()
+    assert cache.find(window, FIRST_NAME) is window.elements[0]
+    with pytest.raises(LookupError, match="sign-up-submit"):
+        cache.find(window, SUBMIT)
+    assert (cache.misses, window.walks) == (2, 2)
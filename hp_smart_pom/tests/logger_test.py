@@ -0,0 +1,221 @@
+import contextvars
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import config
+from utils.logger import (DEFAULT_RUN, HtmlSink, RunReport, StepEvent, add_sink, current_run, generate_report,
+                          log_step, merge_reports, remove_sink, run_context, start_report, step)
+from utils.otp_broker import OtpBroker
+
+
+def test_run_context_isolates_threads():
+    before = sum(DEFAULT_RUN.status_counts.values())
+    barrier = threading.Barrier(4)
+
+    def flow(i):
+        with run_context(f"flow-{i}") as run:
+            barrier.wait()
+            for n in range(50):
+                log_step(f"flow {i} step {n}", "PASS" if n % 5 else "FAIL")
+        return run
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        runs = list(executor.map(flow, range(4)))
+    for i, run in enumerate(runs):
+        assert run.status_counts == {"PASS": 40, "FAIL": 10}
+        assert all(e.desc.startswith(f"flow {i} ") and e.run_id == f"flow-{i}" for e in run.events)
+    assert sum(DEFAULT_RUN.status_counts.values()) == before
+
+
+def test_copied_context_keeps_worker_steps_in_callers_run():
+    with run_context("caller") as run:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, log_step, f"part {i}") for i in range(200)]
+            for f in futures:
+                f.result()
+        assert current_run() is run
+    assert run.status_counts == {"PASS": 200}
+    assert len(run.events) == 200
+
+
+def test_concurrent_appends_keep_exact_totals():
+    run = RunReport("shared")
+
+    def append(worker):
+        for n in range(500):
+            run.append(StepEvent("Wait for OTP", "PASS", 0.0, 0.01, 0, "shared", worker))
+
+    threads = [threading.Thread(target=append, args=(f"w{i}",)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    count, total = run.step_times["Wait for OTP"]
+    assert run.status_counts == {"PASS": 4000} and count == 4000
+    assert abs(total - 40.0) < 1e-6
+
+
+def test_merge_reports():
+    first, second = RunReport("a"), RunReport("b")
+    first.append(StepEvent("Launch HP Smart", "PASS", 0.0, 2.0, 0, "a", "main"))
+    first.append(StepEvent("Wait for OTP", "PASS", 0.0, 5.0, 0, "a", "main"))
+    second.append(StepEvent("Launch HP Smart", "PASS", 0.0, 4.0, 0, "b", "main"))
+    second.append(StepEvent("Wait for OTP", "FAIL", 0.0, 60.0, 0, "b", "main"))
+    second.append(StepEvent("OTP not found", "INFO", 0.0, None, 1, "b", "main"))
+    first.add_wait(1.5)
+    second.add_wait(2.0)
+    # RunReports and summary() dicts (e.g. from other processes) merge alike
+    merged = merge_reports([first, second.summary()])
+    assert merged["runs"] == 2
+    assert merged["failed_runs"] == ["b"]
+    assert merged["status_counts"] == {"PASS": 3, "FAIL": 1, "INFO": 1}
+    assert merged["step_times"] == {"Launch HP Smart": [2, 6.0], "Wait for OTP": [2, 65.0]}
+    assert merged["wait_time"] == 3.5
+    assert merge_reports([])["runs"] == 0
+
+
+class FakeBackend:
+    def __init__(self):
+        self.inboxes = {}
+
+    def list_messages_batch(self, addresses):
+        return {a: self.inboxes[a] for a in addresses if a in self.inboxes}
+
+    def get_message_text(self, address, message_id):
+        return "Your HP verification code is 482913"
+
+
+def test_broker_logs_into_the_watching_flows_run():
+    backend = FakeBackend()
+    with OtpBroker(backend=backend, min_interval=0.01, max_wait=5) as broker:
+        with run_context("flow-a") as run:
+            future = broker.watch("a@mailsac.com")
+        backend.inboxes["a@mailsac.com"] = [{"_id": "1", "received": "2024-01-01T00:00:00Z"}]
+        assert future.result(timeout=5) == "482913"
+    assert [e.desc for e in run.events] == ["Extracted OTP for a@mailsac.com: 482913"]
+
+
+def test_html_rows_reach_disk_before_close(tmp_path):
+    path = tmp_path / "report.html"
+    with run_context("streamed", report_path=str(path)):
+        log_step("Launch HP Smart")
+        log_step("Fill account form", "FAIL")
+        streamed = path.read_text(encoding="utf-8")
+        assert ">Launch HP Smart</td>" in streamed and "<td>FAIL</td>" in streamed
+        assert HtmlSink.FOOTER not in streamed
+    assert path.read_text(encoding="utf-8").endswith(HtmlSink.FOOTER)
+
+
+def test_html_report_escapes_step_text(tmp_path):
+    path = tmp_path / "report.html"
+    with run_context("escaped", report_path=str(path)):
+        log_step("Email <b>a&b@mailsac.com</b>", "<PASS>")
+    text = path.read_text(encoding="utf-8")
+    assert "Email &lt;b&gt;a&amp;b@mailsac.com&lt;/b&gt;" in text and "&lt;PASS&gt;" in text
+    assert "<b>" not in text
+
+
+def test_buffer_size_bounds_events_but_not_totals():
+    with run_context("long") as run:
+        for n in range(config.REPORT_BUFFER_SIZE + 5):
+            log_step(f"step {n}", "PASS", duration=0.5)
+    assert len(run.events) == config.REPORT_BUFFER_SIZE
+    assert run.events[0].desc == "step 5"
+    assert run.status_counts == {"PASS": config.REPORT_BUFFER_SIZE + 5}
+
+
+def test_generate_report_closes_the_open_stream(tmp_path):
+    path = str(tmp_path / "report.html")
+    with run_context("flow") as run:
+        start_report(path, jsonl_path=None)
+        log_step("Launch HP Smart")
+        generate_report(path)
+        assert run.sinks == ()
+    text = open(path, encoding="utf-8").read()
+    assert text.count(">Launch HP Smart</td>") == 1 and text.endswith(HtmlSink.FOOTER)
+
+
+def test_generate_report_writes_buffered_steps_without_a_stream(tmp_path):
+    path = str(tmp_path / "nested" / "report.html")
+    with run_context("flow"):
+        log_step("Launch HP Smart")
+        log_step("Wait for OTP", "FAIL", duration=60)
+        generate_report(path)
+    text = open(path, encoding="utf-8").read()
+    assert text.startswith(HtmlSink.HEADER) and text.endswith(HtmlSink.FOOTER)
+    assert ">Wait for OTP</td><td>FAIL</td><td>60.00</td>" in text
+
+
+def test_nested_steps_log_depth_and_inner_steps_first():
+    with run_context("nested") as run:
+        with step("Sign up"):
+            log_step("Generated mailbox")
+            with step("Fill account form"):
+                log_step("Typed email")
+        log_step("Done")
+    assert [(e.desc, e.depth) for e in run.events] == [
+        ("Generated mailbox", 1), ("Typed email", 2), ("Fill account form", 1), ("Sign up", 0), ("Done", 0)]
+
+
+def test_step_fails_on_exception_and_restores_depth():
+    with run_context("failing") as run:
+        with pytest.raises(LookupError):
+            with step("Wait for OTP"):
+                raise LookupError("no mail")
+        with step("Teardown"):
+            pass
+    assert [(e.desc, e.status, e.depth) for e in run.events] == [("Wait for OTP", "FAIL", 0), ("Teardown", "PASS", 0)]
+
+
+def test_step_durations():
+    with run_context("timed") as run:
+        with step("Launch HP Smart"):
+            time.sleep(0.05)
+        log_step("Marker")
+        log_step("Waited for OTP field.", "INFO", duration=1.5)
+    launch, marker, waited = run.events
+    assert 0.05 <= launch.duration < 1 and launch.start <= marker.start
+    assert marker.duration is None and waited.duration == 1.5
+    assert run.step_times == {"Launch HP Smart": (1, launch.duration), "Waited for OTP field.": (1, 1.5)}
+
+
+def test_jsonl_sink_writes_one_event_per_line(tmp_path):
+    path = tmp_path / "events.jsonl"
+    with run_context("jsonl", jsonl_path=str(path)):
+        with step("Enter OTP and verify"):
+            log_step("OTP entered successfully.")
+    events = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(e["desc"], e["status"], e["depth"]) for e in events] == [
+        ("OTP entered successfully.", "PASS", 1), ("Enter OTP and verify", "PASS", 0)]
+    assert set(events[0]) == set(StepEvent._fields)
+    assert events[0]["duration"] is None and events[1]["duration"] >= 0
+    assert {e["run_id"] for e in events} == {"jsonl"} and events[0]["worker"] == threading.current_thread().name
+
+
+class ListSink:
+    def __init__(self):
+        self.events = []
+        self.closed = False
+
+    def write(self, event):
+        self.events.append(event)
+
+    def close(self):
+        self.closed = True
+
+
+def test_process_wide_sink_sees_every_run_until_removed():
+    sink = add_sink(ListSink())
+    try:
+        with run_context("a"):
+            log_step("from a")
+        with run_context("b"):
+            log_step("from b")
+    finally:
+        remove_sink(sink)
+    with run_context("c"):
+        log_step("after removal")
+    assert [(e.desc, e.run_id) for e in sink.events] == [("from a", "a"), ("from b", "b")]
+    assert sink.closed
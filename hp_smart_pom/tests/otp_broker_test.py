@@ -0,0 +1,58 @@
+import time
+from utils.logger import run_context
+from utils.otp_broker import OtpBroker
+
+MESSAGE = {"_id": "1", "received": "2024-01-01T00:00:00Z"}
+
+
+class FakeBackend:
+    def __init__(self, text="Your HP verification code is 482913", read_error=None):
+        self.inboxes = {}
+        self.text = text
+        self.read_error = read_error
+        self.reads = 0
+
+    def list_messages_batch(self, addresses):
+        return {a: self.inboxes[a] for a in addresses if a in self.inboxes}
+
+    def get_message_text(self, address, message_id):
+        self.reads += 1
+        if self.read_error is not None:
+            raise self.read_error
+        return self.text
+
+
+def test_otp_resolves_when_mail_arrives():
+    backend = FakeBackend()
+    with OtpBroker(backend=backend, min_interval=0.01, max_wait=5) as broker:
+        future = broker.watch("a@mailsac.com")
+        backend.inboxes["a@mailsac.com"] = [MESSAGE]
+        assert future.result(timeout=5) == "482913"
+
+
+def test_empty_inbox_resolves_none_at_deadline():
+    with OtpBroker(backend=FakeBackend(), min_interval=0.01, max_wait=0.1) as broker:
+        assert broker.watch("a@mailsac.com").result(timeout=2) is None
+
+
+def test_unreadable_mail_resolves_none_at_deadline():
+    backend = FakeBackend(read_error=ConnectionError("HTTP 500"))
+    backend.inboxes["a@mailsac.com"] = [MESSAGE]
+    with OtpBroker(backend=backend, min_interval=0.01, max_wait=0.2) as broker:
+        with run_context("flow-a") as run:
+            future = broker.watch("a@mailsac.com")
+        assert future.result(timeout=2) is None
+    assert backend.reads > 1
+    assert run.events[-1].status == "FAIL"
+    assert run.events[-1].desc == "Could not read the email for a@mailsac.com within 0.2s."
+
+
+def test_read_recovers_before_deadline():
+    backend = FakeBackend(read_error=ConnectionError("HTTP 500"))
+    backend.inboxes["a@mailsac.com"] = [MESSAGE]
+    with OtpBroker(backend=backend, min_interval=0.01, max_wait=5) as broker:
+        future = broker.watch("a@mailsac.com")
+        while backend.reads < 3:
+            time.sleep(0.005)
+        backend.read_error = None
+        assert future.result(timeout=5) == "482913"
@@ -0,0 +1,40 @@
+import json
+import os
+import re
+import pytest
+from utils.otp_extractor import extract_otp, newest_message, patterns_for
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "data", "otp_corpus.json")
+with open(CORPUS_PATH, encoding="utf-8") as f:
+    CORPUS = json.load(f)
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[case["name"] for case in CORPUS])
+def test_corpus(case):
+    assert extract_otp(case["raw"], case["sender"]) == case["expected"]
+
+
+def test_accuracy_beats_first_number_regex():
+    """The old OTP_REGEX took the first 4-8 digit run; the extractor must do strictly better."""
+    naive = sum(
+        (m.group(1) if (m := re.search(r"\b(\d{4,8})\b", case["raw"])) else None) == case["expected"]
+        for case in CORPUS
+    )
+    exact = sum(extract_otp(case["raw"], case["sender"]) == case["expected"] for case in CORPUS)
+    assert exact == len(CORPUS)
+    assert naive < exact
+
+
+def test_sender_patterns_are_compiled_once():
+    assert patterns_for("noreply@email.hp.com") is patterns_for("noreply@email.hp.com")
+    assert len(patterns_for("noreply@email.hp.com")) > len(patterns_for("someone@example.com"))
+
+
+def test_newest_message():
+    messages = [
+        {"_id": "old", "received": "2024-05-01T10:00:00.000Z"},
+        {"_id": "new", "received": "2024-05-01T10:05:00.000Z"},
+        {"_id": "mid", "received": "2024-05-01T10:02:00.000Z"},
+    ]
+    assert newest_message(messages)["_id"] == "new"
+    assert newest_message([]) is None
@@ -0,0 +1,69 @@
+import itertools
+import json
+from benchmarks.stubs import StubHpAccountPage, StubHpSmartApp, StubTimings
+from page_objects.mailsac_api import MailsacHttpBackend
+from parallel_runner import failure_reason, percentile, run_parallel, summarize
+from utils.fake_mailsac import FakeMailsac
+from utils.logger import RunReport, StepEvent
+from utils.otp_broker import OtpBroker
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert [percentile(values, p) for p in (50, 95, 99, 100)] == [50, 95, 99, 100]
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([1, 2, 3], 0) == 1
+    assert percentile([], 50) == 0.0
+
+
+def test_failure_reason_names_the_top_level_stage():
+    run = RunReport("r")
+    run.append(StepEvent("Fill account form", "PASS", 0.0, 1.0, 0, "r", "main"))
+    run.append(StepEvent("OTP not found in email", "FAIL", 0.0, None, 1, "r", "main"))
+    run.append(StepEvent("Wait for OTP", "FAIL", 0.0, 60.0, 0, "r", "main"))
+    assert failure_reason(run) == "Wait for OTP"
+    assert failure_reason(run, TimeoutError("late")) == "Wait for OTP: TimeoutError"
+    assert failure_reason(RunReport("empty")) == "unknown stage"
+
+
+def test_summarize_throughput_latency_and_failures():
+    results = [{"run": RunReport(f"r{i}"), "ok": i % 4 != 0, "latency": float(i),
+                "reason": None if i % 4 else "Wait for OTP"} for i in range(1, 21)]
+    summary = summarize(results, wall_time=30.0)
+    assert summary["accounts"] == 20 and summary["succeeded"] == 15
+    assert summary["accounts_per_minute"] == 30.0
+    assert (summary["latency_p50"], summary["latency_p95"], summary["latency_p99"]) == (10.0, 19.0, 20.0)
+    assert summary["failures"] == {"Wait for OTP": 5}
+    assert summary["steps"]["runs"] == 20
+    assert summarize([], 0)["accounts_per_minute"] == 0.0
+
+
+class WrongOtpAccountPage(StubHpAccountPage):
+    def enter_otp_and_submit(self, otp):
+        super().enter_otp_and_submit("000000")
+
+
+def test_run_parallel_with_stub_pages_and_fake_mailsac(tmp_path):
+    timings = StubTimings(time_scale=0.002, seed=0)
+    numbers = itertools.count()
+    with FakeMailsac(seed=0) as mailsac:
+        backend = MailsacHttpBackend(base_url=mailsac.api_url)
+
+        def make_ctx():
+            # Every fourth flow submits a wrong code and fails at the OTP entry stage
+            page = WrongOtpAccountPage if next(numbers) % 4 == 3 else StubHpAccountPage
+            return {"hp_app": StubHpSmartApp(timings), "hp_account": page(timings, mailsac),
+                    "popup_handler": lambda: None}
+
+        with OtpBroker(backend=backend, min_interval=0.01, max_wait=10) as broker:
+            summary = run_parallel(accounts=8, workers=4, report_dir=str(tmp_path), provider=broker,
+                                   make_ctx=make_ctx)
+        backend.close()
+    assert summary["accounts"] == 8 and summary["succeeded"] == 6
+    assert summary["failures"] == {"Enter OTP and verify": 2}
+    assert 0 < summary["latency_p50"] <= summary["latency_p95"] <= summary["latency_p99"] <= summary["wall_time"]
+    assert summary["accounts_per_minute"] > 0
+    assert summary["steps"]["runs"] == 8 and summary["steps"]["step_times"]["Wait for OTP"][0] == 8
+    with open(tmp_path / "summary.json", encoding="utf-8") as f:
+        assert json.load(f)["succeeded"] == 6
+    assert len(list(tmp_path.glob("signup_*.html"))) == 8
@@ -0,0 +1,58 @@
+import pytest
+from utils import poller
+from utils.poller import Poller
+
+
+class FakeClock:
+    """Stands in for the time module: sleep() advances monotonic() instead of blocking."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(poller, "time", clock)
+    return clock
+
+
+def inbox(counts):
+    """Probe returning successive message counts, the last one repeated."""
+    counts = list(counts)
+    return lambda: counts.pop(0) if len(counts) > 1 else counts[0]
+
+
+def test_returns_as_soon_as_value_changes(clock):
+    refreshes = []
+    result = Poller(initial_interval=1, factor=2, max_interval=5, max_wait=60).wait_for_change(
+        inbox([0, 0, 0, 1]), baseline=0, refresh=lambda: refreshes.append(clock.now))
+    assert result.changed and result.value == 1
+    assert result.polls == 4 and result.waited == 7
+    assert clock.sleeps == [1, 2, 4] and len(refreshes) == 3
+
+
+def test_immediate_change_does_not_sleep(clock):
+    result = Poller(max_wait=60).wait_for_change(lambda: 3, baseline=2)
+    assert result == (3, 1, 0.0, True)
+    assert clock.sleeps == []
+
+
+def test_times_out_without_overshooting_max_wait(clock):
+    result = Poller(initial_interval=1, factor=2, max_interval=5, max_wait=12).wait_for_change(lambda: 0)
+    assert not result.changed and result.value == 0
+    assert clock.sleeps == [1, 2, 4, 5] and result.waited == 12
+    assert result.polls == 5
+
+
+def test_backoff_grows_by_factor_and_caps_at_max_interval():
+    delays = Poller(initial_interval=0.5, factor=3, max_interval=10).delays()
+    assert [next(delays) for _ in range(6)] == [0.5, 1.5, 4.5, 10, 10, 10]
@@ -0,0 +1,16 @@
+from benchmarks.signup_bench import TOTAL, compare, run_stubbed, summarize
+
+
+def test_stubbed_flow_reports_every_stage():
+    samples, failures = run_stubbed(runs=2, time_scale=0.01, seed=0)
+    assert failures == 0
+    stages = summarize(samples)
+    for stage in ("Launch HP Smart", "Fill account form", "Wait for OTP", "Enter OTP and verify", TOTAL):
+        assert stages[stage]["n"] == 2
+    assert stages[TOTAL]["p50"] >= stages["Wait for OTP"]["p50"]
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = {"Launch": {"p50": 1.0}, "Fill": {"p50": 0.01}, "Wait": {"p50": 2.0}}
+    current = {"Launch": {"p50": 1.5}, "Fill": {"p50": 0.03}, "Wait": {"p50": 2.1}}
+    assert [r["stage"] for r in compare(current, baseline, threshold=0.25, min_delta=0.05)] == ["Launch"]
@@ -0,0 +1,78 @@
+from benchmarks.stubs import StubHpAccountPage, StubHpSmartApp, StubTimings
+from flows.signup import SIGNUP
+from page_objects.mailsac_page import MailsacPage
+from utils.driver_pool import DriverPool
+from utils.fake_mailsac import FakeMailsac
+
+
+class FakeDriver:
+    def __init__(self):
+        self.current_url = "about:blank"
+
+    def get(self, url):
+        self.current_url = url
+
+    def execute_script(self, script):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+def test_pooled_mailsac_page_leases_only_while_reading():
+    pool = DriverPool(factory=FakeDriver, size=1, lease_timeout=0.1)
+    page = MailsacPage(pool=pool)
+    assert page.driver is None and pool.leases == 0
+    page.open_mailsac()
+    assert page.driver.current_url == MailsacPage.MAILSAC_URL
+    page.release()
+    assert page.driver is None
+    # The single slot is free again for the next flow
+    other = MailsacPage(pool=pool)
+    other.open_mailsac()
+    other.quit()
+    page.quit()
+    assert pool.leases == 2 and pool.hits == 1
+
+
+class LeasingProvider:
+    """OTP provider that tracks whether it holds a browser lease, like a pooled MailsacPage."""
+
+    def __init__(self, account):
+        self.account = account
+        self.leased = False
+        self.held_after_otp = []
+
+    def open_mailsac(self):
+        self.leased = True
+
+    def fetch_otp(self, mailbox_local_part):
+        return self.account.expected_otp if self.leased else None
+
+    def release(self):
+        self.leased = False
+
+    def quit(self):
+        pass
+
+
+def test_signup_returns_browser_before_desktop_stages():
+    timings = StubTimings(time_scale=0)
+    with FakeMailsac(seed=0) as mailsac:
+        account = StubHpAccountPage(timings, mailsac)
+        provider = LeasingProvider(account)
+        original_enter = account.enter_otp_and_submit
+
+        def enter_otp_and_submit(otp):
+            provider.held_after_otp.append(provider.leased)
+            original_enter(otp)
+
+        account.enter_otp_and_submit = enter_otp_and_submit
+        ctx = {"hp_app": StubHpSmartApp(timings), "hp_account": account, "otp_provider": provider,
+               "popup_handler": lambda: None}
+        result = SIGNUP.run(ctx)
+    assert result.ok, result.failed
+    assert provider.held_after_otp == [False]
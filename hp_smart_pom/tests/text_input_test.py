@@ -0,0 +1,63 @@
+import re
+import pytest
+from utils.text_input import enter_text
+
+
+class FakeValuePattern:
+    def __init__(self, field):
+        self.field = field
+
+    @property
+    def CurrentValue(self):
+        return self.field.value
+
+    def SetValue(self, text):
+        # Models a field that ignores ValuePattern writes (or mangles them)
+        self.field.value = self.field.set_value_result(text)
+
+
+class FakeEdit:
+    def __init__(self, set_value_result=lambda text: text, password=False):
+        self.value = ""
+        self.set_value_result = set_value_result
+        self.iface_value = FakeValuePattern(self)
+        self.element_info = type("Info", (), {"element": type("Elem", (), {"CurrentIsPassword": password})()})()
+        self.keys = []
+
+    def click_input(self):
+        pass
+
+    def type_keys(self, keys, with_spaces=False, pause=None):
+        self.keys.append(keys)
+        # "^a{DEL}" clears the field; "{x}" types a literal x
+        self.value = re.sub(r"\{(.)\}", r"\1", keys.replace("^a{DEL}", "", 1))
+
+
+def test_set_value_is_used_when_it_reads_back():
+    field = FakeEdit()
+    assert enter_text(field, "Jane", "first name") == "set_value"
+    assert field.value == "Jane" and field.keys == []
+
+
+def test_mismatch_falls_back_to_keys():
+    field = FakeEdit(set_value_result=lambda text: text[:-1])
+    assert enter_text(field, "a+b(c)@x.com", "email", strategies=("set_value", "keys")) == "keys"
+    assert field.value == "a+b(c)@x.com"
+
+
+def test_password_fields_skip_set_value_and_are_typed():
+    field = FakeEdit(set_value_result=lambda text: "", password=True)
+    assert enter_text(field, "secret", "password", strategies=("set_value", "keys")) == "keys"
+    assert field.keys == ["^a{DEL}secret"]
+
+
+def test_password_field_with_only_set_value_still_gets_it():
+    field = FakeEdit(password=True)
+    assert enter_text(field, "secret", "password", strategies=("set_value",)) == "set_value"
+
+
+def test_all_strategies_failing_raises():
+    field = FakeEdit(set_value_result=lambda text: "")
+    field.type_keys = lambda *a, **k: None
+    with pytest.raises(RuntimeError, match="Could not enter email"):
+        enter_text(field, "x@y.com", "email", strategies=("set_value", "keys"))
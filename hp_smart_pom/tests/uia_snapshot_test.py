@@ -0,0 +1,40 @@
+from utils.uia_snapshot import UiaSnapshot
+
+# Same locators as SIGNUP_FORM (the page object needs pywinauto to import)
+SIGNUP_FORM = (dict(auto_id="firstName", control_type="Edit"), dict(auto_id="lastName", control_type="Edit"),
+               dict(auto_id="email", control_type="Edit"), dict(auto_id="password", control_type="Edit"),
+               dict(auto_id="sign-up-submit", control_type="Button"))
+
+
+def recorded_signup_tree():
+    """Columns as UiaSnapshot.save() writes them for the HP account signup window."""
+    rows = [("", "HP account - Google Chrome", "Pane", "Chrome_WidgetWin_1", -1),
+            ("", "HP account", "Document", "Chrome_RenderWidgetHostHWND", 0)]
+    for i in range(200):
+        rows.append((f"text-{i}", f"Label {i}", "Text", "", 1))
+    for auto_id, control_type in [("firstName", "Edit"), ("lastName", "Edit"), ("email", "Edit"),
+                                  ("password", "Edit"), ("sign-up-submit", "Button")]:
+        rows.append((auto_id, "", control_type, "", 1))
+    rows.append(("sign-up-submit", "", "Text", "", len(rows) - 1))
+    return {"columns": {name: [row[i] for row in rows] for i, name in
+                        enumerate(("auto_id", "title", "control_type", "class_name", "parent"))}}
+
+
+def test_lookup_by_page_object_locators():
+    snapshot = UiaSnapshot.from_dict(recorded_signup_tree())
+    for locator in SIGNUP_FORM:
+        node = snapshot.node(snapshot.find(**locator))
+        assert node["auto_id"] == locator["auto_id"]
+        assert node["control_type"] == locator["control_type"]
+    assert snapshot.find_all(auto_id="sign-up-submit") == [206, 207]
+    assert snapshot.find_all(auto_id="code", control_type="Edit") == []
+
+
+def test_round_trip_through_json(tmp_path):
+    snapshot = UiaSnapshot.from_dict(recorded_signup_tree())
+    path = tmp_path / "signup.json"
+    snapshot.save(path)
+    loaded = UiaSnapshot.load(path)
+    assert len(loaded) == len(snapshot)
+    assert loaded.find(**SIGNUP_FORM[2]) == snapshot.find(**SIGNUP_FORM[2])
+    assert loaded.find(title="HP account") == 1
@@ -0,0 +1,105 @@
+import pytest
+import config
+from utils import waits
+from utils.logger import run_context
+from utils.waits import wait_for, wait_for_element, wait_for_element_gone, wait_for_usable
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = 0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps += 1
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(waits, "time", clock)
+    return clock
+
+
+class FakeSpec:
+    """child_window() spec that starts existing on the appears_after-th exists() check (None: never)."""
+
+    def __init__(self, appears_after=None):
+        self.appears_after = appears_after
+        self.checks = 0
+
+    def exists(self, timeout=None):
+        assert timeout == 0
+        self.checks += 1
+        return self.appears_after is not None and self.checks >= self.appears_after
+
+
+class FakeWindow:
+    def __init__(self, spec):
+        self.spec = spec
+        self.locators = []
+
+    def child_window(self, **locator):
+        self.locators.append(locator)
+        return self.spec
+
+
+def test_element_already_there_returns_without_polling(clock):
+    window = FakeWindow(FakeSpec(appears_after=1))
+    with run_context("waits") as run:
+        assert wait_for_element(window, {"auto_id": "email"}, "email field", timeout=5) is window.spec
+    assert window.locators == [{"auto_id": "email"}] and clock.sleeps == 0
+    assert run.wait_time == 0.0
+    assert [e.desc for e in run.events] == ["Waited for email field."]
+
+
+def test_element_found_after_several_polls(clock):
+    window = FakeWindow(FakeSpec(appears_after=4))
+    with run_context("waits") as run:
+        wait_for_element(window, {"auto_id": "code"}, "OTP field", timeout=5)
+    assert window.spec.checks == 4 and clock.sleeps == 3
+    assert run.wait_time == pytest.approx(3 * config.WAIT_POLL_INTERVAL)
+    assert run.events[-1].duration == run.wait_time
+
+
+def test_timeout_raises_timeout_error(clock):
+    window = FakeWindow(FakeSpec())
+    with run_context("waits") as run, pytest.raises(TimeoutError, match="waiting for OTP field"):
+        wait_for_element(window, {"auto_id": "code"}, "OTP field", timeout=2)
+    # Timed-out waits count towards the run's wait time too
+    assert clock.now >= 2 and run.wait_time == clock.now
+
+
+def test_condition_errors_count_as_not_yet(clock):
+    answers = iter([RuntimeError("element torn down"), False, "ready"])
+
+    def condition():
+        answer = next(answers)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    with run_context("waits"):
+        assert wait_for(condition, "page change", timeout=5) == "ready"
+    assert clock.sleeps == 2
+
+
+def test_element_gone_and_usable(clock):
+    with run_context("waits"):
+        wait_for_element_gone(FakeWindow(FakeSpec()), {"auto_id": "spinner"}, "spinner gone", timeout=1)
+        element = type("Element", (), {"is_visible": lambda self: True, "is_enabled": lambda self: True})()
+        assert wait_for_usable(element, "submit button") is element
+    assert clock.sleeps == 0
+
+
+def test_wait_time_stays_in_each_run(clock):
+    with run_context("first") as first:
+        wait_for_element(FakeWindow(FakeSpec(appears_after=3)), {"auto_id": "code"}, "OTP field", timeout=5)
+    with run_context("second") as second:
+        wait_for_element(FakeWindow(FakeSpec(appears_after=1)), {"auto_id": "code"}, "OTP field", timeout=5)
+    assert first.wait_time == pytest.approx(2 * config.WAIT_POLL_INTERVAL) and second.wait_time == 0.0
+    assert first.summary()["wait_time"] == first.wait_time
@@ -1 +1,6 @@
-from .utils import click_open_hp_smart
+def __getattr__(name):
+    # Resolved on first use so importing utils.* submodules does not pull in pywinauto
+    if name == "click_open_hp_smart":
+        from .utils import click_open_hp_smart
+        return click_open_hp_smart
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,59 @@
+# utils/browser.py
+import shutil
+import tempfile
+from selenium import webdriver
+import config
+
+
+class ProfileChrome(webdriver.Chrome):
+    """Chrome that deletes its throwaway profile directory on quit()."""
+    profile_dir = None
+
+    def quit(self):
+        try:
+            super().quit()
+        finally:
+            if self.profile_dir:
+                shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+def chrome_options(headless=config.CHROME_HEADLESS, extra_args=config.CHROME_BINARY_ARGS, lean=config.CHROME_LEAN,
+                   profile_dir=None):
+    """ChromeOptions for the Mailsac browser; lean trims everything the OTP scrape does not need."""
+    opts = webdriver.ChromeOptions()
+    if headless:
+        opts.add_argument('--headless=new')
+    if lean:
+        opts.page_load_strategy = config.CHROME_PAGE_LOAD_STRATEGY
+        if config.CHROME_DISABLE_EXTENSIONS:
+            opts.add_argument('--disable-extensions')
+        if config.CHROME_DISABLE_GPU:
+            opts.add_argument('--disable-gpu')
+        if config.CHROME_BLOCK_IMAGES:
+            opts.add_argument('--blink-settings=imagesEnabled=false')
+            opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        for arg in ('--no-first-run', '--disable-background-networking', '--disable-sync', '--mute-audio'):
+            opts.add_argument(arg)
+    if profile_dir:
+        opts.add_argument(f'--user-data-dir={profile_dir}')
+    for arg in extra_args:
+        opts.add_argument(arg)
+    return opts
+
+
+def create_chrome_driver(headless=config.CHROME_HEADLESS, extra_args=config.CHROME_BINARY_ARGS, lean=config.CHROME_LEAN):
+    profile_dir = None
+    if lean and config.CHROME_PROFILE_ROOT:
+        profile_dir = tempfile.mkdtemp(prefix="mailsac-chrome-", dir=config.CHROME_PROFILE_ROOT)
+    try:
+        driver = ProfileChrome(options=chrome_options(headless, extra_args, lean, profile_dir))
+    except Exception:
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        raise
+    driver.profile_dir = profile_dir
+    if lean and config.CHROME_BLOCKED_URLS:
+        # Fonts, ads and analytics are dropped before a request is sent; this survives pool resets
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(config.CHROME_BLOCKED_URLS)})
+    return driver
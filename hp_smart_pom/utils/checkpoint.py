@@ -0,0 +1,82 @@
+# utils/checkpoint.py
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+import config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    flow TEXT NOT NULL,
+    run_key TEXT NOT NULL,
+    step TEXT NOT NULL,
+    data TEXT NOT NULL,
+    saved_at REAL NOT NULL,
+    PRIMARY KEY (flow, run_key, step)
+)
+"""
+
+
+class CheckpointStore:
+    """Completed flow steps and the context they produced, in SQLite so they survive a crash.
+
+    Every call opens its own short connection and commits before returning, so a checkpoint
+    is on disk as soon as save() returns and the store can be shared by threads and processes.
+    """
+
+    def __init__(self, path=config.CHECKPOINT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(SCHEMA)
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30, isolation_level=None))
+
+    @staticmethod
+    def new_key():
+        return uuid.uuid4().hex[:12]
+
+    def save(self, flow, run_key, step, data=None):
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?)",
+                (flow, run_key, step, json.dumps(data or {}), time.time()),
+            )
+
+    def load(self, flow, run_key):
+        """{step: data} for every checkpoint of the run, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT step, data FROM checkpoints WHERE flow = ? AND run_key = ? ORDER BY saved_at",
+                (flow, run_key),
+            ).fetchall()
+        return {step: json.loads(data) for step, data in rows}
+
+    def latest(self, flow):
+        """Key of the most recently checkpointed unfinished run of flow, or None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT run_key FROM checkpoints WHERE flow = ? ORDER BY saved_at DESC LIMIT 1", (flow,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def clear(self, flow, run_key):
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM checkpoints WHERE flow = ? AND run_key = ?", (flow, run_key))
+
+    def prune(self, max_age=config.CHECKPOINT_RETENTION_HOURS * 3600):
+        """Drop every run whose newest checkpoint is older than max_age seconds; returns how many."""
+        cutoff = time.time() - max_age
+        with self._lock, self._connect() as conn:
+            stale = conn.execute(
+                "SELECT flow, run_key FROM checkpoints GROUP BY flow, run_key HAVING MAX(saved_at) < ?", (cutoff,)
+            ).fetchall()
+            conn.executemany("DELETE FROM checkpoints WHERE flow = ? AND run_key = ?", stale)
+        return len(stale)
@@ -0,0 +1,170 @@
+# utils/driver_pool.py
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from utils.logger import log_step
+import config
+
+
+class DriverPool:
+    """Keeps warm WebDriver instances and hands them out one lease at a time.
+
+    Drivers are health-checked before reuse, wiped (cookies, storage, about:blank) when returned,
+    and replaced after max_uses leases or when a lease ends with the browser unresponsive.
+    """
+
+    def __init__(self, factory=None, size=config.DRIVER_POOL_SIZE, max_uses=config.DRIVER_MAX_USES,
+                 lease_timeout=config.DRIVER_LEASE_TIMEOUT):
+        if factory is None:
+            from utils.browser import create_chrome_driver
+            factory = create_chrome_driver
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.lease_timeout = lease_timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._uses = {}
+        self._lock = threading.Lock()
+        self.leases = 0
+        self.hits = 0
+        self.created = 0
+        self.recycled = 0
+        self.total_wait = 0.0
+        self.max_lease_wait = 0.0
+
+    def warm(self, count=None):
+        """Start drivers up front so the first leases are hits."""
+        for _ in range(min(count or self.size, self.size) - self._idle.qsize()):
+            self._idle.put(self._create())
+
+    def acquire(self, timeout=None):
+        start = time.monotonic()
+        timeout = self.lease_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No WebDriver free in pool after {timeout}s")
+        try:
+            driver = self._take_idle()
+            hit = driver is not None
+            if driver is None:
+                driver = self._create()
+        except Exception:
+            self._slots.release()
+            raise
+        waited = time.monotonic() - start
+        with self._lock:
+            self.leases += 1
+            self.hits += hit
+            self.total_wait += waited
+            self.max_lease_wait = max(self.max_lease_wait, waited)
+        return driver
+
+    def release(self, driver, broken=False):
+        try:
+            with self._lock:
+                self._uses[driver] = self._uses.get(driver, 0) + 1
+                worn_out = self._uses[driver] >= self.max_uses
+            if broken or worn_out or not self._reset(driver):
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def lease(self, timeout=None):
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not self._healthy(driver)
+            raise
+        finally:
+            self.release(driver, broken)
+
+    def stats(self):
+        return {
+            "leases": self.leases,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.leases if self.leases else 0.0,
+            "created": self.created,
+            "recycled": self.recycled,
+            "avg_lease_wait": self.total_wait / self.leases if self.leases else 0.0,
+            "max_lease_wait": self.max_lease_wait,
+        }
+
+    def report(self):
+        s = self.stats()
+        log_step(
+            f"Driver pool: {s['leases']} leases, hit rate {s['hit_rate']:.0%}, {s['created']} started, "
+            f"{s['recycled']} recycled, lease wait avg {s['avg_lease_wait']:.2f}s / max {s['max_lease_wait']:.2f}s",
+            "INFO",
+        )
+
+    def close(self):
+        while True:
+            try:
+                self._discard(self._idle.get_nowait(), recycled=False)
+            except queue.Empty:
+                break
+
+    def _create(self):
+        driver = self.factory()
+        with self._lock:
+            self.created += 1
+            self._uses[driver] = 0
+        return driver
+
+    def _take_idle(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if self._healthy(driver):
+                return driver
+            self._discard(driver)
+
+    def _healthy(self, driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        try:
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass  # about:blank and some error pages have no storage
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver, recycled=True):
+        with self._lock:
+            self._uses.pop(driver, None)
+            if recycled:
+                self.recycled += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+_shared_pool = None
+_shared_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """Process-wide pool shared by every flow in this run."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = DriverPool()
+        return _shared_pool
@@ -0,0 +1,280 @@
+# utils/fake_mailsac.py
+"""Local stand-in for mailsac.com: the inbox web UI MailsacPage drives plus the JSON API MailsacApi reads.
+
+Run from hp_smart_pom:  python -m utils.fake_mailsac --port 8025
+then point the flows at it with MAILSAC_URL=http://127.0.0.1:8025 MAILSAC_API_URL=http://127.0.0.1:8025/api
+Other processes inject mail and faults by POSTing JSON to /_control/deliver, /_control/fault and /_control/reset.
+"""
+import argparse
+import html
+import itertools
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+import config
+
+# Fault names accepted by inject_fault()
+FAULTS = ("slow_response", "empty_inbox", "malformed_body", "server_error")
+
+OTP_EMAIL_HTML = (
+    "<html><body><table><tr><td><h1>HP account</h1></td></tr>"
+    "<tr><td><p>Use this verification code to finish creating your HP account:</p></td></tr>"
+    "<tr><td><b>{otp}</b></td></tr>"
+    "<tr><td><p>The code expires in 10 minutes. Need help? Call 1-800-474-6836.</p></td></tr>"
+    "</table></body></html>"
+)
+
+PAGE = "<!DOCTYPE html><html><head><meta charset='utf-8'><title>{title}</title></head><body>{body}</body></html>"
+CHECK_FORM = (
+    "<form method='get' action='/inbox'>"
+    "<input name='mailbox' placeholder='mailbox' value='{mailbox}'>"
+    "<button type='submit'>Check the mail!</button></form>"
+)
+
+
+class FakeMailsac:
+    """Threaded HTTP server holding inboxes in memory.
+
+    Messages are added with deliver() (optionally after a delay, to mimic mail transit) and served
+    newest first. Faults injected with inject_fault() apply to a fraction of requests until cleared.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, domain=config.MAIL_DOMAIN, seed=None):
+        self.domain = domain
+        self._inboxes = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._faults = {}
+        self._random = random.Random(seed)
+        self.slow_response_delay = 2.0
+        self.requests = {}
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.mailsac = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        return self.url + "/api"
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05},
+                                            name="fake-mailsac", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # Mail
+
+    def address(self, mailbox):
+        return mailbox if "@" in mailbox else f"{mailbox}@{self.domain}"
+
+    def deliver(self, mailbox, body, sender="no-reply@hp.com", subject="Your HP account verification code", delay=0.0):
+        """Queue a message; it shows up in the inbox delay seconds from now. Returns its id."""
+        address = self.address(mailbox)
+        visible_at = time.monotonic() + delay
+        message = {
+            "_id": f"msg{next(self._ids):06d}",
+            "from": [{"address": sender, "name": ""}],
+            "to": [{"address": address, "name": ""}],
+            "subject": subject,
+            "received": (datetime.now(timezone.utc) + timedelta(seconds=delay)).isoformat(),
+            "body": body,
+        }
+        with self._lock:
+            self._inboxes.setdefault(address.lower(), []).append((visible_at, message))
+        return message["_id"]
+
+    def deliver_otp(self, mailbox, otp=None, delay=0.0):
+        """Deliver an HP-style verification email and return the code in it."""
+        otp = otp or f"{self._random.randrange(10 ** 6):06d}"
+        self.deliver(mailbox, OTP_EMAIL_HTML.format(otp=otp), delay=delay)
+        return otp
+
+    def messages(self, mailbox):
+        """Messages visible now, newest first."""
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._inboxes.get(self.address(mailbox).lower(), ()))
+        return [m for visible_at, m in sorted(entries, key=lambda e: e[0], reverse=True) if visible_at <= now]
+
+    def message(self, mailbox, message_id):
+        return next((m for m in self.messages(mailbox) if m["_id"] == message_id), None)
+
+    def clear(self, mailbox=None):
+        with self._lock:
+            if mailbox is None:
+                self._inboxes.clear()
+            else:
+                self._inboxes.pop(self.address(mailbox).lower(), None)
+
+    # Faults
+
+    def inject_fault(self, name, rate=1.0):
+        """Make a fraction (rate) of requests hit the fault: one of FAULTS."""
+        if name not in FAULTS:
+            raise ValueError(f"Unknown fault {name!r}; expected one of {FAULTS}")
+        self._faults[name] = rate
+
+    def clear_faults(self):
+        self._faults.clear()
+
+    def _hit(self, name):
+        rate = self._faults.get(name)
+        return rate is not None and self._random.random() < rate
+
+    def _count(self, route):
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+
+def _malformed(body):
+    """Cut the body off mid-way and mangle it, the way a broken relay or renderer would."""
+    cut = body[: len(body) // 3]
+    return cut.translate(str.maketrans("0123456789", "OIZEASGTBQ")) + "\ufffd\ufffd<"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body go out in separate writes; without this keep-alive clients stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        mailsac = self.server.mailsac
+        parts = urlsplit(self.path)
+        segments = [unquote(s) for s in parts.path.split("/") if s]
+        route = "/".join(segments[:2]) if segments[:1] == ["api"] else (segments[0] if segments else "home")
+        mailsac._count(route)
+        if mailsac._hit("slow_response"):
+            time.sleep(mailsac.slow_response_delay)
+        if mailsac._hit("server_error"):
+            return self._send(500, "text/plain", "Internal Server Error")
+        try:
+            if segments[:1] == ["api"]:
+                return self._api(mailsac, segments[1:])
+            return self._ui(mailsac, segments, parse_qs(parts.query))
+        except LookupError as e:
+            return self._send(404, "text/plain", str(e))
+
+    def do_POST(self):
+        mailsac = self.server.mailsac
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            action = urlsplit(self.path).path.rstrip("/")
+            if action == "/_control/deliver":
+                if "body" in payload:
+                    mailsac.deliver(payload["mailbox"], payload["body"], delay=payload.get("delay", 0.0))
+                    result = {}
+                else:
+                    result = {"otp": mailsac.deliver_otp(payload["mailbox"], payload.get("otp"), payload.get("delay", 0.0))}
+            elif action == "/_control/fault":
+                mailsac.inject_fault(payload["name"], payload.get("rate", 1.0))
+                result = {}
+            elif action == "/_control/reset":
+                mailsac.clear_faults()
+                mailsac.clear()
+                result = {}
+            else:
+                return self._send(404, "text/plain", f"No control route {self.path}")
+        except (KeyError, ValueError) as e:
+            return self._send(400, "text/plain", f"Bad control request: {e}")
+        return self._send(200, "application/json", json.dumps(result))
+
+    def _send(self, status, content_type, text, location=None):
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if location:
+            self.send_header("Location", location)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _messages(self, mailsac, address):
+        return [] if mailsac._hit("empty_inbox") else mailsac.messages(address)
+
+    def _body(self, mailsac, address, message_id):
+        message = mailsac.message(address, message_id)
+        if message is None:
+            raise LookupError(f"No message {message_id} for {address}")
+        return _malformed(message["body"]) if mailsac._hit("malformed_body") else message["body"]
+
+    # JSON API, same routes as https://mailsac.com/api
+
+    def _api(self, mailsac, segments):
+        if len(segments) == 3 and segments[0] == "addresses" and segments[2] == "messages":
+            listing = [{k: v for k, v in m.items() if k != "body"} for m in self._messages(mailsac, segments[1])]
+            return self._send(200, "application/json", json.dumps(listing))
+        if len(segments) == 3 and segments[0] == "text":
+            return self._send(200, "text/plain", self._body(mailsac, segments[1], segments[2]))
+        raise LookupError(f"No API route for {self.path}")
+
+    # Web UI with the markup MailsacPage locates: mailbox input, check button, inbox-table rows, #emailBody
+
+    def _ui(self, mailsac, segments, query):
+        if not segments:
+            return self._page("Mailsac", CHECK_FORM.format(mailbox=""))
+        if segments == ["inbox"]:
+            mailbox = query.get("mailbox", [""])[0].strip()
+            return self._send(303, "text/html", "", location=f"/inbox/{mailsac.address(mailbox)}")
+        if segments[0] == "inbox" and len(segments) == 2:
+            address = segments[1]
+            rows = "".join(
+                f"<tr class='clickable' onclick=\"location.href='/inbox/{html.escape(address)}/{m['_id']}'\">"
+                f"<td>{html.escape(m['from'][0]['address'])}</td><td>{html.escape(m['subject'])}</td>"
+                f"<td>{m['received']}</td></tr>"
+                for m in self._messages(mailsac, address)
+            )
+            form = CHECK_FORM.format(mailbox=html.escape(address.split("@")[0]))
+            return self._page(address, f"{form}<table class='table inbox-table'><tbody>{rows}</tbody></table>")
+        if segments[0] == "inbox" and len(segments) == 3:
+            body = self._body(mailsac, segments[1], segments[2])
+            return self._page(segments[1], f"<div id='emailBody'>{body}</div>")
+        raise LookupError(f"No page at {self.path}")
+
+    def _page(self, title, body):
+        return self._send(200, "text/html", PAGE.format(title=html.escape(title), body=body))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local fake Mailsac (web UI and JSON API).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    args = parser.parse_args()
+    with FakeMailsac(args.host, args.port) as mailsac:
+        print(f"Fake Mailsac on {mailsac.url} (API {mailsac.api_url}); Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
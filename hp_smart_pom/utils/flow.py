@@ -0,0 +1,132 @@
+# utils/flow.py
+from collections import namedtuple
+from utils.logger import log_step, step, run_context, start_report, generate_report
+import config
+
+# name: the action's function name, used in needs=; desc: the report line for the step
+# checkpoint: None, or the ctx keys to persist once the step passes (an empty tuple just marks it done)
+FlowStep = namedtuple("FlowStep", "name desc action needs desktop optional checkpoint")
+# run: the RunReport the flow logged into, set by run_flow
+FlowResult = namedtuple("FlowResult", "ok ctx failed skipped run_key run", defaults=(None,))
+
+
+class FlowError(Exception):
+    """Raised by a step action to fail the step with a readable reason."""
+
+
+class Flow:
+    """A flow as a graph of named steps over the page objects.
+
+    Steps are registered with the @flow.step decorator. Each action takes the flow context
+    (a dict shared by every step) and may return a dict to merge into it. A step runs once all
+    of its needs have passed; if one of them failed the step is skipped. Steps marked desktop
+    drive the UI and run under the caller's desktop lock, which is held across consecutive
+    desktop steps so no other flow can take focus in between. Teardowns always run, last.
+
+    With a CheckpointStore, checkpointed steps are saved as they pass. Running again with the
+    same run_key restores their context and skips them and everything they needed, so a run
+    that failed late resumes from its last good stage. A run that passes clears its checkpoints.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.steps = {}
+        self.teardowns = []
+
+    def step(self, desc, needs=(), desktop=False, optional=False, checkpoint=None):
+        """Register an action as a step. optional steps may fail without failing the flow."""
+        def register(action):
+            unknown = [n for n in needs if n not in self.steps]
+            if unknown:
+                raise ValueError(f"{self.name}: step {action.__name__!r} needs undefined steps {unknown}")
+            self.steps[action.__name__] = FlowStep(action.__name__, desc, action, tuple(needs), desktop, optional,
+                                                    None if checkpoint is None else tuple(checkpoint))
+            return action
+        return register
+
+    def teardown(self, action):
+        self.teardowns.append(action)
+        return action
+
+    def restored_steps(self, saved):
+        """Saved steps plus everything they (transitively) needed: the part of the flow already done."""
+        done = set()
+        stack = [name for name in saved if name in self.steps]
+        while stack:
+            name = stack.pop()
+            if name not in done:
+                done.add(name)
+                stack.extend(self.steps[name].needs)
+        return done
+
+    def run(self, ctx=None, desktop_lock=None, store=None, run_key=None):
+        ctx = {} if ctx is None else ctx
+        failed, skipped = [], []
+        holding = False
+        restored = set()
+        if store is not None:
+            run_key = run_key or store.new_key()
+            saved = store.load(self.name, run_key)
+            for data in saved.values():
+                ctx.update(data)
+            restored = self.restored_steps(saved)
+            if restored:
+                log_step(f"Resuming {self.name} run {run_key} after {len(restored)} completed steps.", "INFO")
+        try:
+            # Steps can only need steps defined before them, so definition order is a valid order
+            for s in self.steps.values():
+                if s.name in restored:
+                    log_step(f"{s.desc} restored from checkpoint", "INFO")
+                    continue
+                blocked = [n for n in s.needs if n in failed or n in skipped]
+                if blocked:
+                    log_step(f"{s.desc} skipped: {', '.join(blocked)} did not pass", "SKIP")
+                    skipped.append(s.name)
+                    continue
+                if desktop_lock is not None and s.desktop != holding:
+                    if s.desktop:
+                        desktop_lock.acquire()
+                    else:
+                        desktop_lock.release()
+                    holding = s.desktop
+                try:
+                    with step(s.desc):
+                        result = s.action(ctx)
+                except Exception as e:
+                    log_step(f"{s.desc}: {type(e).__name__}: {e}", "INFO")
+                    if not s.optional:
+                        failed.append(s.name)
+                    continue
+                if result:
+                    ctx.update(result)
+                if store is not None and s.checkpoint is not None:
+                    store.save(self.name, run_key, s.name, {key: ctx[key] for key in s.checkpoint if key in ctx})
+        finally:
+            if holding:
+                desktop_lock.release()
+            for action in self.teardowns:
+                try:
+                    action(ctx)
+                except Exception as e:
+                    log_step(f"{self.name} teardown {action.__name__} failed: {e}", "FAIL")
+        ok = not failed and not skipped
+        if ok and store is not None:
+            store.clear(self.name, run_key)
+        return FlowResult(ok, ctx, failed, skipped, run_key)
+
+
+def run_flow(flow, ctx=None, report_path=config.REPORT_PATH, desktop_lock=None, store=None, resume=config.FLOW_RESUME):
+    """Run a flow as its own reported run: steps stream to report_path as they happen.
+
+    With a store, checkpoints are kept; resume=True picks up the flow's latest unfinished run.
+    A successful run clears its own checkpoints, and abandoned runs past the retention window are pruned.
+    """
+    if store is not None:
+        store.prune()
+    run_key = store.latest(flow.name) if store is not None and resume else None
+    with run_context(flow.name) as run:
+        start_report(report_path)
+        try:
+            return flow.run(ctx, desktop_lock, store, run_key)._replace(run=run)
+        finally:
+            generate_report(report_path)
@@ -1,11 +1,19 @@
 # utils/helpers.py
 import random
 import string
+import warnings
+from utils.identity import default_generator
 import config
 
-def generate_random_mailbox(prefix_len=config.MAILBOX_PREFIX_LEN, domain=config.MAIL_DOMAIN):
-    prefix = ''.join(random.choices(string.ascii_lowercase, k=prefix_len))
-    return f"{prefix}test@{domain}"
+def generate_random_mailbox(prefix_len=None, domain=config.MAIL_DOMAIN):
+    """Unique mailbox from the shared IdentityGenerator (no reuse within a run or across workers).
+
+    prefix_len is deprecated and ignored: the local part is now fixed width plus a counter.
+    """
+    if prefix_len is not None:
+        warnings.warn("generate_random_mailbox(prefix_len) is deprecated and ignored", DeprecationWarning, stacklevel=2)
+    local_part = default_generator().next_mailbox().split("@")[0]
+    return f"{local_part}@{domain}"
 
 def generate_random_name(first_len=config.FIRSTNAME_LEN, last_len=config.LASTNAME_LEN):
     first = ''.join(random.choices(string.ascii_letters, k=first_len)).capitalize()
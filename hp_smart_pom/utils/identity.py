@@ -0,0 +1,95 @@
+# utils/identity.py
+import os
+import threading
+import time
+from collections import deque
+import config
+
+DIGITS36 = "0123456789abcdefghijklmnopqrstuvwxyz"
+TIME_WIDTH = 8     # base36 milliseconds since the epoch, good until 2059
+WORKER_WIDTH = 5   # base36 worker id, up to 60M distinct workers
+
+# Counter blocks are handed out process-wide, so every generator in this process draws
+# from the same sequence and threads never see the same number twice
+_counter_lock = threading.Lock()
+_next_counter = 0
+
+
+def base36(value, width):
+    digits = []
+    rest = value
+    while rest:
+        rest, rem = divmod(rest, 36)
+        digits.append(DIGITS36[rem])
+    text = "".join(reversed(digits)) or "0"
+    if len(text) > width:
+        raise ValueError(f"{value} does not fit in {width} base36 digits")
+    return text.rjust(width, "0")
+
+
+def _reserve(count):
+    global _next_counter
+    with _counter_lock:
+        start = _next_counter
+        _next_counter += count
+    return start
+
+
+class IdentityGenerator:
+    """Mailbox addresses that cannot collide within a run or across concurrent workers.
+
+    The local part is <creation time in ms><worker id><hex counter>test. The first two fields are
+    fixed width, so two generators only share a prefix if they share both a worker id and a
+    creation millisecond, and then the process-wide counter still keeps them apart. Give each
+    host or process a distinct worker id (the default is the pid). Addresses are produced in
+    batches; an optional ledger file records every address issued and is checked so reruns never
+    reuse one.
+    """
+
+    def __init__(self, worker_id=config.IDENTITY_WORKER_ID, domain=config.MAIL_DOMAIN,
+                 batch_size=config.IDENTITY_BATCH_SIZE, ledger_path=config.IDENTITY_LEDGER_PATH):
+        self.prefix = base36(int(time.time() * 1000), TIME_WIDTH) + base36(worker_id, WORKER_WIDTH)
+        self.domain = domain
+        self.batch_size = batch_size
+        self.ledger_path = ledger_path
+        self.used = set()
+        if ledger_path and os.path.exists(ledger_path):
+            with open(ledger_path, encoding="utf-8") as f:
+                self.used = {line.strip() for line in f if line.strip()}
+        self._ledger = open(ledger_path, "a", encoding="utf-8", buffering=1) if ledger_path else None
+        self._ready = deque()
+        self._lock = threading.Lock()
+
+    def batch(self, count=None):
+        """Return count fresh mailbox addresses."""
+        count = count or self.batch_size
+        start = _reserve(count)
+        prefix, domain = self.prefix, self.domain
+        mailboxes = [f"{prefix}{n:x}test@{domain}" for n in range(start, start + count)]
+        if self._ledger is not None:
+            mailboxes = [m for m in mailboxes if m not in self.used]
+            self.used.update(mailboxes)
+            self._ledger.write("".join(m + "\n" for m in mailboxes))
+        return mailboxes
+
+    def next_mailbox(self):
+        with self._lock:
+            if not self._ready:
+                self._ready.extend(self.batch())
+            return self._ready.popleft()
+
+    def close(self):
+        if self._ledger is not None:
+            self._ledger.close()
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_generator():
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = IdentityGenerator()
+        return _default
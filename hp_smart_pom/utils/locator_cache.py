@@ -0,0 +1,104 @@
+# utils/locator_cache.py
+import threading
+from utils.uia_snapshot import UiaSnapshot
+
+# locator keys used by the page objects -> pywinauto element_info attribute
+LOCATOR_PROPS = {
+    "auto_id": "automation_id",
+    "title": "name",
+    "control_type": "control_type",
+    "class_name": "class_name",
+}
+
+
+def _key(locator):
+    return tuple(sorted(locator.items()))
+
+
+def matches(info, locator):
+    for name, expected in locator.items():
+        if name not in LOCATOR_PROPS:
+            raise ValueError(f"Unsupported locator key for cached lookup: {name}")
+        if getattr(info, LOCATOR_PROPS[name]) != expected:
+            return False
+    return True
+
+
+class LocatorCache:
+    """Resolved element wrappers keyed by window handle and locator dict.
+
+    A miss captures the window's UIA subtree once (UiaSnapshot) and resolves every locator
+    passed to prime() (or just the requested one) from it. Cached wrappers are checked with a
+    single property read before reuse; a stale wrapper means the page changed or the window
+    closed, so every entry for that window is dropped.
+    """
+
+    def __init__(self):
+        self._windows = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.walks = 0
+
+    def prime(self, window, locators):
+        """Resolve several locators from one subtree capture. window is a resolved wrapper."""
+        self.walks += 1
+        try:
+            snapshot = UiaSnapshot.capture(window)
+        except Exception:
+            found = self._walk(window, locators)
+        else:
+            found = {}
+            for locator in locators:
+                hits = snapshot.find_all(**locator)
+                if hits:
+                    found[_key(locator)] = snapshot.wrapper(hits[0])
+        with self._lock:
+            self._windows.setdefault(window.handle, {}).update(found)
+        return found
+
+    @staticmethod
+    def _walk(window, locators):
+        """Fallback for windows that refuse a cached subtree request: one descendants() walk."""
+        pending = {_key(locator): locator for locator in locators}
+        found = {}
+        for element in window.descendants():
+            info = element.element_info
+            for key, locator in list(pending.items()):
+                if matches(info, locator):
+                    found[key] = element
+                    del pending[key]
+            if not pending:
+                break
+        return found
+
+    def find(self, window, locator):
+        key = _key(locator)
+        with self._lock:
+            element = self._windows.get(window.handle, {}).get(key)
+        if element is not None:
+            if self._alive(element):
+                self.hits += 1
+                return element
+            self.evict(window)
+        self.misses += 1
+        element = self.prime(window, [locator]).get(key)
+        if element is None:
+            raise LookupError(f"No element matching {locator} in window {window.handle}")
+        return element
+
+    def evict(self, window=None):
+        """Forget one window's elements (after navigation or close), or everything."""
+        with self._lock:
+            if window is None:
+                self._windows.clear()
+            else:
+                self._windows.pop(window.handle, None)
+
+    @staticmethod
+    def _alive(element):
+        try:
+            element.element_info.enabled
+            return True
+        except Exception:
+            return False
@@ -1,18 +1,257 @@
 # utils/logger.py
-REPORT = []
+import html
+import json
+import os
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+import config
 
-def log_step(desc: str, status: str = "PASS") -> None:
-    REPORT.append((desc, status))
-    print(f"{desc}: {status}")
+# start is time.monotonic(); duration is None for point steps logged with log_step()
+StepEvent = namedtuple("StepEvent", "desc status start duration depth run_id worker")
 
-def generate_report(path: str = "automation_report.html") -> None:
-    html = (
-        "<html><head><meta charset='utf-8'><title>Automation Report</title></head><body>"
-        "<h2>HP Account Automation Report</h2><table border='1'><tr><th>Step</th><th>Status</th></tr>"
+_depth = ContextVar("step_depth", default=0)
+
+
+class RunReport:
+    """Steps of one run. Each flow (thread, task or process) logs into its own RunReport.
+
+    Threads the flow hands work to (copied contexts, the OTP broker) log into the same run, so
+    appends and sink writes are serialised by a lock; the event buffer is a bounded deque and
+    per-status / per-step totals are kept for the summary.
+    """
+
+    def __init__(self, run_id=None, buffer_size=config.REPORT_BUFFER_SIZE):
+        self.run_id = run_id or os.urandom(4).hex()
+        self.events = deque(maxlen=buffer_size)
+        self.sinks = ()
+        self.status_counts = {}
+        self.step_times = {}
+        self.wait_time = 0.0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def append(self, event):
+        with self._lock:
+            self.events.append(event)
+            self.status_counts[event.status] = self.status_counts.get(event.status, 0) + 1
+            if event.duration is not None:
+                count, total = self.step_times.get(event.desc, (0, 0.0))
+                self.step_times[event.desc] = (count + 1, total + event.duration)
+            for sink in self.sinks:
+                sink.write(event)
+
+    def add_wait(self, seconds):
+        """Count time spent in an explicit wait (utils.waits), timed-out waits included."""
+        with self._lock:
+            self.wait_time += seconds
+
+    def add_sink(self, sink):
+        with self._lock:
+            self.sinks = self.sinks + (sink,)
+        return sink
+
+    def close_sinks(self):
+        with self._lock:
+            sinks, self.sinks = self.sinks, ()
+            for sink in sinks:
+                sink.close()
+
+    def summary(self):
+        """JSON-serialisable totals, so reports from other processes can be merged too."""
+        with self._lock:
+            return {
+                "run_id": self.run_id,
+                "elapsed": time.monotonic() - self.started,
+                "status_counts": dict(self.status_counts),
+                "step_times": {desc: list(value) for desc, value in self.step_times.items()},
+                "wait_time": self.wait_time,
+            }
+
+
+# Steps logged outside any run_context() land in the process default run. New threads start
+# with an empty context, so hand work to them with contextvars.copy_context().run to keep
+# their steps in the caller's run
+DEFAULT_RUN = RunReport()
+_current_run = ContextVar("report_run", default=DEFAULT_RUN)
+
+
+class ConsoleSink:
+    def write(self, event):
+        line = f"{'  ' * event.depth}{event.desc}: {event.status}"
+        if event.duration is not None:
+            line += f" ({event.duration:.2f}s)"
+        print(line)
+
+    def close(self):
+        pass
+
+
+class JsonLinesSink:
+    """One JSON object per step, for querying where a run spent its time."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = _open_output(path, "a")
+
+    def write(self, event):
+        self._file.write(json.dumps(event._asdict(), separators=(",", ":")) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class HtmlSink:
+    """Appends one table row per step to the report file as it is logged.
+
+    The file is line-buffered, so every logged step is on disk even if the run crashes
+    before close() writes the closing tags.
+    """
+    HEADER = (
+        "<html><head><meta charset='utf-8'><title>Automation Report</title></head><body>\n"
+        "<h2>HP Account Automation Report</h2><table border='1'>"
+        "<tr><th>Step</th><th>Status</th><th>Duration (s)</th></tr>\n"
     )
-    for desc, status in REPORT:
-        html += f"<tr><td>{desc}</td><td>{status}</td></tr>"
-    html += "</table></body></html>"
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(html)
+    FOOTER = "</table></body></html>\n"
+
+    def __init__(self, path):
+        self.path = path
+        self._file = _open_output(path, "w")
+        self._file.write(self.HEADER)
+
+    def write(self, event):
+        duration = "" if event.duration is None else f"{event.duration:.2f}"
+        self._file.write(
+            f"<tr><td style='padding-left:{event.depth * 1.5}em'>{html.escape(event.desc)}</td>"
+            f"<td>{html.escape(event.status)}</td><td>{duration}</td></tr>\n"
+        )
+
+    def close(self):
+        if not self._file.closed:
+            self._file.write(self.FOOTER)
+            self._file.close()
+
+
+# Process-wide sinks (enabled ones only, as a tuple so log_step iterates without locking);
+# per-run sinks live on the RunReport
+_sinks = (ConsoleSink(),) if config.REPORT_CONSOLE else ()
+_sinks_lock = threading.Lock()
+# Serialises writes to the process-wide sinks, which every run's threads share
+_emit_lock = threading.Lock()
+
+
+def add_sink(sink):
+    global _sinks
+    with _sinks_lock:
+        _sinks = _sinks + (sink,)
+    return sink
+
+
+def remove_sink(sink):
+    global _sinks
+    with _sinks_lock:
+        _sinks = tuple(s for s in _sinks if s is not sink)
+    sink.close()
+
+
+def _open_output(path, mode):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return open(path, mode, encoding="utf-8", buffering=1)
+
+
+def _emit(desc, status, start, duration, depth):
+    run = _current_run.get()
+    event = StepEvent(desc, status, start, duration, depth, run.run_id, threading.current_thread().name)
+    run.append(event)
+    with _emit_lock:
+        for sink in _sinks:
+            sink.write(event)
+    return event
+
+
+def log_step(desc: str, status: str = "PASS", duration: float = None) -> None:
+    _emit(desc, status, time.monotonic(), duration, _depth.get())
+
+
+@contextmanager
+def step(desc: str):
+    """Time a block as one step. Steps opened inside it are nested one level deeper.
+
+    The step is logged when the block exits (so nested steps appear before it), PASS if it
+    finished and FAIL if it raised.
+    """
+    depth = _depth.get()
+    token = _depth.set(depth + 1)
+    start = time.monotonic()
+    status = "FAIL"
+    try:
+        yield
+        status = "PASS"
+    finally:
+        _depth.reset(token)
+        _emit(desc, status, start, time.monotonic() - start, depth)
+
+
+def current_run():
+    return _current_run.get()
+
+
+@contextmanager
+def run_context(run_id=None, report_path=None, jsonl_path=None):
+    """Route every log_step/step in this context (thread, task) into a fresh RunReport."""
+    run = RunReport(run_id)
+    token = _current_run.set(run)
+    try:
+        if report_path:
+            run.add_sink(HtmlSink(report_path))
+        if jsonl_path:
+            run.add_sink(JsonLinesSink(jsonl_path))
+        yield run
+    finally:
+        _current_run.reset(token)
+        run.close_sinks()
+
+
+def merge_reports(runs):
+    """Combine RunReports (or their summary() dicts) from many workers into one summary."""
+    merged = {"runs": 0, "failed_runs": [], "elapsed": 0.0, "status_counts": {}, "step_times": {},
+              "wait_time": 0.0}
+    for run in runs:
+        summary = run.summary() if isinstance(run, RunReport) else run
+        merged["runs"] += 1
+        merged["elapsed"] = max(merged["elapsed"], summary["elapsed"])
+        merged["wait_time"] += summary["wait_time"]
+        if summary["status_counts"].get("FAIL"):
+            merged["failed_runs"].append(summary["run_id"])
+        for status, count in summary["status_counts"].items():
+            merged["status_counts"][status] = merged["status_counts"].get(status, 0) + count
+        for desc, (count, total) in summary["step_times"].items():
+            prev_count, prev_total = merged["step_times"].get(desc, (0, 0.0))
+            merged["step_times"][desc] = [prev_count + count, prev_total + total]
+    return merged
+
+
+def start_report(path: str = config.REPORT_PATH, jsonl_path: str = config.REPORT_JSONL_PATH) -> None:
+    """Stream the current run's steps to the HTML report (and JSON Lines if configured)."""
+    run = _current_run.get()
+    run.close_sinks()
+    run.add_sink(HtmlSink(path))
+    if jsonl_path:
+        run.add_sink(JsonLinesSink(jsonl_path))
+
+
+def generate_report(path: str = config.REPORT_PATH) -> None:
+    run = _current_run.get()
+    if any(isinstance(sink, HtmlSink) and sink.path == path for sink in run.sinks):
+        run.close_sinks()
+    else:
+        # No stream open for this path: write whatever is still buffered in one pass
+        sink = HtmlSink(path)
+        for event in run.events:
+            sink.write(event)
+        sink.close()
     print(f"Report generated: {path}")
@@ -0,0 +1,147 @@
+# utils/otp_broker.py
+import contextvars
+import threading
+import time
+from concurrent.futures import Future
+from utils.logger import log_step
+from utils.otp_extractor import extract_otp, message_sender, newest_message
+import config
+
+
+class OtpBroker:
+    """Single background poller that resolves one Future per watched mailbox.
+
+    Register a mailbox with watch() as soon as it is generated, before the signup form is
+    submitted, so the inbox baseline is empty. The future resolves with the OTP, or None if
+    no mail arrives within max_wait. Steps about a mailbox are logged into the run of the flow
+    that watched it; the rest go to the run that started the broker.
+    """
+
+    def __init__(self, backend=None, batch_size=config.OTP_BROKER_BATCH_SIZE,
+                 min_interval=config.OTP_BROKER_MIN_INTERVAL, max_wait=config.OTP_MAX_WAIT):
+        if backend is None:
+            from page_objects.mailsac_api import MailsacHttpBackend
+            backend = MailsacHttpBackend()
+        self.backend = backend
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.max_wait = max_wait
+        self._pending = {}
+        self._last_checked = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self.polls = 0
+
+    def start(self):
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=contextvars.copy_context().run, args=(self._run,),
+                                            name="otp-broker", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_checked.clear()
+        for future, _, _ in pending.values():
+            future.cancel()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def watch(self, mailbox_full):
+        with self._lock:
+            entry = self._pending.get(mailbox_full)
+            if entry is None:
+                entry = (Future(), time.monotonic(), contextvars.copy_context())
+                self._pending[mailbox_full] = entry
+                self._last_checked[mailbox_full] = 0.0
+        self._wake.set()
+        return entry[0]
+
+    def open_mailsac(self):
+        """Matches the MailsacPage interface; makes sure the poller thread is running."""
+        self.start()
+
+    def fetch_otp(self, mailbox_local_part, timeout=None):
+        """Blocking helper matching MailsacPage.fetch_otp."""
+        return self.watch(f"{mailbox_local_part}@{config.MAIL_DOMAIN}").result(timeout)
+
+    def _next_batch(self):
+        # Least recently checked first, so every mailbox gets a turn under the rate limit
+        with self._lock:
+            batch = sorted(self._last_checked, key=self._last_checked.get)[:self.batch_size]
+            now = time.monotonic()
+            for address in batch:
+                self._last_checked[address] = now
+        return batch
+
+    def _resolve(self, address, otp):
+        with self._lock:
+            entry = self._pending.pop(address, None)
+            self._last_checked.pop(address, None)
+        if entry is not None and not entry[0].done():
+            entry[0].set_result(otp)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            cycle_start = time.monotonic()
+            batch = self._next_batch()
+            if not batch:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            self.polls += 1
+            try:
+                inboxes = self.backend.list_messages_batch(batch)
+            except Exception as e:
+                log_step(f"OTP broker inbox batch failed: {e}", "INFO")
+                inboxes = {}
+            for address in batch:
+                messages = inboxes.get(address)
+                if messages:
+                    self._deliver(address, newest_message(messages))
+                # Also after a failed read: a mail that never becomes readable must not block forever
+                if self._expired(address):
+                    problem = "Could not read the email" if messages else "No email arrived"
+                    self._log(address, f"{problem} for {address} within {self.max_wait}s.", "FAIL")
+                    self._resolve(address, None)
+            self._stopped.wait(max(0.0, self.min_interval - (time.monotonic() - cycle_start)))
+
+    def _deliver(self, address, message):
+        try:
+            otp = extract_otp(self.backend.get_message_text(address, message["_id"]), message_sender(message))
+        except Exception as e:
+            self._log(address, f"OTP broker failed to read mail for {address}: {e}", "INFO")
+            return
+        if otp:
+            self._log(address, f"Extracted OTP for {address}: {otp}")
+            self._resolve(address, otp)
+        else:
+            self._log(address, f"OTP not found in email for {address}.", "FAIL")
+            self._resolve(address, None)
+
+    def _log(self, address, desc, status="PASS"):
+        # Into the watching flow's run: its context is copied per mailbox and only entered here
+        with self._lock:
+            entry = self._pending.get(address)
+        if entry is None:
+            log_step(desc, status)
+        else:
+            entry[2].run(log_step, desc, status)
+
+    def _expired(self, address):
+        with self._lock:
+            entry = self._pending.get(address)
+        return entry is not None and time.monotonic() - entry[1] >= self.max_wait
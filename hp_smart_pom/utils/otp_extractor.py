@@ -0,0 +1,107 @@
+# utils/otp_extractor.py
+import email
+import html
+import re
+from functools import lru_cache
+
+# Keyword-anchored patterns, tried in order. Group 1 is the code.
+DEFAULT_PATTERNS = (
+    # "Your verification code is: 123456", "one-time passcode 1234", "OTP - 98765" (same sentence)
+    r"\b(?:code|passcode|pin|otp)\b[^0-9.!?]{0,60}?(?<![\d-])(\d{4,8})(?![\d-])",
+    # "123456 is your HP verification code"
+    r"(?<![\d-])(\d{4,8})(?![\d-])\s+is\s+(?:your|the)\s+(?:[\w-]+\s+){0,3}(?:code|passcode|otp)\b",
+)
+
+# Extra patterns for known senders, tried before the defaults. Keyed by sender domain.
+SENDER_PATTERNS = {
+    "hp.com": (
+        r"(?:verification|security)\s+code\b[^0-9.!?]{0,60}?(?<![\d-])(\d{4,8})(?![\d-])",
+    ),
+}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_DROP_RE = re.compile(r"<(script|style|head)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_BLOCK_RE = re.compile(r"<(?:br|/p|/div|/tr|/td|/li|/h\d)\b[^>]*>", re.IGNORECASE)
+_BARE_CODE_RE = re.compile(r"(?<![\d\-+/.:,])\b(\d{4,8})\b(?![\d\-/.:,])")
+_YEAR_RE = re.compile(r"(?:19|20)\d\d")
+
+
+@lru_cache(maxsize=64)
+def patterns_for(sender=None):
+    """Compiled patterns for a sender address or domain, cached so each set compiles once."""
+    domain = (sender or "").rsplit("@", 1)[-1].lower().strip("> ")
+    specific = ()
+    for known, pats in SENDER_PATTERNS.items():
+        if domain == known or domain.endswith("." + known):
+            specific = pats
+            break
+    return tuple(re.compile(p, re.IGNORECASE) for p in specific + DEFAULT_PATTERNS)
+
+
+def html_to_text(markup):
+    markup = _DROP_RE.sub(" ", markup)
+    markup = _BLOCK_RE.sub("\n", markup)
+    return html.unescape(_TAG_RE.sub(" ", markup))
+
+
+def message_text(raw):
+    """Plain text of a message given as MIME source, HTML or plain text.
+
+    For MIME, text/plain parts are preferred over text/html; the sender is returned too.
+    """
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", errors="replace")
+    head = raw[:2048].lower()
+    if "content-type:" in head and ("\nfrom:" in head or head.startswith("from:") or "mime-version:" in head):
+        # compat32 parsing with a manual walk is far cheaper than policy.default + get_body()
+        msg = email.message_from_string(raw)
+        parts = {}
+        for part in msg.walk():
+            parts.setdefault(part.get_content_type(), part)
+        body = parts.get("text/plain") or parts.get("text/html")
+        if body is None:
+            return "", msg.get("From")
+        payload = body.get_payload(decode=True) or b""
+        content = payload.decode(body.get_content_charset() or "utf-8", errors="replace")
+        if body.get_content_type() == "text/html":
+            content = html_to_text(content)
+        return content, msg.get("From")
+    if "<" in raw and _TAG_RE.search(raw):
+        return html_to_text(raw), None
+    return raw, None
+
+
+def extract_otp(raw, sender=None):
+    """Return the OTP in a message, or None.
+
+    Codes next to a keyword ("code", "verification", "OTP", ...) win, unless they look like a
+    year ("code expires in 2026"), in which case the next match is tried. Without one, a bare
+    4-8 digit run is only accepted if it is the single candidate that does not look like a
+    year, so phone numbers, dates and order ids are not mistaken for the code. A year-shaped
+    keyword match is returned only when nothing else qualifies (a 4-digit code like 2019).
+    """
+    text, mime_sender = message_text(raw)
+    year_shaped = None
+    for pattern in patterns_for(sender or mime_sender):
+        for match in pattern.finditer(text):
+            code = match.group(1)
+            if not _YEAR_RE.fullmatch(code):
+                return code
+            year_shaped = year_shaped or code
+    candidates = {c for c in _BARE_CODE_RE.findall(text) if not _YEAR_RE.fullmatch(c)}
+    if len(candidates) == 1:
+        return candidates.pop()
+    return year_shaped
+
+
+def newest_message(messages):
+    """Newest message from a Mailsac-style list (dicts with an ISO "received" timestamp)."""
+    if not messages:
+        return None
+    return max(messages, key=lambda m: m.get("received") or "")
+
+
+def message_sender(message):
+    """Sender address of a Mailsac-style message dict ("from" is a list of {"address", "name"})."""
+    senders = (message or {}).get("from") or [{}]
+    return senders[0].get("address")
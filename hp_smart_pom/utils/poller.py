@@ -0,0 +1,41 @@
+# utils/poller.py
+import time
+from collections import namedtuple
+import config
+
+PollResult = namedtuple("PollResult", "value polls waited changed")
+
+
+class Poller:
+    """Polls a probe with exponential backoff until its value changes or max_wait runs out."""
+
+    def __init__(self, initial_interval=config.POLL_INITIAL_INTERVAL, factor=config.POLL_BACKOFF_FACTOR,
+                 max_interval=config.POLL_INTERVAL, max_wait=config.OTP_MAX_WAIT):
+        self.initial_interval = initial_interval
+        self.factor = factor
+        self.max_interval = max_interval
+        self.max_wait = max_wait
+
+    def delays(self):
+        delay = self.initial_interval
+        while True:
+            yield delay
+            delay = min(delay * self.factor, self.max_interval)
+
+    def wait_for_change(self, probe, baseline=0, refresh=None):
+        """Return as soon as probe() != baseline. refresh() runs before each re-probe."""
+        start = time.monotonic()
+        delays = self.delays()
+        polls = 0
+        while True:
+            value = probe()
+            polls += 1
+            waited = time.monotonic() - start
+            if value != baseline:
+                return PollResult(value, polls, waited, True)
+            remaining = self.max_wait - waited
+            if remaining <= 0:
+                return PollResult(value, polls, waited, False)
+            time.sleep(min(next(delays), remaining))
+            if refresh:
+                refresh()
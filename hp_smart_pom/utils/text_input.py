@@ -0,0 +1,80 @@
+# utils/text_input.py
+import re
+import time
+from utils.logger import log_step
+from utils.waits import wait_for
+import config
+
+# Characters type_keys treats as modifiers or groups; wrapped in braces they are typed literally
+_SEND_KEYS_SPECIAL = re.compile(r"([{}+^%~()])")
+
+
+def _set_value(element, text):
+    # UIA ValuePattern.SetValue: one cross-process call, no keystrokes
+    element.iface_value.SetValue(text)
+
+
+def _paste(element, text):
+    import pyperclip
+    pyperclip.copy(text)
+    wait_for(lambda: pyperclip.paste() == text, "text on clipboard", timeout=config.SHORT_TIMEOUT)
+    element.click_input()
+    element.type_keys("^a^v")
+
+
+def _keys(element, text):
+    element.click_input()
+    element.type_keys("^a{DEL}" + _SEND_KEYS_SPECIAL.sub(r"{\1}", text), with_spaces=True, pause=config.INPUT_KEY_PAUSE)
+
+
+STRATEGIES = {"set_value": _set_value, "paste": _paste, "keys": _keys}
+# Fill a field without keyboard events, so the page's input handlers may never see the text;
+# only used where the result can be read back and checked
+SILENT_STRATEGIES = ("set_value",)
+
+
+def read_value(element):
+    """The field's current text, or None when it cannot be read back (password fields)."""
+    try:
+        if element.element_info.element.CurrentIsPassword:
+            return None
+    except Exception:
+        pass
+    try:
+        return element.iface_value.CurrentValue
+    except Exception:
+        return None
+
+
+def enter_text(element, text, desc, strategies=config.INPUT_STRATEGIES):
+    """Put text into an edit field with the first strategy whose result reads back correctly.
+
+    Strategies are tried in order ("set_value", "paste", "keys"); one that raises, or leaves a
+    different value in the field, falls through to the next. Fields that cannot be read back
+    (password fields) skip set_value, take the first typing strategy that does not raise and
+    log that the value was not verified. Returns the strategy that worked.
+    """
+    verifiable = read_value(element) is not None
+    if not verifiable:
+        strategies = [name for name in strategies if name not in SILENT_STRATEGIES] or list(strategies)
+    errors = []
+    for name in strategies:
+        start = time.monotonic()
+        try:
+            STRATEGIES[name](element, text)
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+            continue
+        if not verifiable:
+            log_step(f"Entered {desc} ({name}); field cannot be read back, value not verified.", "INFO",
+                     duration=time.monotonic() - start)
+            return name
+        value = read_value(element)
+        if value == text:
+            log_step(f"Entered {desc} ({name}).", "INFO", duration=time.monotonic() - start)
+            return name
+        if value is None:
+            errors.append(f"{name}: field could not be read back")
+            continue
+        errors.append(f"{name}: field reads back {len(value)} chars, expected {len(text)}")
+    raise RuntimeError(f"Could not enter {desc}: " + "; ".join(errors))
@@ -0,0 +1,99 @@
+# utils/uia_snapshot.py
+import json
+
+# Columns stored per node; "parent" is the index of the parent node, -1 for the root
+COLUMNS = ("auto_id", "title", "control_type", "class_name", "parent")
+INDEXED = ("auto_id", "title", "control_type")
+
+
+class UiaSnapshot:
+    """Whole UIA subtree captured in one cross-process call, indexed for in-memory lookups.
+
+    Nodes are stored column-wise (one list per property) with dict indexes on auto_id, title and
+    control_type. Live COM elements are kept alongside when captured from a real window so that a
+    lookup can be turned into a clickable wrapper; snapshots loaded from JSON answer lookups only.
+    """
+
+    def __init__(self, columns, elements=None):
+        self.columns = {name: list(columns[name]) for name in COLUMNS}
+        self.elements = elements
+        self.indexes = {name: {} for name in INDEXED}
+        for name in INDEXED:
+            index = self.indexes[name]
+            for i, value in enumerate(self.columns[name]):
+                index.setdefault(value, []).append(i)
+
+    def __len__(self):
+        return len(self.columns["parent"])
+
+    @classmethod
+    def capture(cls, window):
+        """Snapshot window (a pywinauto UIA wrapper) with a single cached-properties request."""
+        from pywinauto.uia_defines import IUIA
+        iuia = IUIA()
+        request = iuia.iuia.CreateCacheRequest()
+        for prop in ("AutomationId", "Name", "ControlType", "ClassName"):
+            request.AddProperty(getattr(iuia.UIA_dll, f"UIA_{prop}PropertyId"))
+        request.TreeScope = iuia.tree_scope["subtree"]
+        root = window.element_info.element.BuildUpdatedCache(request)
+
+        control_types = iuia.known_control_type_ids
+        columns = {name: [] for name in COLUMNS}
+        elements = []
+        stack = [(root, -1)]
+        while stack:
+            element, parent = stack.pop()
+            index = len(elements)
+            elements.append(element)
+            columns["auto_id"].append(element.CachedAutomationId or "")
+            columns["title"].append(element.CachedName or "")
+            columns["control_type"].append(control_types.get(element.CachedControlType, ""))
+            columns["class_name"].append(element.CachedClassName or "")
+            columns["parent"].append(parent)
+            children = element.GetCachedChildren()
+            if children is not None:
+                for i in reversed(range(children.Length)):
+                    stack.append((children.GetElement(i), index))
+        return cls(columns, elements)
+
+    def find_all(self, **locator):
+        """Indices of nodes matching every key in locator (same keys as child_window)."""
+        for name in locator:
+            if name not in self.columns or name == "parent":
+                raise ValueError(f"Unsupported locator key for snapshot lookup: {name}")
+        indexed = [self.indexes[name].get(value, []) for name, value in locator.items() if name in self.indexes]
+        candidates = min(indexed, key=len) if indexed else range(len(self))
+        checks = [(self.columns[name], value) for name, value in locator.items()]
+        return [i for i in candidates if all(column[i] == value for column, value in checks)]
+
+    def find(self, **locator):
+        hits = self.find_all(**locator)
+        if not hits:
+            raise LookupError(f"No element matching {locator} in snapshot")
+        return hits[0]
+
+    def node(self, i):
+        return {name: self.columns[name][i] for name in COLUMNS}
+
+    def wrapper(self, i):
+        if self.elements is None:
+            raise RuntimeError("Snapshot was loaded from disk and has no live elements")
+        from pywinauto.uia_element_info import UIAElementInfo
+        from pywinauto.controls.uiawrapper import UIAWrapper
+        return UIAWrapper(UIAElementInfo(self.elements[i]))
+
+    def to_dict(self):
+        return {"columns": self.columns}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["columns"])
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
@@ -1,16 +1,21 @@
-import time
 from utils.logger import log_step
-from pywinauto import keyboard
+from utils.waits import wait_for_active_window
+from pywinauto import Desktop, keyboard
 import config
 
+HP_SMART_WINDOW_RE = r".*HP Smart.*"
+
 def click_open_hp_smart(timeout=config.DEFAULT_TIMEOUT):
-    """Handle Chrome popup by sending ENTER keystrokes reliably."""
+    """Handle Chrome popup by sending ENTER until the HP Smart window takes the foreground."""
     log_step("Using keyboard ENTER for Chrome popup (reliable fallback)")
+    desktop = Desktop(backend="uia")
     for i in range(3):
         try:
             keyboard.send_keys("{ENTER}")
             log_step(f"Sent ENTER key (attempt {i+1})")
-            time.sleep(1)
+            wait_for_active_window(desktop, HP_SMART_WINDOW_RE, "HP Smart in foreground",
+                                   timeout=min(timeout, config.SHORT_TIMEOUT))
+            break
         except:
             pass
     log_step("Chrome popup handling completed", "PASS")
@@ -0,0 +1,57 @@
+# utils/waits.py
+import time
+from utils.logger import current_run, log_step
+import config
+
+
+def wait_for(condition, desc, timeout=config.DEFAULT_TIMEOUT, poll=config.WAIT_POLL_INTERVAL):
+    """Poll condition() until it returns something truthy and log how long that actually took.
+
+    Exceptions from condition() count as "not yet", which covers UIA elements that are
+    mid-teardown while a page changes. The time waited is added to the current run's wait_time.
+    """
+    start = time.monotonic()
+    while True:
+        try:
+            result = condition()
+        except Exception:
+            result = None
+        elapsed = time.monotonic() - start
+        if result:
+            current_run().add_wait(elapsed)
+            log_step(f"Waited for {desc}.", "INFO", duration=elapsed)
+            return result
+        if elapsed >= timeout:
+            current_run().add_wait(elapsed)
+            raise TimeoutError(f"Timed out after {timeout}s waiting for {desc}")
+        time.sleep(poll)
+
+
+def wait_for_element(parent, locator, desc, timeout=config.DEFAULT_TIMEOUT):
+    """Wait until parent.child_window(**locator) exists and return the spec."""
+    spec = parent.child_window(**locator)
+    wait_for(lambda: spec.exists(timeout=0), desc, timeout)
+    return spec
+
+
+def wait_for_element_gone(parent, locator, desc, timeout=config.DEFAULT_TIMEOUT):
+    spec = parent.child_window(**locator)
+    wait_for(lambda: not spec.exists(timeout=0), desc, timeout)
+
+
+def wait_for_window(desktop, title_re, desc, timeout=config.DEFAULT_TIMEOUT):
+    spec = desktop.window(title_re=title_re)
+    wait_for(lambda: spec.exists(timeout=0), desc, timeout)
+    return spec
+
+
+def wait_for_active_window(desktop, title_re, desc, timeout=config.DEFAULT_TIMEOUT):
+    spec = desktop.window(title_re=title_re)
+    wait_for(lambda: spec.wrapper_object().is_active(), desc, timeout)
+    return spec
+
+
+def wait_for_usable(element, desc, timeout=config.SHORT_TIMEOUT):
+    """Wait on an already resolved wrapper (e.g. from LocatorCache) to be visible and enabled."""
+    wait_for(lambda: element.is_visible() and element.is_enabled(), desc, timeout)
+    return element
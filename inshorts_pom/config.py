@@ -0,0 +1,38 @@
+# inshorts_pom/config.py
+import json
+import os
+import tempfile
+
+APPIUM_HOST = os.environ.get("APPIUM_HOST", "127.0.0.1")
+APPIUM_BASE_PORT = 4723
+SYSTEM_PORT_BASE = 8200  # UiAutomator2 systemPort; each parallel device needs its own
+# Devices the suite may drive, e.g. APPIUM_UDIDS=emulator-5554,emulator-5556: device i gets Appium
+# server port APPIUM_BASE_PORT + i and systemPort SYSTEM_PORT_BASE + i. For anything else set
+# APPIUM_DEVICES='[{"udid": "emulator-5554", "port": 4723, "system_port": 8200}, ...]'.
+APPIUM_UDIDS = [u for u in os.environ.get("APPIUM_UDIDS", "emulator-5554").split(",") if u]
+APPIUM_DEVICES = json.loads(os.environ["APPIUM_DEVICES"]) if os.environ.get("APPIUM_DEVICES") else [
+    {"udid": udid, "port": APPIUM_BASE_PORT + i, "system_port": SYSTEM_PORT_BASE + i}
+    for i, udid in enumerate(APPIUM_UDIDS)
+]
+APPIUM_UDIDS = [d["udid"] for d in APPIUM_DEVICES]
+
+# pytest-xdist workers lease devices through lock files here; a crashed worker's lock is released by the OS
+DEVICE_LOCK_DIR = os.environ.get("DEVICE_LOCK_DIR", os.path.join(tempfile.gettempdir(), "inshorts-devices"))
+DEVICE_LEASE_TIMEOUT = 600
+DEVICE_LEASE_POLL = 0.5
+PLATFORM_VERSION = "16"
+
+APP_PACKAGE = "com.nis.app"
+APP_ACTIVITY = "com.nis.app.ui.activities.HomeActivity"
+
+IMPLICIT_WAIT = 10
+# Presence probes run with the implicit wait switched off and poll find_elements instead
+PROBE_TIMEOUT = 0  # seconds an optional element gets to show up
+PROBE_POLL_INTERVAL = 0.2
+ELEMENT_TIMEOUT = 15  # explicit wait for elements a step needs
+NEW_COMMAND_TIMEOUT = 300
+
+# Sessions are reused across tests; between leases the app is reset with terminateApp/activateApp
+SESSION_RESET_APP = True
+SESSION_MAX_USES = 50  # recreate a session after this many leases
+SESSION_LEASE_TIMEOUT = 600  # seconds to wait for a free device
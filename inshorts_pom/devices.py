@@ -0,0 +1,106 @@
+# inshorts_pom/devices.py
+import os
+import re
+import time
+from typing import NamedTuple
+from . import config
+
+
+class Device(NamedTuple):
+    udid: str
+    port: int
+    system_port: int
+    host: str = config.APPIUM_HOST
+
+    @property
+    def server_url(self):
+        return f"http://{self.host}:{self.port}"
+
+
+def load_devices(spec=None):
+    """Devices from config.APPIUM_DEVICES (or spec, the same list of dicts)."""
+    return [Device(**d) for d in (config.APPIUM_DEVICES if spec is None else spec)]
+
+
+def device(udid, devices=None):
+    for d in devices or load_devices():
+        if d.udid == udid:
+            return d
+    raise ValueError(f"Unknown device {udid!r}; configured: {[d.udid for d in devices or load_devices()]}")
+
+
+def worker_index(worker_id):
+    """0 for "gw0" (pytest-xdist), None outside xdist."""
+    match = re.fullmatch(r"gw(\d+)", worker_id or "")
+    return int(match.group(1)) if match else None
+
+
+def _try_lock(f):
+    try:
+        f.seek(0)
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+class DeviceAllocator:
+    """Leases each configured device to one process at a time through a lock file per udid.
+
+    Worker gwN tries device N first so that a steady xdist run maps workers to devices one to one;
+    if that device is taken it falls back to any free one. The OS drops the lock when the holder
+    exits, so a crashed worker never strands a device.
+    """
+
+    def __init__(self, devices=None, lock_dir=config.DEVICE_LOCK_DIR, timeout=config.DEVICE_LEASE_TIMEOUT,
+                 poll=config.DEVICE_LEASE_POLL):
+        self.devices = list(devices or load_devices())
+        self.lock_dir = lock_dir
+        self.timeout = timeout
+        self.poll = poll
+        self._held = {}
+
+    def _lock_path(self, d):
+        return os.path.join(self.lock_dir, re.sub(r"[^\w.-]", "_", d.udid) + ".lock")
+
+    def _order(self, worker_id):
+        index = worker_index(worker_id)
+        if index is None:
+            return list(self.devices)
+        start = index % len(self.devices)
+        return self.devices[start:] + self.devices[:start]
+
+    def acquire(self, worker_id=None, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        os.makedirs(self.lock_dir, exist_ok=True)
+        deadline = time.monotonic() + timeout
+        while True:
+            for d in self._order(worker_id):
+                if d.udid in self._held:
+                    continue
+                f = open(self._lock_path(d), "a+")
+                if _try_lock(f):
+                    f.seek(0)
+                    f.truncate()
+                    f.write(f"{os.getpid()} {worker_id or 'main'}\n")
+                    f.flush()
+                    self._held[d.udid] = f
+                    return d
+                f.close()
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"No free device among {[d.udid for d in self.devices]} after {timeout}s")
+            time.sleep(self.poll)
+
+    def release(self, d):
+        f = self._held.pop(d.udid, None)
+        if f is not None:
+            f.close()
+
+    def release_all(self):
+        for udid in list(self._held):
+            self._held.pop(udid).close()
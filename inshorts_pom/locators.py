@@ -0,0 +1,57 @@
+# inshorts_pom/locators.py
+import re
+from typing import NamedTuple
+from . import config
+
+# AppiumBy strategy names, spelled out so that locators can be built without importing appium
+ID = "id"
+ACCESSIBILITY_ID = "accessibility id"
+UIAUTOMATOR = "-android uiautomator"
+XPATH = "xpath"
+
+_UISELECTOR_TEXT = re.compile(r'new UiSelector\(\)\.text\("((?:[^"\\]|\\.)*)"\)')
+
+
+class Locator(NamedTuple):
+    """(by, value) pair; unpacks straight into driver.find_element(*locator)."""
+    by: str
+    value: str
+
+
+def qualify_id(resource_id, package=config.APP_PACKAGE):
+    """Add the app package to a bare id, as Appium's id strategy does ("news_title" -> "com.nis.app:id/news_title")."""
+    return resource_id if ":" in resource_id else f"{package}:id/{resource_id}"
+
+
+def ui_selector_text(text):
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+    return f'new UiSelector().text("{escaped}")'
+
+
+def locate(resource_id=None, desc=None, text=None, xpath=None, package=config.APP_PACKAGE):
+    """Compile what is known about an element into the fastest UiAutomator2 strategy for it.
+
+    resource-id and accessibility id are direct lookups on the device; a UiSelector still walks
+    the hierarchy, and XPath first serialises the whole page to XML, so it is only a last resort.
+    """
+    if resource_id:
+        return Locator(ID, qualify_id(resource_id, package))
+    if desc:
+        return Locator(ACCESSIBILITY_ID, desc)
+    if text:
+        return Locator(UIAUTOMATOR, ui_selector_text(text))
+    if xpath:
+        return Locator(XPATH, xpath)
+    raise ValueError("A locator needs a resource_id, desc, text or xpath")
+
+
+def snapshot_query(locator):
+    """The ScreenSnapshot lookup keys equivalent to locator."""
+    if locator.by == ID:
+        return {"resource_id": locator.value}
+    if locator.by == ACCESSIBILITY_ID:
+        return {"content_desc": locator.value}
+    match = _UISELECTOR_TEXT.fullmatch(locator.value) if locator.by == UIAUTOMATOR else None
+    if match:
+        return {"text": re.sub(r"\\(.)", r"\1", match.group(1))}
+    raise ValueError(f"Locator {locator} cannot be answered from a snapshot")
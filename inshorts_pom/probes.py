@@ -0,0 +1,101 @@
+# inshorts_pom/probes.py
+import threading
+import time
+from contextlib import contextmanager
+from . import config
+
+
+class ProbeStats:
+    """Counts probes and the implicit wait that misses would have cost with find_element."""
+
+    def __init__(self, implicit_wait=config.IMPLICIT_WAIT):
+        self.implicit_wait = implicit_wait
+        self.probes = 0
+        self.misses = 0
+        self.probe_time = 0.0
+        self.saved = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, found, elapsed):
+        with self._lock:
+            self.probes += 1
+            self.probe_time += elapsed
+            if not found:
+                self.misses += 1
+                self.saved += max(self.implicit_wait - elapsed, 0.0)
+
+    def to_dict(self):
+        with self._lock:
+            return {"probes": self.probes, "misses": self.misses, "probe_time": self.probe_time, "saved": self.saved}
+
+    def merge(self, data):
+        """Add totals from to_dict() of another process (e.g. a pytest-xdist worker)."""
+        with self._lock:
+            self.probes += data["probes"]
+            self.misses += data["misses"]
+            self.probe_time += data["probe_time"]
+            self.saved += data["saved"]
+
+    def summary(self):
+        return (f"Presence probes: {self.probes} run, {self.misses} missed in {self.probe_time:.2f}s; "
+                f"~{self.saved:.1f}s of implicit wait avoided")
+
+
+PROBE_STATS = ProbeStats()
+
+
+@contextmanager
+def implicit_wait(driver, seconds):
+    """Run a block with the driver's implicit wait set to seconds, then restore the one it had."""
+    previous = driver.timeouts.implicit_wait
+    driver.implicitly_wait(seconds)
+    try:
+        yield driver
+    finally:
+        driver.implicitly_wait(previous)
+
+
+def _poll(driver, by, value, timeout, poll):
+    deadline = time.monotonic() + timeout
+    while True:
+        elements = driver.find_elements(by, value)
+        if elements or time.monotonic() >= deadline:
+            return elements
+        time.sleep(poll)
+
+
+def find_present(driver, by, value, timeout=config.PROBE_TIMEOUT, poll=config.PROBE_POLL_INTERVAL,
+                 stats=PROBE_STATS):
+    """The first matching element, or None if none appears within timeout (0: look once).
+
+    Uses find_elements with the implicit wait off, so an expected-missing element costs one
+    round trip instead of IMPLICIT_WAIT seconds.
+    """
+    start = time.monotonic()
+    with implicit_wait(driver, 0):
+        elements = _poll(driver, by, value, timeout, poll)
+    stats.record(bool(elements), time.monotonic() - start)
+    return elements[0] if elements else None
+
+
+def is_present(driver, by, value, timeout=config.PROBE_TIMEOUT, stats=PROBE_STATS):
+    return find_present(driver, by, value, timeout, stats=stats) is not None
+
+
+def click_if_present(driver, by, value, timeout=config.PROBE_TIMEOUT, stats=PROBE_STATS):
+    """Click the element if it is there; returns whether it was."""
+    element = find_present(driver, by, value, timeout, stats=stats)
+    if element is None:
+        return False
+    element.click()
+    return True
+
+
+def wait_for_element(driver, by, value, desc=None, timeout=config.ELEMENT_TIMEOUT,
+                     poll=config.PROBE_POLL_INTERVAL):
+    """Explicit wait for an element a step needs; returns as soon as it appears."""
+    with implicit_wait(driver, 0):
+        elements = _poll(driver, by, value, timeout, poll)
+    if not elements:
+        raise TimeoutError(f"Timed out after {timeout}s waiting for {desc or value}")
+    return elements[0]
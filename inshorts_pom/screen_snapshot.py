@@ -0,0 +1,113 @@
+# inshorts_pom/screen_snapshot.py
+import re
+import xml.etree.ElementTree as ET
+from . import config
+from .locators import locate, qualify_id, snapshot_query
+
+# Columns stored per node; "parent" is the index of the parent node, -1 for the root
+COLUMNS = ("resource_id", "content_desc", "text", "class_name", "bounds", "parent")
+INDEXED = ("resource_id", "content_desc", "text")
+_BOUNDS = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+
+class ScreenSnapshot:
+    """One page_source fetch, indexed so that many reads on a screen cost no further round trips.
+
+    Nodes are stored column-wise with dict indexes on resource_id, content_desc and text, like
+    UiaSnapshot in the HP Smart suite. Text and attribute reads are answered from the snapshot;
+    element() resolves a live handle only for nodes that will be tapped. A snapshot describes
+    one screen at one moment: capture a new one after every navigation before reading from it.
+    """
+
+    def __init__(self, columns, package=config.APP_PACKAGE):
+        self.columns = {name: list(columns[name]) for name in COLUMNS}
+        self.package = package
+        self.indexes = {name: {} for name in INDEXED}
+        for name in INDEXED:
+            index = self.indexes[name]
+            for i, value in enumerate(self.columns[name]):
+                if value:
+                    index.setdefault(value, []).append(i)
+
+    def __len__(self):
+        return len(self.columns["parent"])
+
+    @classmethod
+    def capture(cls, driver, package=config.APP_PACKAGE):
+        return cls.from_xml(driver.page_source, package)
+
+    @classmethod
+    def from_xml(cls, source, package=config.APP_PACKAGE):
+        """Parse a UiAutomator2 page_source document."""
+        root = ET.fromstring(source)
+        columns = {name: [] for name in COLUMNS}
+        stack = [(root, -1)]
+        while stack:
+            node, parent = stack.pop()
+            index = len(columns["parent"])
+            attrib = node.attrib
+            columns["resource_id"].append(attrib.get("resource-id", ""))
+            columns["content_desc"].append(attrib.get("content-desc", ""))
+            columns["text"].append(attrib.get("text", ""))
+            columns["class_name"].append(attrib.get("class", node.tag))
+            columns["bounds"].append(attrib.get("bounds", ""))
+            columns["parent"].append(parent)
+            for child in reversed(node):
+                stack.append((child, index))
+        return cls(columns, package)
+
+    def find_all(self, locator=None, **query):
+        """Indices of nodes matching a Locator and/or every key in query; a bare resource_id gets the app package."""
+        locator = dict(snapshot_query(locator), **query) if locator is not None else query
+        for name in locator:
+            if name not in self.columns or name in ("parent", "bounds"):
+                raise ValueError(f"Unsupported locator key for snapshot lookup: {name}")
+        if "resource_id" in locator:
+            locator = dict(locator, resource_id=qualify_id(locator["resource_id"], self.package))
+        indexed = [self.indexes[name].get(value, []) for name, value in locator.items() if name in self.indexes]
+        candidates = min(indexed, key=len) if indexed else range(len(self))
+        checks = [(self.columns[name], value) for name, value in locator.items()]
+        return [i for i in candidates if all(column[i] == value for column, value in checks)]
+
+    def find(self, locator=None, **query):
+        hits = self.find_all(locator, **query)
+        if not hits:
+            raise LookupError(f"No element matching {locator or query} in snapshot")
+        return hits[0]
+
+    def exists(self, locator=None, **query):
+        return bool(self.find_all(locator, **query))
+
+    def text(self, locator=None, **query):
+        return self.columns["text"][self.find(locator, **query)]
+
+    def texts(self, *locators):
+        """{locator: text} for several Locators (or resource ids) at once; missing ones map to None."""
+        texts = {}
+        for locator in locators:
+            hits = self.find_all(resource_id=locator) if isinstance(locator, str) else self.find_all(locator)
+            texts[locator] = self.columns["text"][hits[0]] if hits else None
+        return texts
+
+    def node(self, i):
+        return {name: self.columns[name][i] for name in COLUMNS}
+
+    def bounds(self, i):
+        """(left, top, right, bottom) of node i, or None if the source had no bounds."""
+        match = _BOUNDS.fullmatch(self.columns["bounds"][i])
+        return tuple(int(v) for v in match.groups()) if match else None
+
+    def locator(self, i):
+        """The fastest Locator that finds node i again on the device."""
+        try:
+            return locate(resource_id=self.columns["resource_id"][i], desc=self.columns["content_desc"][i],
+                          text=self.columns["text"][i], package=self.package)
+        except ValueError:
+            raise LookupError(f"Node {i} has no id, description or text to locate it by") from None
+
+    def element(self, driver, locator=None, **query):
+        """Live element handle for a node found in the snapshot (one find_element round trip)."""
+        return driver.find_element(*self.locator(self.find(locator, **query)))
+
+    def tap(self, driver, locator=None, **query):
+        self.element(driver, locator, **query).click()
@@ -0,0 +1,41 @@
+# inshorts_pom/screens.py
+from functools import lru_cache
+from .locators import locate
+
+
+class Launcher:
+    PREDICTED_APP = locate(desc="Predicted app: inshorts")
+
+
+class HomeScreen:
+    ACTION_BAR_ROOT = locate(resource_id="action_bar_root")
+    MY_FEED_TAB = locate(desc="My Feed tab")
+    NEWS_TITLE = locate(resource_id="news_title")
+    NEWS_TEXT = locate(resource_id="news_text")
+    NEWS_IMAGE = locate(resource_id="news_image")
+    PROFILE = locate(desc="Profile")
+    TAB_NAMES = ("Finance", "Timelines", "Videos", "Insights", "Good News")
+
+
+class StoryScreen:
+    STORY_NUMBER = locate(resource_id="story_number_1")
+    TOOLBAR_BACK = locate(resource_id="toolbar_back")
+
+
+class NavBar:
+    ITEM_ICON = locate(resource_id="navigation_bar_item_icon_view")
+    BACK = locate(desc="Back")
+
+
+class SearchScreen:
+    SUGGESTION = locate(resource_id="txt_search_suggestion")
+    NOTIF_TITLE = locate(resource_id="notif_title")
+    NOTIF_VIEW_ALL = locate(resource_id="notif_view_all")
+    INSIGHTS_TITLE = locate(resource_id="insights_title")
+    INSIGHTS_VIEW_ALL = locate(resource_id="insights_view_all")
+
+
+@lru_cache(maxsize=None)
+def tab(name):
+    """Locator for a home-screen category tab, compiled once per name."""
+    return locate(text=name)
@@ -0,0 +1,198 @@
+# inshorts_pom/session_pool.py
+import threading
+import time
+from contextlib import contextmanager
+from . import config
+from .devices import device
+
+
+def capabilities(udid, system_port=None, **overrides):
+    """UiAutomator2 capabilities for the Inshorts app on one device."""
+    caps = {
+        "platformName": "Android",
+        "appium:automationName": "UiAutomator2",
+        "appium:deviceName": "Android Emulator",
+        "appium:platformVersion": config.PLATFORM_VERSION,
+        "appium:udid": udid,
+        "appium:appPackage": config.APP_PACKAGE,
+        "appium:appActivity": config.APP_ACTIVITY,
+        "appium:noReset": True,
+        "appium:newCommandTimeout": config.NEW_COMMAND_TIMEOUT,
+    }
+    if system_port is not None:
+        caps["appium:systemPort"] = system_port
+    caps.update(overrides)
+    return caps
+
+
+def create_appium_session(udid, server_url=None, system_port=None):
+    """Start a session on udid through its configured Appium server and systemPort."""
+    from appium import webdriver
+    from appium.options.android import UiAutomator2Options
+    if server_url is None or system_port is None:
+        d = device(udid)
+        server_url = server_url or d.server_url
+        system_port = d.system_port if system_port is None else system_port
+    options = UiAutomator2Options().load_capabilities(capabilities(udid, system_port))
+    driver = webdriver.Remote(server_url, options=options)
+    driver.implicitly_wait(config.IMPLICIT_WAIT)
+    return driver
+
+
+class AppiumSessionPool:
+    """One reusable Appium session per device, keyed by udid.
+
+    A UiAutomator2 session takes many seconds to start, so sessions outlive tests: a lease hands
+    out a device's live session (starting one only if it has none or it died), and returning it
+    resets the app with terminateApp/activateApp instead of a new session. Each device is leased
+    to one caller at a time, so several emulators can be driven in parallel.
+    """
+
+    def __init__(self, udids=None, factory=create_appium_session, app_package=config.APP_PACKAGE,
+                 max_uses=config.SESSION_MAX_USES, reset_app=config.SESSION_RESET_APP,
+                 lease_timeout=config.SESSION_LEASE_TIMEOUT):
+        self.udids = list(udids or config.APPIUM_UDIDS)
+        self.factory = factory
+        self.app_package = app_package
+        self.max_uses = max_uses
+        self.reset_app = reset_app
+        self.lease_timeout = lease_timeout
+        self._sessions = {}
+        self._uses = {}
+        self._busy = set()
+        self._cond = threading.Condition()
+        self.leases = 0
+        self.reused = 0
+        self.created = 0
+        self.recycled = 0
+        self.total_wait = 0.0
+
+    def acquire(self, udid=None, timeout=None):
+        """Lease a device's session: udid, or any free device. Returns (udid, driver)."""
+        if udid is not None and udid not in self.udids:
+            raise ValueError(f"Unknown device {udid!r}; pool has {self.udids}")
+        start = time.monotonic()
+        timeout = self.lease_timeout if timeout is None else timeout
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._free(udid) is not None, timeout=timeout):
+                raise TimeoutError(f"No device free in Appium pool after {timeout}s")
+            udid = self._free(udid)
+            self._busy.add(udid)
+            driver = self._sessions.get(udid)
+        try:
+            if driver is not None and not self._healthy(driver):
+                self._discard(udid)
+                driver = None
+            reused = driver is not None
+            if driver is None:
+                driver = self.factory(udid)
+                with self._cond:
+                    self._sessions[udid] = driver
+                    self._uses[udid] = 0
+                    self.created += 1
+        except Exception:
+            with self._cond:
+                self._busy.discard(udid)
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self.leases += 1
+            self.reused += reused
+            self.total_wait += time.monotonic() - start
+        return udid, driver
+
+    def release(self, udid, broken=False):
+        try:
+            with self._cond:
+                self._uses[udid] = self._uses.get(udid, 0) + 1
+                worn_out = self._uses[udid] >= self.max_uses
+            if udid in self._sessions and (broken or worn_out or not self._reset(self._sessions[udid])):
+                self._discard(udid)
+        finally:
+            with self._cond:
+                self._busy.discard(udid)
+                self._cond.notify_all()
+
+    @contextmanager
+    def lease(self, udid=None, timeout=None):
+        udid, driver = self.acquire(udid, timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not self._healthy(driver)
+            raise
+        finally:
+            self.release(udid, broken)
+
+    def stats(self):
+        return {
+            "devices": len(self.udids),
+            "leases": self.leases,
+            "reused": self.reused,
+            "reuse_rate": self.reused / self.leases if self.leases else 0.0,
+            "created": self.created,
+            "recycled": self.recycled,
+            "avg_lease_wait": self.total_wait / self.leases if self.leases else 0.0,
+        }
+
+    def report(self):
+        s = self.stats()
+        print(f"Appium pool: {s['leases']} leases on {s['devices']} devices, {s['reuse_rate']:.0%} reused, "
+              f"{s['created']} sessions started, {s['recycled']} recycled, lease wait avg {s['avg_lease_wait']:.2f}s")
+
+    def close(self):
+        for udid in list(self._sessions):
+            self._discard(udid, recycled=False)
+
+    def _free(self, udid):
+        if udid is not None:
+            return udid if udid not in self._busy else None
+        # Prefer a device whose session is already running
+        free = [u for u in self.udids if u not in self._busy]
+        return next((u for u in free if u in self._sessions), free[0] if free else None)
+
+    @staticmethod
+    def _healthy(driver):
+        try:
+            if driver.session_id is None:
+                return False
+            driver.current_package
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        if not self.reset_app:
+            return True
+        try:
+            driver.terminate_app(self.app_package)
+            driver.activate_app(self.app_package)
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, udid, recycled=True):
+        with self._cond:
+            driver = self._sessions.pop(udid, None)
+            self._uses.pop(udid, None)
+            if recycled and driver is not None:
+                self.recycled += 1
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+_shared_pool = None
+_shared_lock = threading.Lock()
+
+
+def get_session_pool():
+    """Process-wide pool shared by every test in this run."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = AppiumSessionPool()
+        return _shared_pool
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import pytest
+from inshorts_pom.devices import Device, DeviceAllocator, device, load_devices, worker_index
+from inshorts_pom.session_pool import capabilities
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SPEC = [{"udid": "emulator-5554", "port": 4723, "system_port": 8200},
+        {"udid": "emulator-5556", "port": 4724, "system_port": 8201},
+        {"udid": "emulator-5558", "port": 4725, "system_port": 8202}]
+
+
+def allocator(tmp_path, **kwargs):
+    return DeviceAllocator(load_devices(SPEC), lock_dir=str(tmp_path), timeout=0.2, poll=0.02, **kwargs)
+
+
+def test_devices_from_config_spec():
+    devices = load_devices(SPEC)
+    assert devices[1] == Device("emulator-5556", 4724, 8201)
+    assert devices[1].server_url == "http://127.0.0.1:4724"
+    assert device("emulator-5558", devices).system_port == 8202
+    with pytest.raises(ValueError):
+        device("emulator-9999", devices)
+    assert capabilities("emulator-5556", 8201)["appium:systemPort"] == 8201
+    assert "appium:systemPort" not in capabilities("emulator-5556")
+
+
+def test_workers_map_to_distinct_devices(tmp_path):
+    assert worker_index("gw2") == 2 and worker_index(None) is None and worker_index("master") is None
+    workers = [allocator(tmp_path) for _ in range(3)]
+    leased = [w.acquire(f"gw{i}") for i, w in enumerate(workers)]
+    assert [d.udid for d in leased] == ["emulator-5554", "emulator-5556", "emulator-5558"]
+    assert len({(d.port, d.system_port) for d in leased}) == 3
+
+
+def test_busy_device_falls_back_then_times_out(tmp_path):
+    first, second = allocator(tmp_path), allocator(tmp_path)
+    assert first.acquire("gw0").udid == "emulator-5554"
+    assert second.acquire("gw3").udid == "emulator-5556"  # gw3 -> device 0, taken
+    assert first.acquire().udid == "emulator-5558"
+    with pytest.raises(TimeoutError):
+        allocator(tmp_path).acquire("gw1")
+    second.release_all()
+    assert allocator(tmp_path).acquire("gw1").udid == "emulator-5556"
+
+
+def test_lock_is_returned_when_worker_exits(tmp_path):
+    code = ("import sys; from inshorts_pom.devices import DeviceAllocator, load_devices; "
+            f"a = DeviceAllocator(load_devices({SPEC[:1]!r}), lock_dir=sys.argv[1]); print(a.acquire('gw0').udid)")
+    out = subprocess.run([sys.executable, "-c", code, str(tmp_path)], cwd=ROOT, capture_output=True, text=True,
+                         check=True)
+    assert out.stdout.strip() == "emulator-5554"
+    only = DeviceAllocator(load_devices(SPEC[:1]), lock_dir=str(tmp_path), timeout=0.2, poll=0.02)
+    assert only.acquire("gw0").udid == "emulator-5554"
@@ -0,0 +1,35 @@
+import pytest
+from inshorts_pom import screens
+from inshorts_pom.locators import ACCESSIBILITY_ID, ID, UIAUTOMATOR, XPATH, Locator, locate, qualify_id, snapshot_query
+
+
+def test_fastest_strategy_wins():
+    assert locate(resource_id="toolbar_back", desc="Back", text="Back") == Locator(ID, "com.nis.app:id/toolbar_back")
+    assert locate(desc="Back", text="Back") == Locator(ACCESSIBILITY_ID, "Back")
+    assert locate(text="Good News", xpath="//*[@text='Good News']") == Locator(UIAUTOMATOR, 'new UiSelector().text("Good News")')
+    assert locate(xpath="//android.widget.Button").by == XPATH
+    with pytest.raises(ValueError):
+        locate()
+
+
+def test_qualify_id():
+    assert qualify_id("news_title") == "com.nis.app:id/news_title"
+    assert qualify_id("android:id/content") == "android:id/content"
+
+
+def test_ui_selector_text_is_escaped_and_maps_back_to_snapshot_query():
+    locator = locate(text='Say "hi" \\ bye')
+    assert locator.value == r'new UiSelector().text("Say \"hi\" \\ bye")'
+    assert snapshot_query(locator) == {"text": 'Say "hi" \\ bye'}
+    assert snapshot_query(screens.NavBar.BACK) == {"content_desc": "Back"}
+    with pytest.raises(ValueError):
+        snapshot_query(locate(xpath="//*"))
+
+
+def test_registry_avoids_xpath_and_compiles_tabs_once():
+    registry = [value for cls in (screens.Launcher, screens.HomeScreen, screens.StoryScreen, screens.NavBar,
+                                  screens.SearchScreen) for value in vars(cls).values() if isinstance(value, Locator)]
+    assert registry and all(locator.by != XPATH for locator in registry)
+    by, value = screens.tab("Finance")
+    assert (by, value) == (UIAUTOMATOR, 'new UiSelector().text("Finance")')
+    assert screens.tab("Finance") is screens.tab("Finance")
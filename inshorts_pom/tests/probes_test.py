@@ -0,0 +1,96 @@
+import time
+from types import SimpleNamespace
+import pytest
+from inshorts_pom import config
+from inshorts_pom.probes import ProbeStats, click_if_present, find_present, implicit_wait, is_present, wait_for_element
+
+
+class FakeElement:
+    def __init__(self):
+        self.clicks = 0
+
+    def click(self):
+        self.clicks += 1
+
+
+class FakeDriver:
+    """find_elements honours the implicit wait the way a real session does when nothing matches."""
+
+    def __init__(self, present=(), appears_after=None):
+        self.elements = {value: FakeElement() for value in present}
+        self.appears_after = appears_after or {}
+        self.started = time.monotonic()
+        self.implicit_wait = config.IMPLICIT_WAIT
+        self.waits = []
+
+    @property
+    def timeouts(self):
+        return SimpleNamespace(implicit_wait=self.implicit_wait)
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+        self.waits.append(seconds)
+
+    def find_elements(self, by, value):
+        delay = self.appears_after.get(value)
+        if delay is not None and time.monotonic() - self.started >= delay:
+            self.elements.setdefault(value, FakeElement())
+        if value in self.elements:
+            return [self.elements[value]]
+        time.sleep(self.implicit_wait)
+        return []
+
+
+def test_missing_element_probe_skips_implicit_wait():
+    driver, stats = FakeDriver(), ProbeStats()
+    start = time.monotonic()
+    assert find_present(driver, "id", "story_number_1", stats=stats) is None
+    assert time.monotonic() - start < 0.5
+    assert driver.waits == [0, config.IMPLICIT_WAIT]
+    assert stats.misses == 1 and stats.saved > config.IMPLICIT_WAIT - 0.5
+
+
+def test_probe_restores_the_drivers_own_implicit_wait():
+    driver = FakeDriver()
+    driver.implicitly_wait(3)
+    with implicit_wait(driver, 0):
+        assert driver.implicit_wait == 0
+    assert driver.implicit_wait == 3
+    assert find_present(driver, "id", "toolbar_back", stats=ProbeStats()) is None
+    assert driver.implicit_wait == 3
+
+
+def test_present_element_is_returned_and_clicked():
+    driver, stats = FakeDriver(present=["Back"]), ProbeStats()
+    assert is_present(driver, "accessibility id", "Back", stats=stats)
+    assert click_if_present(driver, "accessibility id", "Back", stats=stats)
+    assert driver.elements["Back"].clicks == 1
+    assert not click_if_present(driver, "id", "toolbar_back", stats=stats)
+    assert (stats.probes, stats.misses) == (3, 1)
+    assert "3 run, 1 missed" in stats.summary()
+
+
+def test_probe_timeout_polls_for_late_element():
+    driver = FakeDriver(appears_after={"toolbar_back": 0.1})
+    assert find_present(driver, "id", "toolbar_back", timeout=1, poll=0.02, stats=ProbeStats()) is not None
+
+
+def test_wait_for_element_returns_when_it_appears_or_times_out():
+    driver = FakeDriver(appears_after={"home": 0.1})
+    start = time.monotonic()
+    assert wait_for_element(driver, "id", "home", timeout=2, poll=0.02) is driver.elements["home"]
+    assert time.monotonic() - start < 1
+    with pytest.raises(TimeoutError, match="search page"):
+        wait_for_element(driver, "id", "search", "search page", timeout=0.1, poll=0.02)
+    assert driver.implicit_wait == config.IMPLICIT_WAIT
+
+
+def test_worker_totals_merge_into_controller_stats():
+    controller, worker = ProbeStats(), ProbeStats()
+    worker.record(False, 0.05)
+    worker.record(True, 0.02)
+    controller.record(False, 0.01)
+    controller.merge(worker.to_dict())
+    assert (controller.probes, controller.misses) == (3, 2)
+    assert abs(controller.probe_time - 0.08) < 1e-9
+    assert abs(controller.saved - (2 * config.IMPLICIT_WAIT - 0.06)) < 1e-9
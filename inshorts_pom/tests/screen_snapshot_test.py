@@ -0,0 +1,79 @@
+import pytest
+from inshorts_pom.screen_snapshot import ScreenSnapshot
+from inshorts_pom.screens import NavBar, SearchScreen, tab
+
+# Trimmed UiAutomator2 page_source of the Inshorts search screen
+SEARCH_SCREEN = """<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>
+<hierarchy index="0" class="hierarchy" rotation="0" width="1080" height="2400">
+  <android.widget.FrameLayout index="0" package="com.nis.app" class="android.widget.FrameLayout" text="" resource-id="" content-desc="" bounds="[0,0][1080,2400]">
+    <android.widget.LinearLayout index="0" class="android.widget.LinearLayout" text="" resource-id="com.nis.app:id/action_bar_root" content-desc="" bounds="[0,0][1080,2400]">
+      <android.widget.TextView index="0" class="android.widget.TextView" text="Search for news" resource-id="com.nis.app:id/txt_search_suggestion" content-desc="" bounds="[120,160][900,240]" />
+      <android.widget.TextView index="1" class="android.widget.TextView" text="Notifications" resource-id="com.nis.app:id/notif_title" content-desc="" bounds="[40,300][500,360]" />
+      <android.widget.TextView index="2" class="android.widget.TextView" text="VIEW ALL" resource-id="com.nis.app:id/notif_view_all" content-desc="" bounds="[860,300][1040,360]" />
+      <android.widget.TextView index="3" class="android.widget.TextView" text="Insights" resource-id="com.nis.app:id/insights_title" content-desc="" bounds="[40,900][500,960]" />
+      <android.widget.TextView index="4" class="android.widget.TextView" text="VIEW ALL" resource-id="com.nis.app:id/insights_view_all" content-desc="" bounds="[860,900][1040,960]" />
+      <android.widget.ImageView index="5" class="android.widget.ImageView" text="" resource-id="" content-desc="Back" bounds="[0,60][120,150]" />
+      <android.widget.TextView index="6" class="android.widget.TextView" text="Good News" resource-id="" content-desc="" bounds="[600,2300][800,2380]" />
+    </android.widget.LinearLayout>
+  </android.widget.FrameLayout>
+</hierarchy>"""
+
+
+class FakeDriver:
+    def __init__(self):
+        self.page_source_calls = 0
+        self.finds = []
+
+    @property
+    def page_source(self):
+        self.page_source_calls += 1
+        return SEARCH_SCREEN
+
+    def find_element(self, by, value):
+        self.finds.append((by, value))
+        return self
+
+    def click(self):
+        pass
+
+
+def test_reads_come_from_one_page_source():
+    driver = FakeDriver()
+    screen = ScreenSnapshot.capture(driver)
+    assert screen.text(resource_id="com.nis.app:id/txt_search_suggestion") == "Search for news"
+    assert screen.texts("notif_title", "insights_title", "news_title") == {
+        "notif_title": "Notifications", "insights_title": "Insights", "news_title": None}
+    assert screen.exists(content_desc="Back")
+    assert not screen.exists(resource_id="story_number_1")
+    assert driver.page_source_calls == 1 and driver.finds == []
+
+
+def test_lookup_by_index_keys():
+    screen = ScreenSnapshot.from_xml(SEARCH_SCREEN)
+    assert len(screen) == 10
+    assert len(screen.find_all(text="VIEW ALL")) == 2
+    view_all = screen.find(text="VIEW ALL", resource_id="insights_view_all")
+    assert screen.node(view_all)["class_name"] == "android.widget.TextView"
+    assert screen.bounds(view_all) == (860, 900, 1040, 960)
+    assert screen.node(screen.node(view_all)["parent"])["resource_id"] == "com.nis.app:id/action_bar_root"
+    with pytest.raises(LookupError):
+        screen.find(resource_id="toolbar_back")
+    with pytest.raises(ValueError):
+        screen.find(bounds="[0,0][1,1]")
+
+
+def test_lookup_by_registry_locators():
+    screen = ScreenSnapshot.from_xml(SEARCH_SCREEN)
+    assert screen.text(SearchScreen.NOTIF_VIEW_ALL) == "VIEW ALL"
+    assert screen.exists(NavBar.BACK) and screen.exists(tab("Good News"))
+    assert screen.texts(SearchScreen.INSIGHTS_TITLE)[SearchScreen.INSIGHTS_TITLE] == "Insights"
+
+
+def test_tap_resolves_one_handle_by_cheapest_locator():
+    driver = FakeDriver()
+    screen = ScreenSnapshot.capture(driver)
+    screen.tap(driver, resource_id="notif_view_all")
+    screen.tap(driver, content_desc="Back")
+    screen.tap(driver, text="Good News")
+    assert driver.finds == [("id", "com.nis.app:id/notif_view_all"), ("accessibility id", "Back"),
+                            ("-android uiautomator", 'new UiSelector().text("Good News")')]
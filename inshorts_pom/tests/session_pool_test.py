@@ -0,0 +1,133 @@
+import threading
+import time
+import pytest
+from inshorts_pom.session_pool import AppiumSessionPool, capabilities
+
+
+class FakeDriver:
+    def __init__(self, udid):
+        self.udid = udid
+        self.session_id = f"session-{udid}"
+        self.calls = []
+        self.alive = True
+
+    @property
+    def current_package(self):
+        if not self.alive:
+            raise RuntimeError("session gone")
+        return "com.nis.app"
+
+    def terminate_app(self, package):
+        self.calls.append(("terminate", package))
+
+    def activate_app(self, package):
+        self.calls.append(("activate", package))
+
+    def quit(self):
+        self.calls.append(("quit",))
+        self.session_id = None
+
+
+def make_pool(udids=("emulator-5554",), **kwargs):
+    created = []
+
+    def factory(udid):
+        driver = FakeDriver(udid)
+        created.append(driver)
+        return driver
+
+    return AppiumSessionPool(udids, factory=factory, lease_timeout=5, **kwargs), created
+
+
+def test_capabilities_target_the_device():
+    caps = capabilities("emulator-5556", **{"appium:noReset": False})
+    assert caps["appium:udid"] == "emulator-5556"
+    assert caps["appium:noReset"] is False
+
+
+def test_session_is_reused_and_app_reset_between_leases():
+    pool, created = make_pool()
+    for _ in range(3):
+        with pool.lease() as driver:
+            assert driver is created[0]
+    assert len(created) == 1
+    assert created[0].calls.count(("terminate", "com.nis.app")) == 3
+    assert created[0].calls.count(("activate", "com.nis.app")) == 3
+    stats = pool.stats()
+    assert stats["leases"] == 3 and stats["reused"] == 2 and stats["created"] == 1
+
+
+def test_dead_session_is_recreated():
+    pool, created = make_pool()
+    with pytest.raises(RuntimeError):
+        with pool.lease() as driver:
+            driver.alive = False
+            raise RuntimeError("element not found")
+    assert ("quit",) in created[0].calls
+    with pool.lease() as driver:
+        assert driver is created[1]
+    assert pool.stats()["recycled"] == 1
+
+
+def test_failed_test_on_healthy_session_keeps_it():
+    pool, created = make_pool()
+    with pytest.raises(AssertionError):
+        with pool.lease():
+            raise AssertionError("wrong headline")
+    with pool.lease() as driver:
+        assert driver is created[0]
+
+
+def test_session_recycled_after_max_uses():
+    pool, created = make_pool(max_uses=2)
+    for _ in range(3):
+        with pool.lease():
+            pass
+    assert len(created) == 2
+    assert ("quit",) in created[0].calls
+
+
+def test_devices_are_leased_exclusively_in_parallel():
+    pool, created = make_pool(("emulator-5554", "emulator-5556"))
+    holders = {}
+    overlap = []
+    lock = threading.Lock()
+
+    def worker():
+        with pool.lease() as driver:
+            with lock:
+                if driver.udid in holders:
+                    overlap.append(driver.udid)
+                holders[driver.udid] = threading.get_ident()
+            time.sleep(0.02)
+            with lock:
+                del holders[driver.udid]
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not overlap
+    assert len(created) == 2
+    assert pool.stats()["leases"] == 8
+
+
+def test_acquire_times_out_when_all_devices_busy():
+    pool, _ = make_pool()
+    udid, _ = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+    pool.release(udid)
+    with pytest.raises(ValueError):
+        pool.acquire("emulator-9999")
+
+
+def test_close_quits_every_session():
+    pool, created = make_pool(("emulator-5554", "emulator-5556"))
+    a, _ = pool.acquire()
+    b, _ = pool.acquire()
+    pool.release(a)
+    pool.release(b)
+    pool.close()
+    assert all(("quit",) in d.calls for d in created)